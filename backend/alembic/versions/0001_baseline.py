@@ -0,0 +1,97 @@
+"""Baseline schema
+
+The schema as ``Base.metadata.create_all`` built it before migrations were
+introduced. Databases created that way are stamped at this revision on
+startup (see ``src.db.migrations``) instead of being recreated.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-19
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "0001"
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _base_columns() -> list:
+    return [
+        sa.Column("id", sa.String(36), primary_key=True, nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+    ]
+
+
+def upgrade() -> None:
+    op.create_table(
+        "collections",
+        sa.Column("name", sa.String(255), nullable=False),
+        sa.Column("description", sa.Text(), nullable=True),
+        sa.Column("total_photos", sa.Integer(), nullable=False),
+        *_base_columns(),
+    )
+    op.create_index("ix_collections_name", "collections", ["name"])
+
+    op.create_table(
+        "gps_locations",
+        sa.Column("latitude", sa.Float(), nullable=False),
+        sa.Column("longitude", sa.Float(), nullable=False),
+        sa.Column("altitude", sa.Float(), nullable=True),
+        sa.Column("uncertainty_radius", sa.Float(), nullable=True),
+        *_base_columns(),
+    )
+    op.create_index("ix_gps_locations_latitude", "gps_locations", ["latitude"])
+    op.create_index("ix_gps_locations_longitude", "gps_locations", ["longitude"])
+
+    op.create_table(
+        "photo_markers",
+        sa.Column("location_id", sa.String(36), sa.ForeignKey("gps_locations.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("photos_count", sa.Integer(), nullable=False),
+        sa.Column("is_clustered", sa.Boolean(), nullable=False),
+        sa.Column("visible", sa.Boolean(), nullable=False),
+        *_base_columns(),
+    )
+
+    op.create_table(
+        "photos",
+        sa.Column("filename", sa.String(255), nullable=False),
+        sa.Column("file_path", sa.String(1024), nullable=False, unique=True),
+        sa.Column("file_hash", sa.String(64), nullable=False),
+        sa.Column("timestamp", sa.DateTime(), nullable=False),
+        sa.Column("file_size", sa.Integer(), nullable=False),
+        sa.Column("format", sa.String(10), nullable=False),
+        sa.Column("collection_id", sa.String(36), sa.ForeignKey("collections.id", ondelete="CASCADE"), nullable=False),
+        *_base_columns(),
+    )
+    op.create_index("ix_photos_filename", "photos", ["filename"])
+    op.create_index("ix_photos_file_hash", "photos", ["file_hash"])
+    op.create_index("ix_photos_timestamp", "photos", ["timestamp"])
+
+    op.create_table(
+        "photo_metadata",
+        sa.Column("latitude", sa.Float(), nullable=False),
+        sa.Column("longitude", sa.Float(), nullable=False),
+        sa.Column("altitude", sa.Float(), nullable=True),
+        sa.Column("camera_model", sa.String(255), nullable=True),
+        sa.Column("iso", sa.Integer(), nullable=True),
+        sa.Column("shutter_speed", sa.String(50), nullable=True),
+        sa.Column("aperture", sa.String(50), nullable=True),
+        sa.Column(
+            "photo_id", sa.String(36), sa.ForeignKey("photos.id", ondelete="CASCADE"), nullable=False, unique=True
+        ),
+        *_base_columns(),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("photo_metadata")
+    op.drop_table("photos")
+    op.drop_table("photo_markers")
+    op.drop_table("gps_locations")
+    op.drop_table("collections")
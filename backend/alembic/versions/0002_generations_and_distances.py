@@ -0,0 +1,84 @@
+"""Data generations, cumulative flight distances and keyset indexes
+
+Schema added after the baseline but before migrations were introduced:
+
+- ``data_generations``, the counters that invalidate derived caches.
+- ``photo_metadata.cumulative_distance``, the along-track distance of each
+  photo from the start of its collection's flight, backfilled for existing
+  photos in one set-based UPDATE: a window over each collection in capture
+  order measures every leg (haversine, as ``src.utils.gps``) and sums them.
+- ``(created_at, id)`` and ``(timestamp, id)`` indexes for keyset
+  pagination of collections and photos.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-19
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "0002"
+down_revision: Union[str, None] = "0001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+EARTH_RADIUS_METERS = 6371000
+
+
+def _haversine(lat1: str, lon1: str, lat2: str, lon2: str) -> str:
+    """Great-circle distance in meters between two points, as SQL."""
+    return (
+        f"2 * {EARTH_RADIUS_METERS} * ASIN(SQRT("
+        f"POWER(SIN(RADIANS({lat2} - {lat1}) / 2), 2) + "
+        f"COS(RADIANS({lat1})) * COS(RADIANS({lat2})) * POWER(SIN(RADIANS({lon2} - {lon1}) / 2), 2)))"
+    )
+
+
+def upgrade() -> None:
+    op.create_table(
+        "data_generations",
+        sa.Column("scope", sa.String(64), nullable=False, unique=True),
+        sa.Column("generation", sa.Integer(), nullable=False),
+        sa.Column("id", sa.String(36), primary_key=True, nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+    )
+    op.add_column("photo_metadata", sa.Column("cumulative_distance", sa.Float(), nullable=False, server_default="0"))
+
+    bind = op.get_bind()
+    if bind.dialect.name == "sqlite":
+        from src.db.sqlite import install_math_functions
+
+        install_math_functions(bind.connection.dbapi_connection)
+    # Photos without metadata are not part of the track
+    leg = _haversine("prev_lat", "prev_lon", "latitude", "longitude")
+    op.execute(
+        f"""
+        UPDATE photo_metadata SET cumulative_distance = track.distance
+        FROM (
+            SELECT id, COALESCE(SUM({leg}) OVER (PARTITION BY collection_id ORDER BY timestamp, photo_id), 0)
+                AS distance
+            FROM (
+                SELECT m.id, p.collection_id, p.timestamp, p.id AS photo_id, m.latitude, m.longitude,
+                    LAG(m.latitude) OVER w AS prev_lat, LAG(m.longitude) OVER w AS prev_lon
+                FROM photo_metadata m JOIN photos p ON m.photo_id = p.id
+                WINDOW w AS (PARTITION BY p.collection_id ORDER BY p.timestamp, p.id)
+            ) AS points
+        ) AS track
+        WHERE photo_metadata.id = track.id
+    """
+    )
+
+    op.create_index("ix_collections_created_at_id", "collections", ["created_at", "id"])
+    op.create_index("ix_photos_timestamp_id", "photos", ["timestamp", "id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_photos_timestamp_id", table_name="photos")
+    op.drop_index("ix_collections_created_at_id", table_name="collections")
+    with op.batch_alter_table("photo_metadata") as batch:
+        batch.drop_column("cumulative_distance")
+    op.drop_table("data_generations")
@@ -0,0 +1,39 @@
+"""Indexes for the hot API queries
+
+Derived from ``EXPLAIN QUERY PLAN`` of the queries behind ``api/v1``
+(checked by ``tests/integration/test_query_plans.py``):
+
+- ``GET /photos?collection_id=`` and the flight series/distance lookups
+  filter on ``collection_id`` and order by ``(timestamp, id)``, which was a
+  full scan plus a temp B-tree sort; ``(collection_id, timestamp, id)``
+  delivers rows in order.
+- Bounds filters (``/photos/filter``, exports, totals) range over
+  ``photo_metadata.latitude``/``longitude``, which was a full scan.
+- ``ix_photos_timestamp`` is a prefix of ``ix_photos_timestamp_id`` and
+  only cost writes.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-19
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = "0003"
+down_revision: Union[str, None] = "0002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_photos_collection_timestamp_id", "photos", ["collection_id", "timestamp", "id"])
+    op.drop_index("ix_photos_timestamp", table_name="photos")
+    op.create_index("ix_photo_metadata_lat_lon", "photo_metadata", ["latitude", "longitude"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_photo_metadata_lat_lon", table_name="photo_metadata")
+    op.create_index("ix_photos_timestamp", "photos", ["timestamp"])
+    op.drop_index("ix_photos_collection_timestamp_id", table_name="photos")
@@ -0,0 +1,38 @@
+"""PostGIS geography column for photo locations
+
+On PostgreSQL, adds ``photo_metadata.location``, a ``geography(Point,
+4326)`` generated from latitude/longitude, with a GiST index. Spatial
+filters compile to PostGIS operators over it (``src.db.spatial``). No-op
+on other databases.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-19
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = "0004"
+down_revision: Union[str, None] = "0003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    op.execute("CREATE EXTENSION IF NOT EXISTS postgis")
+    op.execute(
+        "ALTER TABLE photo_metadata ADD COLUMN location geography(Point, 4326) "
+        "GENERATED ALWAYS AS (ST_SetSRID(ST_MakePoint(longitude, latitude), 4326)::geography) STORED"
+    )
+    op.execute("CREATE INDEX ix_photo_metadata_location ON photo_metadata USING GIST (location)")
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    op.execute("DROP INDEX IF EXISTS ix_photo_metadata_location")
+    op.execute("ALTER TABLE photo_metadata DROP COLUMN IF EXISTS location")
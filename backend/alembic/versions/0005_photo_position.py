@@ -0,0 +1,75 @@
+"""Photo position columns and covering indexes
+
+Copies latitude/longitude/altitude from photo_metadata onto photos so map,
+filter and flight-stats reads need no join, and widens the capture-order
+indexes to cover them:
+
+- ``ix_photos_track`` (timestamp, id, position) replaces
+  ``ix_photos_timestamp_id``.
+- ``ix_photos_collection_track`` (collection_id, timestamp, id, position)
+  replaces ``ix_photos_collection_timestamp_id``.
+- Bounds filters move from ``ix_photo_metadata_lat_lon`` to
+  ``ix_photos_lat_lon``.
+- On PostgreSQL the PostGIS location column and its GiST index move from
+  photo_metadata to photos.
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-19
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "0005"
+down_revision: Union[str, None] = "0004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+POSITION = ("latitude", "longitude", "altitude")
+
+
+def upgrade() -> None:
+    for name in POSITION:
+        op.add_column("photos", sa.Column(name, sa.Float(), nullable=True))
+    copies = [f"{name} = (SELECT m.{name} FROM photo_metadata m WHERE m.photo_id = photos.id)" for name in POSITION]
+    op.execute("UPDATE photos SET " + ", ".join(copies))
+
+    op.create_index("ix_photos_track", "photos", ["timestamp", "id", *POSITION])
+    op.create_index("ix_photos_collection_track", "photos", ["collection_id", "timestamp", "id", *POSITION])
+    op.create_index("ix_photos_lat_lon", "photos", ["latitude", "longitude"])
+    op.drop_index("ix_photos_timestamp_id", table_name="photos")
+    op.drop_index("ix_photos_collection_timestamp_id", table_name="photos")
+    op.drop_index("ix_photo_metadata_lat_lon", table_name="photo_metadata")
+
+    if op.get_bind().dialect.name == "postgresql":
+        op.execute("DROP INDEX IF EXISTS ix_photo_metadata_location")
+        op.execute("ALTER TABLE photo_metadata DROP COLUMN IF EXISTS location")
+        op.execute(
+            "ALTER TABLE photos ADD COLUMN location geography(Point, 4326) "
+            "GENERATED ALWAYS AS (ST_SetSRID(ST_MakePoint(longitude, latitude), 4326)::geography) STORED"
+        )
+        op.execute("CREATE INDEX ix_photos_location ON photos USING GIST (location)")
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == "postgresql":
+        op.execute("DROP INDEX IF EXISTS ix_photos_location")
+        op.execute("ALTER TABLE photos DROP COLUMN IF EXISTS location")
+        op.execute(
+            "ALTER TABLE photo_metadata ADD COLUMN location geography(Point, 4326) "
+            "GENERATED ALWAYS AS (ST_SetSRID(ST_MakePoint(longitude, latitude), 4326)::geography) STORED"
+        )
+        op.execute("CREATE INDEX ix_photo_metadata_location ON photo_metadata USING GIST (location)")
+
+    op.create_index("ix_photo_metadata_lat_lon", "photo_metadata", ["latitude", "longitude"])
+    op.create_index("ix_photos_collection_timestamp_id", "photos", ["collection_id", "timestamp", "id"])
+    op.create_index("ix_photos_timestamp_id", "photos", ["timestamp", "id"])
+    op.drop_index("ix_photos_lat_lon", table_name="photos")
+    op.drop_index("ix_photos_collection_track", table_name="photos")
+    op.drop_index("ix_photos_track", table_name="photos")
+    with op.batch_alter_table("photos") as batch:
+        for name in POSITION:
+            batch.drop_column(name)
@@ -0,0 +1,82 @@
+"""Collection summary columns
+
+Adds the per-collection summary (bounds, capture span, camera models and
+total distance) next to ``total_photos`` and backfills it, recounting
+``total_photos`` too. From here on the importer maintains it incrementally.
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-19
+"""
+import json
+from collections import defaultdict
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "0006"
+down_revision: Union[str, None] = "0005"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+COLUMNS = (
+    ("min_latitude", sa.Float()),
+    ("max_latitude", sa.Float()),
+    ("min_longitude", sa.Float()),
+    ("max_longitude", sa.Float()),
+    ("first_captured_at", sa.DateTime()),
+    ("last_captured_at", sa.DateTime()),
+)
+
+
+def upgrade() -> None:
+    for name, type_ in COLUMNS:
+        op.add_column("collections", sa.Column(name, type_, nullable=True))
+    op.add_column("collections", sa.Column("camera_models", sa.JSON(), nullable=False, server_default="[]"))
+    op.add_column("collections", sa.Column("total_distance_meters", sa.Float(), nullable=False, server_default="0"))
+
+    aggregates = {
+        "total_photos": "COUNT(*)",
+        "min_latitude": "MIN(latitude)",
+        "max_latitude": "MAX(latitude)",
+        "min_longitude": "MIN(longitude)",
+        "max_longitude": "MAX(longitude)",
+        "first_captured_at": "MIN(timestamp)",
+        "last_captured_at": "MAX(timestamp)",
+    }
+    op.execute(
+        "UPDATE collections SET "
+        + ", ".join(
+            f"{name} = (SELECT {aggregate} FROM photos p WHERE p.collection_id = collections.id)"
+            for name, aggregate in aggregates.items()
+        )
+        + ", total_distance_meters = COALESCE((SELECT MAX(m.cumulative_distance) FROM photo_metadata m "
+        "JOIN photos p ON m.photo_id = p.id WHERE p.collection_id = collections.id), 0)"
+    )
+
+    # JSON aggregation differs per backend; collect the camera lists here
+    bind = op.get_bind()
+    cameras = defaultdict(list)
+    for collection_id, camera_model in bind.execute(
+        sa.text(
+            "SELECT DISTINCT p.collection_id, m.camera_model FROM photo_metadata m "
+            "JOIN photos p ON m.photo_id = p.id WHERE m.camera_model IS NOT NULL "
+            "ORDER BY p.collection_id, m.camera_model"
+        )
+    ):
+        cameras[collection_id].append(camera_model)
+    for collection_id, models in cameras.items():
+        bind.execute(
+            sa.text("UPDATE collections SET camera_models = :models WHERE id = :id"),
+            {"models": json.dumps(models), "id": collection_id},
+        )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("collections") as batch:
+        batch.drop_column("total_distance_meters")
+        batch.drop_column("camera_models")
+        for name, _ in reversed(COLUMNS):
+            batch.drop_column(name)
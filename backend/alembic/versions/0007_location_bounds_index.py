@@ -0,0 +1,33 @@
+"""Planar GiST index for PostGIS bounds filters
+
+On PostgreSQL, adds ``ix_photos_location_bounds``, a GiST index on
+``location::geometry``. Bounds filters test the lat/lon box with ``&&`` on
+geometry, whose edges are straight in lat/lon; on geography they are
+great-circle arcs and the index dropped points near the box's equatorward
+edge. No-op on other databases.
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-19
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = "0007"
+down_revision: Union[str, None] = "0006"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    op.execute("CREATE INDEX IF NOT EXISTS ix_photos_location_bounds ON photos USING GIST ((location::geometry))")
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    op.execute("DROP INDEX IF EXISTS ix_photos_location_bounds")
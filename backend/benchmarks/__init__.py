@@ -0,0 +1 @@
+"""Micro-benchmarks for hot backend paths (run with ``python -m benchmarks.<name>``)."""
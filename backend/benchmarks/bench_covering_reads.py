@@ -0,0 +1,154 @@
+"""Benchmark map and flight-stats reads with and without the photo position copy.
+
+``join`` reads positions the way the endpoints did before the position
+columns moved onto ``photos``: joining ``photo_metadata`` per photo.
+``covering`` reads ``photos.latitude``/``longitude`` through the
+capture-order indexes, which hold every column the query needs, so SQLite
+never touches either table. Each query's plan is printed with its timings.
+
+Usage (from backend/):
+    python -m benchmarks.bench_covering_reads --photos 50000 --collections 10
+"""
+import argparse
+import asyncio
+import random
+import statistics
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict
+from uuid import uuid4
+
+from sqlalchemy import insert, select, text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
+
+from src.config import Settings
+from src.db.sqlite import install_pragmas, sqlite_pragmas
+from src.models.base import Base
+from src.models.collection import Collection
+from src.models.photo import Photo, PhotoMetadata
+from src.services.photo_service import PHOTO_SORT_KEY, PhotoService, parse_fields
+from src.utils.pagination import keyset_query
+
+PAGE_SIZE = 1000
+SEED_BATCH = 5000
+
+
+async def seed(engine: AsyncEngine, count: int, collections: int) -> str:
+    now = datetime.utcnow()
+    collection_ids = [str(uuid4()) for _ in range(collections)]
+    rng = random.Random(0)
+    async with AsyncSession(engine) as session:
+        await session.execute(
+            insert(Collection),
+            [dict(id=cid, name=f"bench-{i}", created_at=now, updated_at=now) for i, cid in enumerate(collection_ids)],
+        )
+        for start in range(0, count, SEED_BATCH):
+            photos, metadata = [], []
+            for i in range(start, min(start + SEED_BATCH, count)):
+                lat, lon, alt = 46.0 + rng.random() / 100, 23.0 + rng.random() / 100, 80.0 + rng.random() * 40
+                photo_id = str(uuid4())
+                photos.append(
+                    dict(
+                        id=photo_id,
+                        filename=f"DJI_{i:06d}.JPG",
+                        file_path=f"/bench/DJI_{i:06d}.JPG",
+                        file_hash=f"{i:064x}",
+                        timestamp=now + timedelta(seconds=2 * i),
+                        file_size=8_000_000,
+                        format="jpg",
+                        collection_id=collection_ids[i % collections],
+                        latitude=lat,
+                        longitude=lon,
+                        altitude=alt,
+                        created_at=now,
+                        updated_at=now,
+                    )
+                )
+                metadata.append(
+                    dict(
+                        id=str(uuid4()),
+                        photo_id=photo_id,
+                        latitude=lat,
+                        longitude=lon,
+                        altitude=alt,
+                        camera_model="FC3170",
+                        iso=100,
+                        created_at=now,
+                        updated_at=now,
+                    )
+                )
+            await session.execute(insert(Photo), photos)
+            await session.execute(insert(PhotoMetadata), metadata)
+        await session.commit()
+        await session.execute(text("ANALYZE"))
+    return collection_ids[0]
+
+
+def queries(collection_id: str) -> Dict[str, Dict[str, Any]]:
+    in_collection = Photo.collection_id == collection_id
+    joined = select(Photo.id, Photo.timestamp, PhotoMetadata.latitude, PhotoMetadata.longitude).outerjoin(
+        PhotoMetadata, PhotoMetadata.photo_id == Photo.id
+    )
+    return {
+        "map page": {
+            "join": keyset_query(joined.where(in_collection), PHOTO_SORT_KEY, None, PAGE_SIZE),
+            "covering": keyset_query(
+                PhotoService.rows_query(in_collection, projection=parse_fields("latitude,longitude")),
+                PHOTO_SORT_KEY,
+                None,
+                PAGE_SIZE,
+            ),
+        },
+        "flight stats": {
+            "join": joined.with_only_columns(Photo.timestamp, PhotoMetadata.latitude, PhotoMetadata.longitude)
+            .where(in_collection)
+            .order_by(*PHOTO_SORT_KEY),
+            "covering": select(Photo.timestamp, Photo.latitude, Photo.longitude)
+            .where(in_collection)
+            .order_by(*PHOTO_SORT_KEY),
+        },
+    }
+
+
+async def measure(engine: AsyncEngine, query, repeat: int) -> float:
+    samples = []
+    async with engine.connect() as conn:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            (await conn.execute(query)).all()
+            samples.append(time.perf_counter() - start)
+    return statistics.median(samples)
+
+
+async def explain(engine: AsyncEngine, query) -> str:
+    async with engine.connect() as conn:
+        sql = str(query.compile(engine, compile_kwargs={"literal_binds": True}))
+        return "; ".join(row[3] for row in await conn.execute(text(f"EXPLAIN QUERY PLAN {sql}")))
+
+
+async def main(count: int, collections: int, repeat: int) -> None:
+    print(f"{count} photos in {collections} collections, median of {repeat} runs")
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_async_engine(f"sqlite+aiosqlite:///{Path(tmp) / 'bench.db'}")
+        install_pragmas(engine, sqlite_pragmas(Settings()))
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        collection_id = await seed(engine, count, collections)
+
+        for name, variants in queries(collection_id).items():
+            print(name)
+            for variant, query in variants.items():
+                elapsed = await measure(engine, query, repeat)
+                print(f"  {variant:9s} {elapsed * 1000:8.2f} ms  {await explain(engine, query)}")
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--photos", type=int, default=50_000)
+    parser.add_argument("--collections", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+    asyncio.run(main(args.photos, args.collections, args.repeat))
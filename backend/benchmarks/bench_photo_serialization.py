@@ -0,0 +1,134 @@
+"""Benchmark the validated and trusted photo list response paths.
+
+Validated: load Photo ORM objects with ``selectinload(metadata_)``, build
+``APIResponse[List[PhotoResponse]]`` and serialize it with the stdlib json
+encoder, as the list endpoints did before. Trusted: select the response
+columns with ``PhotoService`` and serialize the dicts with orjson. Sparse:
+the trusted path with the map's ``fields=latitude,longitude`` fieldset.
+
+Usage (from backend/):
+    python -m benchmarks.bench_photo_serialization --photos 10000 --repeat 5
+"""
+import argparse
+import asyncio
+import json
+import statistics
+import time
+from datetime import datetime, timedelta
+from typing import List
+from uuid import uuid4
+
+import orjson
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import selectinload
+
+from src.models.base import Base
+from src.models.collection import Collection
+from src.models.photo import Photo, PhotoMetadata
+from src.schemas.base import APIResponse
+from src.schemas.photo import PhotoResponse
+from src.services.photo_service import PhotoService, parse_fields
+
+
+async def seed(session: AsyncSession, count: int) -> None:
+    now = datetime.utcnow()
+    collection_id = str(uuid4())
+    await session.execute(
+        insert(Collection).values(id=collection_id, name="bench", total_photos=count, created_at=now, updated_at=now)
+    )
+    photos, metadata = [], []
+    for i in range(count):
+        photo_id = str(uuid4())
+        photos.append(
+            dict(
+                id=photo_id,
+                filename=f"DJI_{i:05d}.JPG",
+                file_path=f"/bench/DJI_{i:05d}.JPG",
+                file_hash=f"{i:064x}",
+                timestamp=now + timedelta(seconds=2 * i),
+                file_size=8_000_000,
+                format="jpg",
+                collection_id=collection_id,
+                created_at=now,
+                updated_at=now,
+            )
+        )
+        metadata.append(
+            dict(
+                id=str(uuid4()),
+                photo_id=photo_id,
+                latitude=46.0 + i * 1e-5,
+                longitude=23.0 + i * 1e-5,
+                altitude=120.0,
+                camera_model="FC3170",
+                iso=100,
+                shutter_speed="1/500",
+                aperture="2.8",
+                cumulative_distance=i * 1.5,
+                created_at=now,
+                updated_at=now,
+            )
+        )
+    await session.execute(insert(Photo), photos)
+    await session.execute(insert(PhotoMetadata), metadata)
+    await session.commit()
+
+
+async def validated_path(session: AsyncSession) -> bytes:
+    result = await session.execute(select(Photo).options(selectinload(Photo.metadata_)))
+    photos = result.scalars().all()
+    response = APIResponse[List[PhotoResponse]](data=photos)
+    return json.dumps(response.model_dump(mode="json", by_alias=True)).encode("utf-8")
+
+
+async def trusted_path(session: AsyncSession) -> bytes:
+    service = PhotoService(session)
+    data = await service.fetch_dicts(service.rows_query())
+    return orjson.dumps({"success": True, "data": data, "error": None, "message": "Success"})
+
+
+async def sparse_path(session: AsyncSession) -> bytes:
+    service = PhotoService(session)
+    projection = parse_fields("latitude,longitude")
+    data = await service.fetch_dicts(service.rows_query(projection=projection), projection)
+    return orjson.dumps({"success": True, "data": data, "error": None, "message": "Success"})
+
+
+async def timed(session: AsyncSession, path, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        session.expunge_all()
+        start = time.perf_counter()
+        await path(session)
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples)
+
+
+async def main(count: int, repeat: int) -> None:
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        await seed(session, count)
+        assert orjson.loads(await trusted_path(session)) == json.loads(await validated_path(session))
+
+        validated = await timed(session, validated_path, repeat)
+        trusted = await timed(session, trusted_path, repeat)
+        sparse = await timed(session, sparse_path, repeat)
+
+    await engine.dispose()
+    print(f"{count} photos, median of {repeat} runs")
+    print(f"  validated (ORM + Pydantic + json): {validated * 1000:8.1f} ms")
+    print(f"  trusted (Core rows + orjson):      {trusted * 1000:8.1f} ms")
+    print(f"  sparse (id,timestamp,lat,lon):     {sparse * 1000:8.1f} ms")
+    print(f"  speedup: {validated / trusted:.1f}x trusted, {validated / sparse:.1f}x sparse")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--photos", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    asyncio.run(main(args.photos, args.repeat))
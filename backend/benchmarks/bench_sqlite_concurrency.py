@@ -0,0 +1,131 @@
+"""Benchmark read latency under concurrent import load, per SQLite profile.
+
+An importer task commits small batches of photos (as the photo processor
+commits per photo) while reader tasks page through ``GET /photos``-style
+keyset queries. Each profile runs against a fresh on-disk database:
+``default`` uses SQLite's own defaults (rollback journal, synchronous=FULL),
+``tuned`` applies the ``Settings`` profile (WAL, synchronous=NORMAL, page
+cache, mmap).
+
+Usage (from backend/):
+    python -m benchmarks.bench_sqlite_concurrency --photos 20000 --readers 4 --seconds 5
+"""
+import argparse
+import asyncio
+import statistics
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, List
+from uuid import uuid4
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
+
+from src.config import Settings
+from src.db.sqlite import install_pragmas, sqlite_pragmas
+from src.models.base import Base
+from src.models.collection import Collection
+from src.models.photo import Photo, PhotoMetadata
+from src.services.photo_service import PHOTO_SORT_KEY, PhotoService
+from src.utils.pagination import keyset_query
+
+IMPORT_BATCH = 20
+
+
+def photo_rows(collection_id: str, start: int, count: int) -> List[Dict[str, Any]]:
+    now = datetime.utcnow()
+    return [
+        dict(
+            id=str(uuid4()),
+            filename=f"DJI_{i:06d}.JPG",
+            file_path=f"/bench/DJI_{i:06d}.JPG",
+            file_hash=f"{i:064x}",
+            timestamp=now + timedelta(seconds=2 * i),
+            file_size=8_000_000,
+            format="jpg",
+            collection_id=collection_id,
+            created_at=now,
+            updated_at=now,
+        )
+        for i in range(start, start + count)
+    ]
+
+
+async def seed(engine: AsyncEngine, count: int) -> str:
+    now = datetime.utcnow()
+    collection_id = str(uuid4())
+    async with AsyncSession(engine) as session:
+        await session.execute(insert(Collection).values(id=collection_id, name="bench", created_at=now, updated_at=now))
+        photos = photo_rows(collection_id, 0, count)
+        await session.execute(insert(Photo), photos)
+        await session.execute(
+            insert(PhotoMetadata),
+            [
+                dict(id=str(uuid4()), photo_id=p["id"], latitude=46.0, longitude=23.0, created_at=now, updated_at=now)
+                for p in photos
+            ],
+        )
+        await session.commit()
+    return collection_id
+
+
+async def importer(engine: AsyncEngine, collection_id: str, start: int, deadline: float) -> int:
+    imported = 0
+    while time.perf_counter() < deadline:
+        async with AsyncSession(engine) as session:
+            await session.execute(insert(Photo), photo_rows(collection_id, start + imported, IMPORT_BATCH))
+            await session.commit()
+        imported += IMPORT_BATCH
+    return imported
+
+
+async def reader(engine: AsyncEngine, collection_id: str, deadline: float) -> List[float]:
+    samples = []
+    while time.perf_counter() < deadline:
+        async with AsyncSession(engine) as session:
+            service = PhotoService(session)
+            query = keyset_query(service.rows_query(Photo.collection_id == collection_id), PHOTO_SORT_KEY, None, 100)
+            start = time.perf_counter()
+            await service.fetch_dicts(query)
+            samples.append(time.perf_counter() - start)
+    return samples
+
+
+async def run_profile(name: str, pragmas: Dict[str, Any], count: int, readers: int, seconds: float) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_async_engine(f"sqlite+aiosqlite:///{Path(tmp) / 'bench.db'}")
+        install_pragmas(engine, pragmas)
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        collection_id = await seed(engine, count)
+
+        deadline = time.perf_counter() + seconds
+        imported, *latencies = await asyncio.gather(
+            importer(engine, collection_id, count, deadline),
+            *(reader(engine, collection_id, deadline) for _ in range(readers)),
+        )
+        await engine.dispose()
+
+    samples = sorted(s for reader_samples in latencies for s in reader_samples)
+    p95 = samples[int(len(samples) * 0.95)]
+    print(
+        f"  {name:8s} reads {len(samples):6d}  p50 {statistics.median(samples) * 1000:7.2f} ms"
+        f"  p95 {p95 * 1000:7.2f} ms  max {samples[-1] * 1000:8.2f} ms  imported {imported / seconds:7.0f} photos/s"
+    )
+
+
+async def main(count: int, readers: int, seconds: float) -> None:
+    print(f"{count} photos, {readers} readers, {seconds:g} s per profile")
+    await run_profile("default", {}, count, readers, seconds)
+    await run_profile("tuned", sqlite_pragmas(Settings()), count, readers, seconds)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--photos", type=int, default=20_000)
+    parser.add_argument("--readers", type=int, default=4)
+    parser.add_argument("--seconds", type=float, default=5.0)
+    args = parser.parse_args()
+    asyncio.run(main(args.photos, args.readers, args.seconds))
@@ -0,0 +1,114 @@
+"""Benchmark building and running the photo list query per request.
+
+``select`` rebuilds the statement the way the endpoints did before
+``rows_stmt``/``keyset_stmt``: a fresh ``rows_query`` + ``keyset_query`` for
+every request, which SQLAlchemy then has to walk to derive its cache key.
+``lambda`` builds the same page through the lambda statements, whose
+structure is cached by code location, so a request only extracts its
+parameter values. Each page returns a handful of rows, so the timings are
+dominated by Python-side statement work rather than SQLite.
+
+Usage (from backend/):
+    python -m benchmarks.bench_statement_cache --photos 5000 --requests 2000
+"""
+import argparse
+import asyncio
+import statistics
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from uuid import uuid4
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
+
+from src.config import Settings
+from src.db.sqlite import install_pragmas, sqlite_pragmas
+from src.models.base import Base
+from src.models.collection import Collection
+from src.models.photo import Photo
+from src.services.photo_service import PHOTO_SORT_KEY, PhotoService, parse_fields
+from src.utils.filters import add_photo_filters, photo_filter_clauses
+from src.utils.pagination import encode_cursor, keyset_query, keyset_stmt
+
+PAGE_SIZE = 20
+
+
+async def seed(engine: AsyncEngine, count: int) -> str:
+    now = datetime.utcnow()
+    collection_id = str(uuid4())
+    async with AsyncSession(engine) as session:
+        await session.execute(
+            insert(Collection), [dict(id=collection_id, name="bench", created_at=now, updated_at=now)]
+        )
+        await session.execute(
+            insert(Photo),
+            [
+                dict(
+                    id=str(uuid4()),
+                    filename=f"DJI_{i:06d}.JPG",
+                    file_path=f"/bench/DJI_{i:06d}.JPG",
+                    file_hash=f"{i:064x}",
+                    timestamp=now + timedelta(seconds=2 * i),
+                    file_size=8_000_000,
+                    format="jpg",
+                    collection_id=collection_id,
+                    latitude=46.0,
+                    longitude=23.0,
+                    created_at=now,
+                    updated_at=now,
+                )
+                for i in range(count)
+            ],
+        )
+        await session.commit()
+    return collection_id
+
+
+def select_query(collection_id, date_start, cursor, projection):
+    clauses = [Photo.collection_id == collection_id, *photo_filter_clauses(date_start=date_start)]
+    return keyset_query(PhotoService.rows_query(*clauses, projection=projection), PHOTO_SORT_KEY, cursor, PAGE_SIZE)
+
+
+def lambda_query(collection_id, date_start, cursor, projection):
+    query = add_photo_filters(PhotoService.rows_stmt(projection), date_start=date_start, collection_id=collection_id)
+    return keyset_stmt(query, PHOTO_SORT_KEY, cursor, PAGE_SIZE)
+
+
+async def measure(engine: AsyncEngine, build, collection_id: str, requests: int) -> float:
+    projection = parse_fields("latitude,longitude")
+    start_at = datetime.utcnow() - timedelta(days=1)
+    samples = []
+    async with AsyncSession(engine) as session:
+        service = PhotoService(session)
+        for i in range(requests):
+            # A different cursor per request, as successive pages would send
+            cursor = encode_cursor([start_at + timedelta(seconds=i), "00000000-0000-0000-0000-000000000000"])
+            start = time.perf_counter()
+            await service.fetch_dicts(build(collection_id, start_at, cursor, projection), projection)
+            samples.append(time.perf_counter() - start)
+    return statistics.median(samples)
+
+
+async def main(count: int, requests: int) -> None:
+    print(f"{count} photos, median of {requests} page requests")
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_async_engine(f"sqlite+aiosqlite:///{Path(tmp) / 'bench.db'}")
+        install_pragmas(engine, sqlite_pragmas(Settings()))
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        collection_id = await seed(engine, count)
+
+        for name, build in (("select", select_query), ("lambda", lambda_query)):
+            elapsed = await measure(engine, build, collection_id, requests)
+            print(f"  {name:7s} {elapsed * 1000:8.3f} ms per page")
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--photos", type=int, default=5_000)
+    parser.add_argument("--requests", type=int, default=2_000)
+    args = parser.parse_args()
+    asyncio.run(main(args.photos, args.requests))
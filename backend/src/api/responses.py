@@ -0,0 +1,36 @@
+"""Response helpers shared by API routes."""
+from typing import Any, List
+
+from fastapi.responses import ORJSONResponse
+
+
+def trusted_response(data: Any, message: str = "Success") -> ORJSONResponse:
+    """Wrap pre-shaped data in the ``APIResponse`` envelope.
+
+    Skips response-model validation entirely, so ``data`` must already
+    match the route's declared schema (see ``PhotoService``). The declared
+    ``response_model`` still documents the route in OpenAPI.
+
+    Args:
+        data: orjson-serializable payload
+        message: Envelope message
+
+    Returns:
+        Response serialized with orjson
+    """
+    return ORJSONResponse({"success": True, "data": data, "error": None, "message": message})
+
+
+def trusted_page(data: List[Any], **page: Any) -> ORJSONResponse:
+    """Wrap a pre-shaped page in the ``PaginatedResponse`` envelope.
+
+    Same contract as ``trusted_response``.
+
+    Args:
+        data: orjson-serializable items
+        **page: Pagination fields (see ``page_fields``) and ``next_cursor``
+
+    Returns:
+        Response serialized with orjson
+    """
+    return ORJSONResponse({"success": True, "data": data, **page})
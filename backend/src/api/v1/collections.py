@@ -1,13 +1,15 @@
 """Collection endpoints."""
-from typing import List
+from typing import Optional
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.db.session import get_db_session
-from src.schemas.base import APIResponse
-from src.schemas.collection import CollectionCreate, CollectionResponse
+from src.db.session import get_db_read_session, get_db_session
+from src.schemas.base import APIResponse, PaginatedResponse
+from src.schemas.collection import CollectionCreate, CollectionMergeRequest, CollectionResponse
+from src.services.bulk_service import BulkService
 from src.services.collection_manager import CollectionManager
+from src.utils.pagination import page_fields
 
 router = APIRouter()
 
@@ -26,24 +28,50 @@ async def create_collection(
     return APIResponse(data=collection)
 
 
-@router.get("/", response_model=APIResponse[List[CollectionResponse]])
+@router.get("/", response_model=PaginatedResponse[CollectionResponse])
 async def list_collections(
-    skip: int = 0,
-    limit: int = 100,
-    db: AsyncSession = Depends(get_db_session)
-) -> APIResponse[List[CollectionResponse]]:
-    """List all collections."""
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1),
+    cursor: Optional[str] = None,
+    approximate: bool = False,
+    db: AsyncSession = Depends(get_db_read_session)
+) -> PaginatedResponse[CollectionResponse]:
+    """List collections, newest first; follow ``next_cursor`` for further pages."""
     manager = CollectionManager(db)
-    collections = await manager.list_collections(skip=skip, limit=limit)
-    return APIResponse(data=collections)
+    collections, next_cursor = await manager.list_collections(skip=skip, limit=limit, cursor=cursor)
+    total = await manager.count_collections(approximate=approximate)
+    return PaginatedResponse(
+        data=collections, next_cursor=next_cursor, **page_fields(total, skip, limit, cursor)
+    )
 
 
 @router.get("/{collection_id}", response_model=APIResponse[CollectionResponse])
 async def get_collection(
     collection_id: str,
-    db: AsyncSession = Depends(get_db_session)
+    db: AsyncSession = Depends(get_db_read_session)
 ) -> APIResponse[CollectionResponse]:
     """Get a specific collection."""
     manager = CollectionManager(db)
-    collection = await manager.get_collection(collection_id)
+    collection = await manager.read_collection(collection_id)
     return APIResponse(data=collection)
+
+
+@router.delete("/{collection_id}", response_model=APIResponse[dict])
+async def delete_collection(
+    collection_id: str,
+    db: AsyncSession = Depends(get_db_session)
+) -> APIResponse[dict]:
+    """Delete a collection and all its photos."""
+    deleted = await BulkService(db).delete_collection(collection_id)
+    return APIResponse(data={"collection_id": collection_id, "deleted_photos": deleted})
+
+
+@router.post("/{collection_id}/merge", response_model=APIResponse[dict])
+async def merge_collection(
+    collection_id: str,
+    merge_req: CollectionMergeRequest,
+    db: AsyncSession = Depends(get_db_session)
+) -> APIResponse[dict]:
+    """Move every photo of another collection into this one and delete it."""
+    moved = await BulkService(db).merge_collections(merge_req.source_id, collection_id)
+    return APIResponse(data={"collection_id": collection_id, "moved_photos": moved})
@@ -1,65 +1,85 @@
-from fastapi import APIRouter, Depends, HTTPException, Response
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Header, status
+from fastapi.responses import FileResponse, Response, StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
-from typing import List
 
-from src.db.session import get_db_session
-from src.models.photo import Photo
-from src.schemas.export import ExportRequest
-from src.services.export_service import ExportService
-from src.utils.filters import apply_filters
+from src.db.session import get_db_read_session
+from src.schemas.base import APIResponse
+from src.schemas.export import ExportJobResponse, ExportRequest
+from src.services.export_cache import etag_matches, get_export_cache
+from src.services.export_jobs import get_export_job_manager
+from src.services.export_service import ExportService, export_query
+from src.services.generation import get_generation
 
 router = APIRouter()
 
-@router.post("", response_class=Response)
+@router.post("", response_class=StreamingResponse)
 async def export_data(
     request: ExportRequest,
-    db: AsyncSession = Depends(get_db_session)
+    if_none_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_db_read_session)
 ):
-    from sqlalchemy.orm import selectinload
-    
-    # 1. Build query with eager loading of metadata
-    query = select(Photo).options(selectinload(Photo.metadata_))
-    
-    # If photo_ids provided, filter by them at DB level
-    if request.photo_ids:
-        query = query.where(Photo.id.in_(request.photo_ids))
-    
-    # Execute query
-    result = await db.execute(query)
-    photos = list(result.scalars().all())
-    
-    # 2. Apply in-memory filters (date range)
-    filters = {}
-    if request.date_start:
-        filters["date_start"] = request.date_start
-    if request.date_end:
-        filters["date_end"] = request.date_end
-        
-    if filters:
-        photos = apply_filters(photos, filters)
-
-    service = ExportService()
-    
-    if request.format.lower() == "geojson":
-        data = service.export_to_geojson(photos)
-        import json
-        content = json.dumps(data)
-        media_type = "application/geo+json"
-        filename = "export.geojson"
-    elif request.format.lower() == "csv":
-        content = service.export_to_csv(photos)
-        media_type = "text/csv"
-        filename = "export.csv"
-    elif request.format.lower() == "kml":
-        content = service.export_to_kml(photos)
-        media_type = "application/vnd.google-earth.kml+xml"
-        filename = "export.kml"
-    else:
-        raise HTTPException(status_code=400, detail="Unsupported format")
-        
-    return Response(
-        content=content,
-        media_type=media_type,
-        headers={"Content-Disposition": f"attachment; filename={filename}"}
+    service = ExportService(db)
+    # Resolve the writer first so an unsupported format fails before streaming starts
+    writer = service.create_writer(request.format)
+    headers = {"Content-Disposition": f"attachment; filename=export.{writer.extension}"}
+
+    # Identical requests against unchanged data are served from the artifact cache
+    cache = get_export_cache()
+    key = None
+    if cache is not None:
+        generation = await get_generation(db)
+        key = cache.key(request.format, request.model_dump(mode="json", exclude={"format"}), generation)
+        headers["ETag"] = f'"{key}"'
+        if etag_matches(if_none_match, headers["ETag"]):
+            return Response(status_code=304, headers={"ETag": headers["ETag"]})
+        path = cache.get(key)
+        if path is not None:
+            # FileResponse answers Range requests, so interrupted downloads resume;
+            # the hit refreshed the artifact, so eviction leaves it alone meanwhile
+            return FileResponse(path, media_type=writer.media_type, headers=headers)
+
+    # Column-only query with every filter compiled into the WHERE clause;
+    # rows are streamed from a server-side cursor
+    query = export_query(request.photo_ids, request.date_start, request.date_end, request.bounds, request.format)
+
+    content = service.stream_export(writer, service.stream_rows(query))
+    if cache is not None and key is not None:
+        content = cache.store(key, content)
+
+    return StreamingResponse(content, media_type=writer.media_type, headers=headers)
+
+
+@router.post("/jobs", response_model=APIResponse[ExportJobResponse], status_code=status.HTTP_202_ACCEPTED)
+async def create_export_job(
+    request: ExportRequest,
+    db: AsyncSession = Depends(get_db_read_session)
+) -> APIResponse[ExportJobResponse]:
+    """Render an export in the background; poll the job and download it when completed."""
+    query = export_query(request.photo_ids, request.date_start, request.date_end, request.bounds, request.format)
+    job = get_export_job_manager().submit(db.bind, request.format, query)
+    return APIResponse(data=ExportJobResponse.model_validate(job))
+
+
+@router.get("/jobs/{job_id}", response_model=APIResponse[ExportJobResponse])
+async def get_export_job(job_id: str) -> APIResponse[ExportJobResponse]:
+    """Get the status and progress of an export job."""
+    return APIResponse(data=ExportJobResponse.model_validate(get_export_job_manager().get(job_id)))
+
+
+@router.get("/jobs/{job_id}/download", response_class=FileResponse)
+async def download_export_job(job_id: str):
+    """Download the artifact of a completed export job."""
+    job, path = get_export_job_manager().artifact(job_id)
+    return FileResponse(
+        path,
+        media_type=job.media_type,
+        headers={"Content-Disposition": f"attachment; filename=export.{job.extension}"}
     )
+
+
+@router.delete("/jobs/{job_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_export_job(job_id: str) -> None:
+    """Cancel an export job and delete its artifact."""
+    await get_export_job_manager().cancel(job_id)
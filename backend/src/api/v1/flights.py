@@ -1,11 +1,12 @@
-from fastapi import APIRouter, Depends
-from sqlalchemy import select
+from datetime import datetime
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Query
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
-from src.db.session import get_db_session
-from src.models.photo import Photo, PhotoMetadata
+from src.db.session import get_db_read_session
 from src.schemas.base import APIResponse
+from src.services.collection_manager import CollectionManager
 from src.services.flight_service import FlightService
 from src.schemas.photo import PhotoFilterRequest
 
@@ -14,30 +15,52 @@ router = APIRouter()
 @router.post("/stats", response_model=APIResponse[dict])
 async def get_flight_stats(
     filter_req: PhotoFilterRequest,
-    db: AsyncSession = Depends(get_db_session)
+    db: AsyncSession = Depends(get_db_read_session)
 ) -> APIResponse[dict]:
     """Get flight statistics based on filters."""
-    query = select(Photo).options(selectinload(Photo.metadata_))
-    
-    if filter_req.date_start:
-        query = query.where(Photo.timestamp >= filter_req.date_start)
-        
-    if filter_req.date_end:
-        query = query.where(Photo.timestamp <= filter_req.date_end)
-        
-    if filter_req.bounds:
-        query = query.join(Photo.metadata_)
-        query = query.where(
-            (PhotoMetadata.latitude <= filter_req.bounds.north) &
-            (PhotoMetadata.latitude >= filter_req.bounds.south) &
-            (PhotoMetadata.longitude <= filter_req.bounds.east) &
-            (PhotoMetadata.longitude >= filter_req.bounds.west)
-        )
-        
-    result = await db.execute(query)
-    photos = result.scalars().all()
-    
-    service = FlightService()
-    stats = service.calculate_stats(photos)
-    
+    service = FlightService(db)
+    stats = await service.stats(
+        date_start=filter_req.date_start, date_end=filter_req.date_end, bounds=filter_req.bounds
+    )
+
     return APIResponse(data=stats)
+
+
+@router.get("/{collection_id}/distance", response_model=APIResponse[dict])
+async def get_flight_distance(
+    collection_id: str,
+    date_start: Optional[datetime] = None,
+    date_end: Optional[datetime] = None,
+    db: AsyncSession = Depends(get_db_read_session)
+) -> APIResponse[dict]:
+    """Get the distance flown in a collection between two timestamps.
+
+    Uses the precomputed cumulative distances, so the cost does not depend
+    on how many photos fall inside the window.
+    """
+    await CollectionManager(db).get_collection(collection_id)
+
+    service = FlightService(db)
+    distance = await service.distance_between(collection_id, date_start, date_end)
+
+    return APIResponse(data={
+        "collection_id": collection_id,
+        "date_start": date_start,
+        "date_end": date_end,
+        "distance_meters": distance,
+    })
+
+
+@router.get("/{collection_id}/series", response_model=APIResponse[dict])
+async def get_flight_series(
+    collection_id: str,
+    points: int = Query(500, ge=3, le=10000),
+    db: AsyncSession = Depends(get_db_read_session)
+) -> APIResponse[dict]:
+    """Get downsampled altitude and ground-speed series for a collection."""
+    await CollectionManager(db).get_collection(collection_id)
+
+    service = FlightService(db)
+    series = await service.get_series(collection_id, points)
+
+    return APIResponse(data=series)
@@ -4,7 +4,7 @@ from typing import List
 from fastapi import APIRouter, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.db.session import get_db_session
+from src.db.session import get_db_read_session
 from src.schemas.location import PhotoMarkerResponse
 from src.services.location_service import LocationService
 
@@ -13,7 +13,7 @@ router = APIRouter()
 
 @router.get("", response_model=List[PhotoMarkerResponse])
 async def get_locations(
-    session: AsyncSession = Depends(get_db_session)
+    session: AsyncSession = Depends(get_db_read_session)
 ):
     """Get all photo locations/markers for map display.
     
@@ -1,25 +1,42 @@
 """Photo endpoints."""
 from pathlib import Path
-from typing import List
+from typing import Any, AsyncIterator, Dict, List, Optional
 
-from fastapi import APIRouter, Depends, status
-from sqlalchemy import select
+import orjson
+from fastapi import APIRouter, Depends, Header, Query, Response
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
+from src.api.responses import trusted_page, trusted_response
 from src.config import get_settings
-from src.db.session import get_db_session
-from src.models.photo import Photo, PhotoMetadata
-from src.schemas.base import APIResponse
-from src.schemas.photo import PhotoImportRequest, ImportStats, PhotoResponse, PhotoFilterRequest
+from src.db.session import get_db_read_session, get_db_session
+from src.db.spatial import nearest_order, radius_clause
+from src.exceptions import NotFoundError
+from src.models.photo import Photo
+from src.schemas.base import APIResponse, PaginatedResponse
+from src.schemas.photo import (
+    PhotoImportRequest, ImportStats, PhotoResponse, PhotoFilterRequest, PhotoMoveRequest, PhotoPruneRequest
+)
+from src.services.bulk_service import BulkService
 from src.services.photo_processor import PhotoProcessor
+from src.services.generation import collection_scope
+from src.services.photo_service import PHOTO_SORT_KEY, PhotoService, parse_fields
 from src.utils.file_utils import validate_path
+from src.utils.filters import add_photo_filters
+from src.utils.pagination import count_stmt, keyset_page, keyset_stmt, page_fields
 import logging
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+FIELDS_QUERY = Query(
+    None,
+    description="Comma-separated sparse fieldset, e.g. latitude,longitude (id and timestamp are always returned)",
+)
+
 
 @router.post("/import", response_model=APIResponse[ImportStats])
 async def import_photos(
@@ -43,71 +60,142 @@ async def import_photos(
     return APIResponse(data=stats)
 
 
-@router.post("/filter", response_model=APIResponse[List[PhotoResponse]])
+@router.post("/move", response_model=APIResponse[dict])
+async def move_photos(
+    move_req: PhotoMoveRequest,
+    db: AsyncSession = Depends(get_db_session)
+) -> APIResponse[dict]:
+    """Move photos to another collection."""
+    moved = await BulkService(db).move_photos(move_req.photo_ids, move_req.collection_id)
+    return APIResponse(data={"collection_id": move_req.collection_id, "moved_photos": moved})
+
+
+@router.post("/prune", response_model=APIResponse[dict])
+async def prune_photos(
+    prune_req: PhotoPruneRequest,
+    db: AsyncSession = Depends(get_db_session)
+) -> APIResponse[dict]:
+    """Delete photos whose files no longer exist on disk."""
+    pruned = await BulkService(db).prune_missing_photos(prune_req.collection_id)
+    return APIResponse(data={"pruned_photos": pruned})
+
+
+async def ndjson_lines(batches: AsyncIterator[List[Dict[str, Any]]]) -> AsyncIterator[bytes]:
+    """Encode batches of rows as newline-delimited JSON, one chunk per batch."""
+    async for batch in batches:
+        yield b"".join(orjson.dumps(row) + b"\n" for row in batch)
+
+
+@router.post(
+    "/filter",
+    response_model=PaginatedResponse[PhotoResponse],
+    responses={200: {"content": {NDJSON_MEDIA_TYPE: {}}}},
+)
 async def filter_photos(
     filter_req: PhotoFilterRequest,
-    db: AsyncSession = Depends(get_db_session)
-) -> APIResponse[List[PhotoResponse]]:
-    """Filter photos by date and location."""
+    fields: Optional[str] = FIELDS_QUERY,
+    accept: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_db_read_session)
+) -> Response:
+    """Filter photos by date and location in capture order.
+
+    Pages hold at most ``PHOTO_FILTER_MAX_PAGE_SIZE`` photos; follow
+    ``next_cursor`` for further pages. With ``Accept: application/x-ndjson``
+    every matching photo (after ``cursor``, if given) is streamed instead,
+    one JSON object per line.
+    """
     logger.info(f"Filtering photos with params: {filter_req}")
-    query = select(Photo).options(selectinload(Photo.metadata_))
-    
-    if filter_req.date_start:
-        query = query.where(Photo.timestamp >= filter_req.date_start)
-        
-    if filter_req.date_end:
-        query = query.where(Photo.timestamp <= filter_req.date_end)
-        
-    if filter_req.bounds:
-        # Join with metadata to filter by location
-        query = query.join(Photo.metadata_)
-        query = query.where(
-            (PhotoMetadata.latitude <= filter_req.bounds.north) &
-            (PhotoMetadata.latitude >= filter_req.bounds.south) &
-            (PhotoMetadata.longitude <= filter_req.bounds.east) &
-            (PhotoMetadata.longitude >= filter_req.bounds.west)
+    service = PhotoService(db)
+    projection = parse_fields(fields)
+    filters: Dict[str, Any] = dict(
+        date_start=filter_req.date_start, date_end=filter_req.date_end, bounds=filter_req.bounds
+    )
+    query = add_photo_filters(service.rows_stmt(projection), **filters)
+
+    if accept and NDJSON_MEDIA_TYPE in accept:
+        query = keyset_stmt(query, PHOTO_SORT_KEY, filter_req.cursor, None)
+        return StreamingResponse(
+            ndjson_lines(service.stream_dicts(query, projection)), media_type=NDJSON_MEDIA_TYPE
         )
-        
-    result = await db.execute(query)
-    photos = result.scalars().all()
-    
-    return APIResponse(data=photos)
 
+    max_page_size = get_settings().PHOTO_FILTER_MAX_PAGE_SIZE
+    limit = min(filter_req.limit or max_page_size, max_page_size)
+    query = keyset_stmt(query, PHOTO_SORT_KEY, filter_req.cursor, limit)
+
+    rows = await service.fetch_dicts(query, projection)
+    photos, next_cursor = keyset_page(rows, limit, lambda p: (p["timestamp"], p["id"]))
+    total = await service.count_statement(add_photo_filters(count_stmt(Photo), **filters))
+    return trusted_page(photos, next_cursor=next_cursor, **page_fields(total, 0, limit, filter_req.cursor))
 
-@router.get("/", response_model=APIResponse[List[PhotoResponse]])
+
+@router.get("/", response_model=PaginatedResponse[PhotoResponse])
 async def list_photos(
-    skip: int = 0,
-    limit: int = 100,
-    collection_id: str = None,
-    db: AsyncSession = Depends(get_db_session)
-) -> APIResponse[List[PhotoResponse]]:
-    """List photos."""
-    query = select(Photo).options(selectinload(Photo.metadata_))
-    
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1),
+    collection_id: Optional[str] = None,
+    cursor: Optional[str] = None,
+    approximate: bool = False,
+    fields: Optional[str] = FIELDS_QUERY,
+    db: AsyncSession = Depends(get_db_read_session)
+) -> Response:
+    """List photos in capture order; follow ``next_cursor`` for further pages."""
+    service = PhotoService(db)
+    projection = parse_fields(fields)
+    collection_id = collection_id or None
+
+    # Keyset pages on (timestamp, id) cost the same at any depth; skip is
+    # kept for small offset-based lists
+    query = add_photo_filters(service.rows_stmt(projection), collection_id=collection_id)
+    query = keyset_stmt(query, PHOTO_SORT_KEY, cursor, limit)
+    if skip and not cursor:
+        query += lambda s: s.offset(skip)
+
+    rows = await service.fetch_dicts(query, projection)
+    photos, next_cursor = keyset_page(rows, limit, lambda p: (p["timestamp"], p["id"]))
     if collection_id:
-        query = query.where(Photo.collection_id == collection_id)
-        
-    query = query.offset(skip).limit(limit)
-    
-    result = await db.execute(query)
-    photos = result.scalars().all()
-    
-    return APIResponse(data=photos)
+        total = await service.count_statement(
+            add_photo_filters(count_stmt(Photo), collection_id=collection_id), collection_scope(collection_id)
+        )
+    else:
+        total = await service.count(approximate=approximate)
+    return trusted_page(photos, next_cursor=next_cursor, **page_fields(total, skip, limit, cursor))
+
+
+@router.get("/nearby", response_model=APIResponse[List[PhotoResponse]])
+async def nearby_photos(
+    latitude: float = Query(..., ge=-90, le=90),
+    longitude: float = Query(..., ge=-180, le=180),
+    radius: float = Query(500.0, gt=0, le=50_000, description="Search radius in meters"),
+    limit: int = Query(100, ge=1, le=1000),
+    fields: Optional[str] = FIELDS_QUERY,
+    db: AsyncSession = Depends(get_db_read_session)
+) -> Response:
+    """Photos within ``radius`` meters of a point, nearest first."""
+    service = PhotoService(db)
+    projection = parse_fields(fields)
+    query = (
+        service.rows_query(radius_clause(latitude, longitude, radius), projection=projection)
+        .order_by(nearest_order(latitude, longitude), Photo.id)
+        .limit(limit)
+    )
+
+    return trusted_response(await service.fetch_dicts(query, projection))
 
 
 @router.get("/{photo_id}", response_model=APIResponse[PhotoResponse])
 async def get_photo(
     photo_id: str,
-    db: AsyncSession = Depends(get_db_session)
-) -> APIResponse[PhotoResponse]:
+    fields: Optional[str] = FIELDS_QUERY,
+    db: AsyncSession = Depends(get_db_read_session)
+) -> Response:
     """Get a specific photo."""
-    query = select(Photo).options(selectinload(Photo.metadata_)).where(Photo.id == photo_id)
-    result = await db.execute(query)
-    photo = result.scalar_one_or_none()
-    
-    if not photo:
-        # TODO: Use proper exception handler
-        from fastapi import HTTPException
-        raise HTTPException(status_code=404, detail="Photo not found")
-        
-    return APIResponse(data=photo)
+    service = PhotoService(db)
+    projection = parse_fields(fields)
+    query = service.rows_stmt(projection)
+    query += lambda s: s.where(Photo.id == photo_id)
+    photos = await service.fetch_dicts(query, projection)
+
+    if not photos:
+        raise NotFoundError(f"Photo not found: {photo_id}")
+
+    return trusted_response(photos[0])
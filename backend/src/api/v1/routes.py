@@ -1,7 +1,8 @@
 """API route configuration."""
 from fastapi import APIRouter
 
-from src.schemas.base import HealthCheck
+from src.schemas.base import APIResponse, HealthCheck
+from src.services.cache import cache_stats
 
 api_router = APIRouter()
 
@@ -12,6 +13,12 @@ async def health_check() -> HealthCheck:
     return HealthCheck(message="Service is running")
 
 
+@api_router.get("/health/cache", response_model=APIResponse[dict], tags=["status"])
+async def cache_health() -> APIResponse[dict]:
+    """Hit, miss and eviction counters of the in-process service caches."""
+    return APIResponse(data=cache_stats())
+
+
 # Import and include other routers here as they are implemented
 from src.api.v1 import collections, photos, locations, exports, flights
 
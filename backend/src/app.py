@@ -2,12 +2,15 @@
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 
 from src.api.v1.routes import api_router
 from src.config import get_settings, setup_logging
-from src.db.session import dispose_db, init_db
+from src.db.session import dispose_db, init_db, start_maintenance
 from src.exceptions_handler import register_exception_handlers
+from src.middleware import CompressionMiddleware
+from src.services.export_jobs import get_export_job_manager
 
 
 @asynccontextmanager
@@ -16,8 +19,11 @@ async def lifespan(app: FastAPI):
     # Startup
     setup_logging()
     await init_db()
+    start_maintenance()
+    get_export_job_manager().start()
     yield
     # Shutdown
+    await get_export_job_manager().shutdown()
     await dispose_db()
 
 
@@ -29,6 +35,7 @@ def create_app() -> FastAPI:
         title=settings.APP_NAME,
         version=settings.APP_VERSION,
         lifespan=lifespan,
+        default_response_class=ORJSONResponse,
         docs_url="/docs",
         redoc_url="/redoc",
     )
@@ -41,6 +48,13 @@ def create_app() -> FastAPI:
         allow_headers=["*"],
     )
 
+    if settings.COMPRESSION_ENABLED:
+        app.add_middleware(
+            CompressionMiddleware,
+            minimum_size=settings.COMPRESSION_MINIMUM_SIZE,
+            encodings=settings.COMPRESSION_ENCODINGS,
+        )
+
     register_exception_handlers(app)
 
     # Routes
@@ -18,11 +18,62 @@ class Settings(BaseSettings):
     API_V1_STR: str = "/api/v1"
 
     # Database
+    # SQLite (aiosqlite) or PostgreSQL with PostGIS (asyncpg)
     DATABASE_URL: str = "sqlite+aiosqlite:///./app.db"
+    # Reads use read-only connections to the same file on SQLite; set this
+    # to a replica to offload reads on other databases
+    DATABASE_READ_URL: str | None = None
+    DATABASE_READ_POOL_SIZE: int = 5
+
+    # SQLite tuning, applied to every new connection. WAL lets readers run
+    # alongside the importer's writes; synchronous=NORMAL is durable across
+    # application crashes in WAL mode (only an OS crash can lose the last
+    # commits). Negative cache sizes are in KiB.
+    SQLITE_JOURNAL_MODE: str = "WAL"
+    SQLITE_SYNCHRONOUS: str = "NORMAL"
+    SQLITE_CACHE_SIZE: int = -64 * 1024  # 64 MiB
+    SQLITE_MMAP_SIZE: int = 256 * 1024 * 1024  # 256 MiB
+    SQLITE_TEMP_STORE: str = "MEMORY"
+    SQLITE_BUSY_TIMEOUT_MS: int = 5000
+    # PRAGMA optimize + WAL checkpoint interval; 0 disables the task
+    SQLITE_MAINTENANCE_INTERVAL_SECONDS: int = 3600
 
     # CORS
     CORS_ORIGINS: List[str] = ["http://localhost:5173", "http://localhost:3000"]
 
+    # Response compression (encodings in server preference order; br and
+    # zstd are used only when the brotli/zstandard packages are installed)
+    COMPRESSION_ENABLED: bool = True
+    COMPRESSION_MINIMUM_SIZE: int = 1024
+    COMPRESSION_ENCODINGS: List[str] = ["br", "zstd", "gzip"]
+
+    # Export artifact cache (LRU by last use, bounded by total size)
+    EXPORT_CACHE_ENABLED: bool = True
+    EXPORT_CACHE_DIR: str = "./export_cache"
+    EXPORT_CACHE_MAX_BYTES: int = 1024 * 1024 * 1024  # 1 GB
+
+    # Background export jobs (finished artifacts kept for the TTL and pruned
+    # every interval). Jobs are held in process memory, so serve the API from
+    # a single worker (or with sticky routing) when using them
+    EXPORT_JOBS_DIR: str = "./export_jobs"
+    EXPORT_JOBS_MAX_CONCURRENT: int = 2
+    EXPORT_JOB_TTL_SECONDS: int = 3600
+    EXPORT_JOB_PRUNE_INTERVAL_SECONDS: int = 60
+
+    # POST /photos/filter page size cap (requests asking for more are clamped;
+    # NDJSON streaming responses are not paged)
+    PHOTO_FILTER_MAX_PAGE_SIZE: int = 1000
+
+    # Rows per statement for bulk deletes and moves; each chunk commits on
+    # its own so the write lock is held briefly
+    BULK_CHUNK_SIZE: int = 500
+
+    # In-process cache for markers, collections and flight statistics.
+    # Entries are invalidated by data generation bumps; the TTL only bounds
+    # how long they survive changes made behind the application's back
+    SERVICE_CACHE_ENABLED: bool = True
+    SERVICE_CACHE_TTL_SECONDS: int = 300
+
     # Logging
     LOG_LEVEL: str = "INFO"
     LOG_FORMAT: str = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
@@ -37,6 +88,23 @@ class Settings(BaseSettings):
     model_config = SettingsConfigDict(env_file=".env", case_sensitive=True, extra="ignore")
 
 
+# Async drivers for URLs given without one, so plain sqlite:// and
+# postgresql:// URLs in existing .env files keep working
+ASYNC_DRIVERS = {
+    "sqlite://": "sqlite+aiosqlite://",
+    "postgresql://": "postgresql+asyncpg://",
+    "postgres://": "postgresql+asyncpg://",
+}
+
+
+def async_database_url(url: str) -> str:
+    """Database URL with an async driver (aiosqlite or asyncpg)."""
+    for prefix, replacement in ASYNC_DRIVERS.items():
+        if url.startswith(prefix):
+            return replacement + url[len(prefix):]
+    return url
+
+
 @lru_cache
 def get_settings() -> Settings:
     """Get cached settings instance."""
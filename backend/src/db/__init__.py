@@ -1,4 +1,24 @@
 """Database module for SQLAlchemy ORM and session management."""
-from .session import AsyncSessionLocal, engine, get_db_session, init_db, dispose_db
+from .session import (
+    AsyncSessionLocal,
+    ReadSessionLocal,
+    dispose_db,
+    engine,
+    get_db_read_session,
+    get_db_session,
+    init_db,
+    read_engine,
+    start_maintenance,
+)
 
-__all__ = ["AsyncSessionLocal", "engine", "get_db_session", "init_db", "dispose_db"]
+__all__ = [
+    "AsyncSessionLocal",
+    "ReadSessionLocal",
+    "engine",
+    "read_engine",
+    "get_db_session",
+    "get_db_read_session",
+    "init_db",
+    "dispose_db",
+    "start_maintenance",
+]
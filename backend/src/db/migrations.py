@@ -0,0 +1,59 @@
+"""Schema migrations.
+
+The schema is managed with Alembic (``backend/alembic``). The application
+upgrades the database to the latest revision on startup; databases created
+by ``create_all`` before migrations existed are first stamped with the
+baseline revision, which describes exactly that schema.
+"""
+import logging
+from pathlib import Path
+from typing import Optional
+
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import inspect
+from sqlalchemy.engine import Connection
+
+logger = logging.getLogger(__name__)
+
+ALEMBIC_INI = Path(__file__).resolve().parents[2] / "alembic.ini"
+BASELINE_REVISION = "0001"
+
+# Database objects outside the models: the PostGIS location column and its
+# indexes (see src.db.spatial) and the tables the postgis extension installs
+UNMODELED_OBJECTS = {"location", "ix_photos_location", "ix_photos_location_bounds", "spatial_ref_sys"}
+
+
+def include_object(obj, name: str, type_: str, reflected: bool, compare_to) -> bool:
+    """Autogenerate filter that leaves ``UNMODELED_OBJECTS`` alone."""
+    return not (reflected and compare_to is None and name in UNMODELED_OBJECTS)
+
+
+def alembic_config(connection: Optional[Connection] = None) -> Config:
+    """Alembic configuration, optionally bound to an open connection.
+
+    Args:
+        connection: Connection the migrations run on; when omitted Alembic
+            connects to ``DATABASE_URL`` itself
+
+    Returns:
+        Alembic config
+    """
+    config = Config(str(ALEMBIC_INI))
+    config.attributes["connection"] = connection
+    return config
+
+
+def upgrade_database(connection: Connection, revision: str = "head") -> None:
+    """Upgrade the database schema; run with ``AsyncConnection.run_sync``.
+
+    Args:
+        connection: Synchronous connection
+        revision: Target revision
+    """
+    tables = set(inspect(connection).get_table_names())
+    config = alembic_config(connection)
+    if "alembic_version" not in tables and "photos" in tables:
+        logger.info(f"Stamping pre-migration database at revision {BASELINE_REVISION}")
+        command.stamp(config, BASELINE_REVISION)
+    command.upgrade(config, revision)
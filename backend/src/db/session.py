@@ -1,34 +1,81 @@
-"""Database session and connection management."""
-from typing import AsyncGenerator
-
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
-from sqlalchemy.orm import sessionmaker
-
-from src.config import get_settings
-
-DATABASE_URL = get_settings().DATABASE_URL
-
-# The async engine needs the aiosqlite driver; upgrade plain sqlite:// URLs
-# so existing .env files keep working.
-if DATABASE_URL.startswith("sqlite://"):
-    DATABASE_URL = DATABASE_URL.replace("sqlite://", "sqlite+aiosqlite://", 1)
-
-# Create async engine
+"""Database session and connection management.
+
+Writes and reads use separate engines. On SQLite the write engine holds a
+single connection, matching SQLite's single writer, so imports queue in the
+pool instead of failing with "database is locked". Reads use a pool of
+read-only (``mode=ro``) connections that, in WAL mode, see the last
+committed state without waiting for an import in progress. Other databases
+can point reads at a replica with ``DATABASE_READ_URL``.
+"""
+import asyncio
+from typing import AsyncGenerator, Optional
+
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from src.config import async_database_url, get_settings
+from src.db.sqlite import install_pragmas, maintenance_loop, read_only_url, sqlite_pragmas
+
+settings = get_settings()
+# The async engine needs an async driver (aiosqlite/asyncpg)
+DATABASE_URL = async_database_url(settings.DATABASE_URL)
+
+IS_SQLITE = make_url(DATABASE_URL).get_backend_name() == "sqlite"
+# An in-memory database is private to its pool, so it gets no separate reader
+SQLITE_READ_URL = read_only_url(make_url(DATABASE_URL)) if IS_SQLITE else None
+SHARED_SQLITE_FILE = SQLITE_READ_URL is not None
+
+# Create async engine (writes)
 engine = create_async_engine(
     DATABASE_URL,
     echo=False,  # Set to True for SQL debugging
     future=True,
-    connect_args={"check_same_thread": False} if "sqlite" in DATABASE_URL else {},
+    connect_args={"check_same_thread": False} if IS_SQLITE else {},
+    **({"pool_size": 1, "max_overflow": 0} if SHARED_SQLITE_FILE else {}),
 )
 
-# Create async session factory
-AsyncSessionLocal = sessionmaker(
+# Read engine: read-only connections to the same SQLite file, a replica, or
+# the write engine itself when neither applies
+if SQLITE_READ_URL is not None:
+    read_engine = create_async_engine(
+        SQLITE_READ_URL,
+        echo=False,
+        future=True,
+        connect_args={"check_same_thread": False},
+        pool_size=settings.DATABASE_READ_POOL_SIZE,
+    )
+elif settings.DATABASE_READ_URL:
+    read_engine = create_async_engine(
+        async_database_url(settings.DATABASE_READ_URL),
+        echo=False,
+        future=True,
+        pool_size=settings.DATABASE_READ_POOL_SIZE,
+    )
+else:
+    read_engine = engine
+
+if IS_SQLITE:
+    install_pragmas(engine, sqlite_pragmas(settings))
+    if read_engine is not engine:
+        install_pragmas(read_engine, sqlite_pragmas(settings, read_only=True))
+
+_maintenance_task: Optional[asyncio.Task] = None
+
+# Create async session factories
+AsyncSessionLocal = async_sessionmaker(
     engine,
     class_=AsyncSession,
     expire_on_commit=False,
     autocommit=False,
     autoflush=False,
 )
+ReadSessionLocal = async_sessionmaker(
+    read_engine,
+    class_=AsyncSession,
+    expire_on_commit=False,
+    autocommit=False,
+    autoflush=False,
+)
 
 
 async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
@@ -49,16 +96,51 @@ async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
             await session.close()
 
 
+async def get_db_read_session() -> AsyncGenerator[AsyncSession, None]:
+    """Get a read-only database session for dependency injection.
+
+    For endpoints that only query; the session cannot write.
+
+    Yields:
+        AsyncSession: Session on the read engine
+    """
+    async with ReadSessionLocal() as session:
+        try:
+            yield session
+        finally:
+            await session.close()
+
+
 async def init_db() -> None:
     """Initialize database tables.
 
-    Creates all tables defined in SQLAlchemy models.
+    Upgrades the schema to the latest Alembic revision.
     This should be called on application startup.
     """
-    from src.models.base import Base
+    from src.db.migrations import upgrade_database
+
+    async with engine.connect() as conn:
+        if IS_SQLITE:
+            # Batch migrations copy and drop tables; with foreign keys
+            # enforced, dropping a table would cascade-delete the rows that
+            # reference it. The pragma only changes outside a transaction.
+            await conn.exec_driver_sql("PRAGMA foreign_keys=OFF")
+        await conn.run_sync(upgrade_database)
+        await conn.commit()
+        if IS_SQLITE:
+            await conn.exec_driver_sql("PRAGMA foreign_keys=ON")
+            await conn.commit()
+
 
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+def start_maintenance() -> None:
+    """Start periodic SQLite maintenance (``PRAGMA optimize``, WAL checkpoint).
+
+    No-op for other databases or when the interval setting is 0.
+    """
+    global _maintenance_task
+    interval = settings.SQLITE_MAINTENANCE_INTERVAL_SECONDS
+    if IS_SQLITE and interval > 0 and _maintenance_task is None:
+        _maintenance_task = asyncio.create_task(maintenance_loop(engine, interval))
 
 
 async def dispose_db() -> None:
@@ -66,4 +148,14 @@ async def dispose_db() -> None:
 
     This should be called on application shutdown.
     """
+    global _maintenance_task
+    if _maintenance_task is not None:
+        _maintenance_task.cancel()
+        try:
+            await _maintenance_task
+        except asyncio.CancelledError:
+            pass
+        _maintenance_task = None
+    if read_engine is not engine:
+        await read_engine.dispose()
     await engine.dispose()
@@ -0,0 +1,157 @@
+"""SQLite connection tuning and maintenance.
+
+SQLite's defaults favour safety on the smallest devices: a rollback
+journal that blocks readers while the importer writes, ``synchronous=FULL``
+and a 2 MB page cache. ``install_pragmas`` applies the profile from
+``Settings`` to every new connection through an engine connect event, and
+``maintenance_loop`` periodically refreshes planner statistics and
+checkpoints the WAL so it does not grow without bound. Connections also
+get Python versions of the SQL math functions that set-based distance
+updates use, when the SQLite build lacks them.
+
+Reads go through a separate pool of read-only connections
+(``read_only_url``); in WAL mode they never wait for the importer's write
+transactions.
+"""
+import asyncio
+import logging
+import math
+from typing import Any, Dict, Optional
+
+from sqlalchemy import event, text
+from sqlalchemy.engine import URL
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from src.config import Settings
+
+logger = logging.getLogger(__name__)
+
+# Used by the great-circle distance SQL (src.services.flight_service); only
+# built into SQLite when compiled with SQLITE_ENABLE_MATH_FUNCTIONS
+MATH_FUNCTIONS = {
+    "sin": (1, math.sin),
+    "cos": (1, math.cos),
+    "asin": (1, math.asin),
+    "sqrt": (1, math.sqrt),
+    "radians": (1, math.radians),
+    "power": (2, math.pow),
+}
+
+
+def sqlite_pragmas(settings: Settings, read_only: bool = False) -> Dict[str, Any]:
+    """Build the connection pragmas from settings.
+
+    Args:
+        settings: Application settings
+        read_only: Leave out the pragmas that only matter to writers
+            (the journal mode is a property of the database file, set by
+            the write engine)
+
+    Returns:
+        Pragma names and values, in the order they are applied
+    """
+    if read_only:
+        return {
+            "busy_timeout": settings.SQLITE_BUSY_TIMEOUT_MS,
+            "cache_size": settings.SQLITE_CACHE_SIZE,
+            "mmap_size": settings.SQLITE_MMAP_SIZE,
+            "temp_store": settings.SQLITE_TEMP_STORE,
+        }
+    return {
+        # busy_timeout first so the journal mode switch waits on a locked database
+        "busy_timeout": settings.SQLITE_BUSY_TIMEOUT_MS,
+        "journal_mode": settings.SQLITE_JOURNAL_MODE,
+        "synchronous": settings.SQLITE_SYNCHRONOUS,
+        "cache_size": settings.SQLITE_CACHE_SIZE,
+        "mmap_size": settings.SQLITE_MMAP_SIZE,
+        "temp_store": settings.SQLITE_TEMP_STORE,
+        # Off by default in SQLite; bulk deletes rely on ON DELETE CASCADE
+        "foreign_keys": "ON",
+    }
+
+
+def is_memory_database(url: URL) -> bool:
+    """Whether a SQLite URL names a private in-memory database."""
+    return url.database in (None, "", ":memory:") or "mode=memory" in str(url)
+
+
+def read_only_url(url: URL) -> Optional[URL]:
+    """Read-only variant of a SQLite file database URL.
+
+    Args:
+        url: SQLite database URL
+
+    Returns:
+        URL opening the same file with ``mode=ro``, or None for in-memory
+        databases, which cannot be shared between pools
+    """
+    if url.database is None or is_memory_database(url):
+        return None
+    database = url.database if url.database.startswith("file:") else f"file:{url.database}"
+    return url.set(database=database, query={**url.query, "mode": "ro", "uri": "true"})
+
+
+def install_math_functions(dbapi_connection: Any) -> None:
+    """Register the ``MATH_FUNCTIONS`` a SQLite connection does not have.
+
+    Args:
+        dbapi_connection: sqlite3 (or aiosqlite adapter) connection
+    """
+    cursor = dbapi_connection.cursor()
+    try:
+        for name, (arity, function) in MATH_FUNCTIONS.items():
+            try:
+                cursor.execute(f"SELECT {name}({', '.join(['1'] * arity)})")
+            except Exception:
+                dbapi_connection.create_function(name, arity, function, deterministic=True)
+    finally:
+        cursor.close()
+
+
+def install_pragmas(engine: AsyncEngine, pragmas: Dict[str, Any]) -> None:
+    """Apply pragmas (and ``install_math_functions``) to every connection the engine opens.
+
+    Args:
+        engine: SQLite engine
+        pragmas: Pragma names and values, see ``sqlite_pragmas``
+    """
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def _apply_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for name, value in pragmas.items():
+                cursor.execute(f"PRAGMA {name}={value}")
+        finally:
+            cursor.close()
+        install_math_functions(dbapi_connection)
+
+
+async def run_maintenance(engine: AsyncEngine) -> None:
+    """Refresh planner statistics and checkpoint the WAL.
+
+    ``PRAGMA optimize`` only re-analyzes tables whose statistics are stale,
+    so it is cheap to run often. The checkpoint is passive: it copies what
+    it can without waiting on readers or writers.
+
+    Args:
+        engine: SQLite engine
+    """
+    async with engine.connect() as conn:
+        await conn.execute(text("PRAGMA optimize"))
+        await conn.execute(text("PRAGMA wal_checkpoint(PASSIVE)"))
+
+
+async def maintenance_loop(engine: AsyncEngine, interval: float) -> None:
+    """Run ``run_maintenance`` every ``interval`` seconds until cancelled.
+
+    Args:
+        engine: SQLite engine
+        interval: Seconds between runs
+    """
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await run_maintenance(engine)
+        except Exception as e:
+            logger.warning(f"SQLite maintenance failed: {e}")
@@ -0,0 +1,4 @@
+"""ASGI middleware."""
+from .compression import CompressionMiddleware
+
+__all__ = ["CompressionMiddleware"]
@@ -0,0 +1,265 @@
+"""Content-negotiated response compression (gzip, brotli, zstd).
+
+Works like Starlette's GZipMiddleware, but negotiates the encoding from
+``Accept-Encoding`` (honouring q-values) and supports brotli and zstd when
+their optional packages are installed. Streaming responses are compressed
+incrementally and flushed per chunk, so clients keep receiving data as it
+is produced.
+"""
+import zlib
+from typing import Callable, Dict, List, Optional, Protocol, Sequence
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# Content types that are already compressed or must not be buffered
+EXCLUDED_CONTENT_TYPES = (
+    "text/event-stream",
+    "application/vnd.google-earth.kmz",
+    "application/vnd.apache.parquet",
+    "application/zip",
+    "application/gzip",
+    "application/x-gzip",
+    "application/zstd",
+    "image/",
+    "video/",
+    "audio/",
+)
+
+
+class Encoder(Protocol):
+    """Incremental encoder: ``compress`` flushes each chunk, ``finish`` ends the stream."""
+
+    def compress(self, data: bytes) -> bytes:
+        ...
+
+    def finish(self, data: bytes = b"") -> bytes:
+        ...
+
+
+class GzipEncoder:
+    """Incremental gzip encoder."""
+
+    def __init__(self, level: int = 6):
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data) + self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self, data: bytes = b"") -> bytes:
+        return self._compressor.compress(data) + self._compressor.flush(zlib.Z_FINISH)
+
+
+class BrotliEncoder:
+    """Incremental brotli encoder."""
+
+    def __init__(self, level: int = 4):
+        import brotli
+
+        self._compressor = brotli.Compressor(quality=level)
+
+    def compress(self, data: bytes) -> bytes:
+        chunk: bytes = self._compressor.process(data) + self._compressor.flush()
+        return chunk
+
+    def finish(self, data: bytes = b"") -> bytes:
+        chunk: bytes = self._compressor.process(data) + self._compressor.finish()
+        return chunk
+
+
+class ZstdEncoder:
+    """Incremental zstd encoder."""
+
+    def __init__(self, level: int = 3):
+        import zstandard
+
+        self._flush_block = zstandard.COMPRESSOBJ_FLUSH_BLOCK
+        self._compressor = zstandard.ZstdCompressor(level=level).compressobj()
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data) + self._compressor.flush(self._flush_block)
+
+    def finish(self, data: bytes = b"") -> bytes:
+        return self._compressor.compress(data) + self._compressor.flush()
+
+
+ENCODERS: Dict[str, Callable[[], Encoder]] = {
+    "br": BrotliEncoder,
+    "zstd": ZstdEncoder,
+    "gzip": GzipEncoder,
+}
+
+
+def available_encodings(preferred: Sequence[str]) -> List[str]:
+    """Filter encodings to those whose optional packages are installed.
+
+    Args:
+        preferred: Encoding names in server preference order
+
+    Returns:
+        Usable encoding names, preference order kept
+    """
+    usable = []
+    for name in preferred:
+        encoder = ENCODERS.get(name)
+        if encoder is None:
+            continue
+        try:
+            encoder()
+        except ImportError:
+            continue
+        usable.append(name)
+    return usable
+
+
+def negotiate_encoding(accept_encoding: str, supported: Sequence[str]) -> Optional[str]:
+    """Pick a content coding from an Accept-Encoding header.
+
+    The client's highest q-value wins; ties are broken by server
+    preference (the order of ``supported``). ``*`` matches any supported
+    coding not listed explicitly.
+
+    Args:
+        accept_encoding: Raw Accept-Encoding header value
+        supported: Supported codings in server preference order
+
+    Returns:
+        Chosen coding, or None for identity
+    """
+    weights: Dict[str, float] = {}
+    for item in accept_encoding.split(","):
+        name, _, params = item.strip().partition(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        q = 1.0
+        for param in params.split(";"):
+            key, _, value = param.strip().partition("=")
+            if key.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        weights[name] = q
+
+    best = None
+    best_q = 0.0
+    for coding in supported:
+        q = weights.get(coding, weights.get("*", 0.0))
+        if q > best_q:
+            best, best_q = coding, q
+    return best
+
+
+class CompressionMiddleware:
+    """Compress responses with the best encoding the client accepts.
+
+    Responses are left alone when they are smaller than ``minimum_size``,
+    already carry a Content-Encoding, have an excluded (already compressed)
+    content type, or are partial/bodyless (206, 204, 304).
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        encodings: Sequence[str] = ("br", "zstd", "gzip"),
+        excluded_content_types: Sequence[str] = EXCLUDED_CONTENT_TYPES,
+    ) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+        self.encodings = available_encodings(encodings)
+        self.excluded_content_types = tuple(excluded_content_types)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        headers = Headers(scope=scope)
+        encoding = negotiate_encoding(headers.get("accept-encoding", ""), self.encodings)
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        responder = _CompressionResponder(self, encoding, send)
+        await self.app(scope, receive, responder.send)
+
+
+class _CompressionResponder:
+    """Per-request state: decides on the first body chunk, then encodes."""
+
+    def __init__(self, middleware: CompressionMiddleware, encoding: str, send: Send):
+        self.middleware = middleware
+        self.encoding = encoding
+        self._send = send
+        self.initial_message: Message = {}
+        self.started = False
+        self.passthrough = False
+        self.encoder: Optional[Encoder] = None
+
+    def _should_skip(self, headers: Headers, status: int) -> bool:
+        if status in (204, 206, 304) or status < 200:
+            return True
+        if "content-encoding" in headers:
+            return True
+        return headers.get("content-type", "").startswith(self.middleware.excluded_content_types)
+
+    async def send(self, message: Message) -> None:
+        message_type = message["type"]
+        if message_type == "http.response.start":
+            # Hold the start message until the first body chunk decides the headers
+            self.initial_message = message
+            headers = Headers(raw=message["headers"])
+            self.passthrough = self._should_skip(headers, message["status"])
+            return
+
+        if message_type != "http.response.body":
+            if not self.started:
+                self.started = True
+                await self._send(self.initial_message)
+            await self._send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if not self.started:
+            self.started = True
+            headers = MutableHeaders(raw=self.initial_message["headers"])
+            if not self.passthrough:
+                headers.add_vary_header("Accept-Encoding")
+            if self.passthrough or (not more_body and len(body) < self.middleware.minimum_size):
+                self.passthrough = True
+                await self._send(self.initial_message)
+                await self._send(message)
+                return
+
+            self.encoder = ENCODERS[self.encoding]()
+            headers["Content-Encoding"] = self.encoding
+            # The encoded bytes differ from the identity representation, so a
+            # strong validator would be wrong; weak comparison still matches
+            etag = headers.get("etag")
+            if etag and not etag.startswith("W/"):
+                headers["ETag"] = f"W/{etag}"
+            if "content-length" in headers:
+                del headers["Content-Length"]
+            # Byte ranges (e.g. from FileResponse) address the identity bytes,
+            # not the encoded body; Range requests get an unencoded 206 instead
+            if "accept-ranges" in headers:
+                del headers["Accept-Ranges"]
+            if not more_body:
+                body = self.encoder.finish(body)
+                headers["Content-Length"] = str(len(body))
+            else:
+                body = self.encoder.compress(body)
+            await self._send(self.initial_message)
+            await self._send({"type": "http.response.body", "body": body, "more_body": more_body})
+            return
+
+        if self.passthrough or self.encoder is None:
+            await self._send(message)
+            return
+
+        body = self.encoder.finish(body) if not more_body else self.encoder.compress(body)
+        await self._send({"type": "http.response.body", "body": body, "more_body": more_body})
@@ -1,6 +1,7 @@
 """Models package"""
 from src.models.base import BaseModel
 from src.models.collection import Collection
+from src.models.data_generation import DataGeneration
 from src.models.photo import Photo, PhotoMetadata
 from src.models.gps_location import GPSLocation
 from src.models.photo_marker import PhotoMarker
@@ -8,9 +9,9 @@ from src.models.photo_marker import PhotoMarker
 __all__ = [
     "BaseModel",
     "Collection",
+    "DataGeneration",
     "Photo",
     "PhotoMetadata",
     "GPSLocation",
     "PhotoMarker",
 ]
-
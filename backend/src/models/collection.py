@@ -1,7 +1,8 @@
 """Collection model."""
-from typing import List, Optional, TYPE_CHECKING
+from datetime import datetime
+from typing import Dict, List, Optional, TYPE_CHECKING
 
-from sqlalchemy import String, Text, Integer
+from sqlalchemy import JSON, DateTime, Float, Index, String, Text, Integer
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.models.base import BaseModel
@@ -19,18 +20,44 @@ class Collection(BaseModel):
     """
 
     __tablename__ = "collections"
+    __table_args__ = (
+        # Keyset pagination sort key
+        Index("ix_collections_created_at_id", "created_at", "id"),
+    )
 
     name: Mapped[str] = mapped_column(String(255), nullable=False, index=True)
     description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+
+    # Summary of the collection's photos, folded in by the importer in each
+    # photo's transaction (CollectionManager.record_photo) so listings and
+    # "zoom to collection" need no scan. Bounds and capture span are NULL
+    # while the collection has no photos.
     total_photos: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    min_latitude: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    max_latitude: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    min_longitude: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    max_longitude: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    first_captured_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    last_captured_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    camera_models: Mapped[List[str]] = mapped_column(JSON, default=list, nullable=False)
+    total_distance_meters: Mapped[float] = mapped_column(Float, default=0.0, nullable=False)
 
     # Relationships
     photos: Mapped[List["Photo"]] = relationship(
-        "Photo", back_populates="collection", cascade="all, delete-orphan"
+        "Photo", back_populates="collection", cascade="all, delete-orphan", passive_deletes=True
     )
     # flights: Mapped[List["Flight"]] = relationship(
     #     "Flight", back_populates="collection", cascade="all, delete-orphan"
     # )
 
+    @property
+    def bounds(self) -> Optional[Dict[str, float]]:
+        """Bounding box of the photos, or None while there are none."""
+        north, south = self.max_latitude, self.min_latitude
+        east, west = self.max_longitude, self.min_longitude
+        if north is None or south is None or east is None or west is None:
+            return None
+        return {"north": north, "south": south, "east": east, "west": west}
+
     def __repr__(self) -> str:
         return f"<Collection {self.name}>"
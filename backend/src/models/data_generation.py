@@ -0,0 +1,23 @@
+"""Data generation counter model."""
+from sqlalchemy import Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.models.base import BaseModel
+
+
+class DataGeneration(BaseModel):
+    """Monotonic counter bumped whenever photo data changes.
+
+    Caches derived from photo data (export artifacts, totals) fold the
+    generation into their keys, so a bump invalidates them without having to
+    enumerate entries. There is one row per scope: ``global`` plus one per
+    collection (``collection:<id>``).
+    """
+
+    __tablename__ = "data_generations"
+
+    scope: Mapped[str] = mapped_column(String(64), unique=True, nullable=False)
+    generation: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+
+    def __repr__(self) -> str:
+        return f"<DataGeneration {self.scope}={self.generation}>"
@@ -1,9 +1,10 @@
 """Photo and PhotoMetadata models."""
 from datetime import datetime
+from itertools import chain
 from typing import Optional, TYPE_CHECKING
 
-from sqlalchemy import DateTime, Float, ForeignKey, Integer, String
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy import DateTime, Float, ForeignKey, Index, Integer, String, event
+from sqlalchemy.orm import Mapped, Session, mapped_column, relationship
 
 from src.models.base import BaseModel
 
@@ -15,14 +16,32 @@ class Photo(BaseModel):
     """Photo model representing an image file."""
 
     __tablename__ = "photos"
+    __table_args__ = (
+        # Collection listings and flight lookups walk a collection in
+        # capture order; also serves collection_id lookups and cascades.
+        # The position columns make map and track reads index-only.
+        Index(
+            "ix_photos_collection_track", "collection_id", "timestamp", "id", "latitude", "longitude", "altitude"
+        ),
+        # Keyset pagination sort key; also serves date range filters
+        Index("ix_photos_track", "timestamp", "id", "latitude", "longitude", "altitude"),
+        # Bounding box filters (latitude range, then longitude)
+        Index("ix_photos_lat_lon", "latitude", "longitude"),
+    )
 
     filename: Mapped[str] = mapped_column(String(255), nullable=False, index=True)
     file_path: Mapped[str] = mapped_column(String(1024), nullable=False, unique=True)
     file_hash: Mapped[str] = mapped_column(String(64), nullable=False, index=True)  # SHA-256 hash
-    timestamp: Mapped[datetime] = mapped_column(DateTime, nullable=False, index=True)
+    timestamp: Mapped[datetime] = mapped_column(DateTime, nullable=False)
     file_size: Mapped[int] = mapped_column(Integer, nullable=False)  # in bytes
     format: Mapped[str] = mapped_column(String(10), nullable=False)  # jpg, png, etc.
-    
+
+    # Copy of the metadata position, so hot reads skip the photo_metadata
+    # join. NULL when the photo has no metadata; kept in sync on flush.
+    latitude: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    longitude: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    altitude: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+
     collection_id: Mapped[str] = mapped_column(
         String(36), ForeignKey("collections.id", ondelete="CASCADE"), nullable=False
     )
@@ -30,7 +49,7 @@ class Photo(BaseModel):
     # Relationships
     collection: Mapped["Collection"] = relationship("Collection", back_populates="photos")
     metadata_: Mapped[Optional["PhotoMetadata"]] = relationship(
-        "PhotoMetadata", back_populates="photo", uselist=False, cascade="all, delete-orphan"
+        "PhotoMetadata", back_populates="photo", uselist=False, cascade="all, delete-orphan", passive_deletes=True
     )
 
     def __repr__(self) -> str:
@@ -51,6 +70,10 @@ class PhotoMetadata(BaseModel):
     shutter_speed: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)
     aperture: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)
 
+    # Along-track distance (meters) from the first photo of the flight,
+    # maintained on insert so range distances are a simple difference.
+    cumulative_distance: Mapped[float] = mapped_column(Float, default=0.0, nullable=False)
+
     photo_id: Mapped[str] = mapped_column(
         String(36), ForeignKey("photos.id", ondelete="CASCADE"), nullable=False, unique=True
     )
@@ -60,3 +83,18 @@ class PhotoMetadata(BaseModel):
 
     def __repr__(self) -> str:
         return f"<PhotoMetadata {self.latitude}, {self.longitude}>"
+
+
+@event.listens_for(Session, "before_flush")
+def _sync_photo_position(session, flush_context, instances) -> None:
+    """Copy new or changed metadata positions onto their photos.
+
+    Covers metadata attached through ``Photo.metadata_``; writers that
+    only set ``photo_id`` (the importer) set the photo's position
+    themselves.
+    """
+    for obj in chain(session.new, session.dirty):
+        if isinstance(obj, PhotoMetadata):
+            photo = obj.__dict__.get("photo")  # never lazy-load inside a flush
+            if photo is not None:
+                photo.latitude, photo.longitude, photo.altitude = obj.latitude, obj.longitude, obj.altitude
@@ -44,7 +44,11 @@ class APIResponse(PydanticBaseModel, Generic[T]):
 class PaginatedResponse(PydanticBaseModel, Generic[T]):
     """Generic paginated response wrapper.
 
-    Used for endpoints that return collections of items.
+    Used for endpoints that return collections of items. ``total`` is a
+    ``COUNT(*)`` under the listing's filters (an estimate when the client
+    asks for an approximate count). ``next_cursor`` is an opaque token to
+    pass back as ``cursor`` for the next page; it is null on the last page.
+    ``page`` is only known for offset paging and is null for cursor pages.
 
     Example:
         {
@@ -53,16 +57,18 @@ class PaginatedResponse(PydanticBaseModel, Generic[T]):
             "total": 100,
             "page": 1,
             "page_size": 20,
-            "total_pages": 5
+            "total_pages": 5,
+            "next_cursor": "WyIyMDIzLTAxLTE1VDEwOjAwOjAwIiwiYWJjIl0"
         }
     """
 
     success: bool = True
     data: list[T] = []
     total: int = 0
-    page: int = 1
+    page: int | None = 1
     page_size: int = 20
     total_pages: int = 1
+    next_cursor: str | None = None
 
 
 class HealthCheck(PydanticBaseModel):
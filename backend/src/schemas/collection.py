@@ -1,9 +1,11 @@
 """Pydantic schemas for Collection."""
-from typing import Optional
+from datetime import datetime
+from typing import List, Optional
 
 from pydantic import Field
 
 from src.schemas.base import BaseSchema
+from src.schemas.photo import Bounds
 
 
 class CollectionBase(BaseSchema):
@@ -22,6 +24,16 @@ class CollectionUpdate(CollectionBase):
     name: Optional[str] = Field(None, min_length=1, max_length=255)
 
 
+class CollectionMergeRequest(BaseSchema):
+    """Request schema for merging another collection into this one."""
+    source_id: str = Field(..., description="Collection whose photos are moved here; it is deleted afterwards")
+
+
 class CollectionResponse(CollectionBase):
     """Properties to return to client."""
     total_photos: int = 0
+    bounds: Optional[Bounds] = None
+    first_captured_at: Optional[datetime] = None
+    last_captured_at: Optional[datetime] = None
+    camera_models: List[str] = []
+    total_distance_meters: float = 0.0
@@ -1,13 +1,17 @@
 from typing import List, Optional
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from datetime import datetime
 
+from src.schemas.photo import Bounds
+
+
 class ExportRequest(BaseModel):
     format: str
     photo_ids: Optional[List[str]] = None
     date_start: Optional[datetime] = None
     date_end: Optional[datetime] = None
-    # We might want to support bounding box here too, but let's start simple or match filter schema
+    bounds: Optional[Bounds] = None
+
 
 class ExportResponse(BaseModel):
     filename: str
@@ -16,3 +20,16 @@ class ExportResponse(BaseModel):
                # Actually, for file download, we might return a stream, 
                # but the service might return the content or a path.
                # Let's assume the service returns the content string/bytes.
+
+
+class ExportJobResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: str
+    format: str
+    status: str
+    rows_written: int
+    bytes_written: int
+    error: Optional[str] = None
+    created_at: datetime
+    finished_at: Optional[datetime] = None
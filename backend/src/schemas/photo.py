@@ -2,7 +2,7 @@
 from datetime import datetime
 from typing import Optional, List
 
-from pydantic import Field
+from pydantic import BaseModel as PydanticBaseModel, Field
 
 from src.schemas.base import BaseSchema
 
@@ -16,6 +16,7 @@ class PhotoMetadataBase(BaseSchema):
     iso: Optional[int] = None
     shutter_speed: Optional[str] = None
     aperture: Optional[str] = None
+    cumulative_distance: Optional[float] = None
 
 
 class PhotoBase(BaseSchema):
@@ -48,8 +49,19 @@ class ImportStats(BaseSchema):
     errors: List[str]
 
 
-class Bounds(BaseSchema):
-    """Geographic bounds."""
+class PhotoMoveRequest(BaseSchema):
+    """Request schema for moving photos to another collection."""
+    photo_ids: List[str] = Field(..., min_length=1)
+    collection_id: str
+
+
+class PhotoPruneRequest(BaseSchema):
+    """Request schema for pruning photos whose files are gone."""
+    collection_id: Optional[str] = Field(None, description="Only check this collection")
+
+
+class Bounds(PydanticBaseModel):
+    """Geographic bounds (a plain value, without the entity fields of ``BaseSchema``)."""
     north: float
     south: float
     east: float
@@ -61,3 +73,5 @@ class PhotoFilterRequest(BaseSchema):
     date_start: Optional[datetime] = None
     date_end: Optional[datetime] = None
     bounds: Optional[Bounds] = None
+    limit: Optional[int] = Field(None, ge=1, description="Page size, capped at PHOTO_FILTER_MAX_PAGE_SIZE")
+    cursor: Optional[str] = Field(None, description="next_cursor of the previous page")
@@ -1,11 +1,12 @@
 """Base service class providing common database operations."""
 from typing import Any, Generic, TypeVar, Optional
 
-from sqlalchemy import select
+from sqlalchemy import lambda_stmt, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.exceptions import NotFoundError
 from src.models.base import BaseModel
+from src.utils.pagination import count_query, count_stmt, estimate_rows
 
 ModelT = TypeVar("ModelT", bound=BaseModel)
 CreateSchemaT = TypeVar("CreateSchemaT")
@@ -49,7 +50,9 @@ class BaseService(Generic[ModelT, CreateSchemaT, UpdateSchemaT]):
         Returns:
             Model instance or None if not found
         """
-        query = select(self.model).where(self.model.id == item_id)
+        model = self.model
+        # Cached per model; item_id is a bound parameter
+        query = lambda_stmt(lambda: select(model).where(model.id == item_id))
         result = await self.db.execute(query)
         return result.scalar_one_or_none()
 
@@ -80,9 +83,10 @@ class BaseService(Generic[ModelT, CreateSchemaT, UpdateSchemaT]):
         Returns:
             List of model instances
         """
-        query = select(self.model).offset(skip).limit(limit)
+        model = self.model
+        query = lambda_stmt(lambda: select(model).offset(skip).limit(limit))
         result = await self.db.execute(query)
-        return result.scalars().all()
+        return list(result.scalars().all())
 
     async def create(self, obj_in: CreateSchemaT) -> ModelT:
         """Create new item.
@@ -146,15 +150,26 @@ class BaseService(Generic[ModelT, CreateSchemaT, UpdateSchemaT]):
         await self.delete(item)
         return True
 
-    async def count(self) -> int:
+    async def count(self, *clauses: Any, approximate: bool = False) -> int:
         """Get total count of items.
 
+        Args:
+            *clauses: Optional filter expressions
+            approximate: Estimate unfiltered counts from planner statistics
+                instead of counting (falls back to an exact count)
+
         Returns:
-            Total number of items in table
+            Number of matching items
         """
-        query = select(self.model)
-        result = await self.db.execute(query)
-        return len(result.scalars().all())
+        if approximate and not clauses:
+            estimate = await estimate_rows(self.db, self.model.__tablename__)
+            if estimate is not None:
+                return estimate
+        if clauses:
+            result = await self.db.execute(count_query(self.model, *clauses))
+        else:
+            result = await self.db.execute(count_stmt(self.model))
+        return result.scalar_one()
 
     async def commit(self) -> None:
         """Commit database transaction.
@@ -0,0 +1,261 @@
+"""Set-based bulk operations on collections and photos.
+
+Deleting a collection through the ORM cascade would load every Photo and
+PhotoMetadata into the session and delete them one by one. These
+operations run as plain DELETE/UPDATE statements instead, each touching at
+most ``BULK_CHUNK_SIZE`` photos and committed on its own so the write lock
+is only held briefly. Photo metadata goes with its photo through
+``ON DELETE CASCADE``.
+
+Once the rows have changed, the flight distances of every affected
+collection are recomputed in SQL from the earliest changed photo on, its
+summary is adjusted by the moved or deleted photos, and its data generation
+bumped, which invalidates the cached totals, series and exports derived
+from it. Deleting photos also reclusters the map markers, if any were
+generated, since they count the photos at each location.
+"""
+import asyncio
+import logging
+import os
+from typing import Callable, Dict, List, Optional, Sequence, cast
+
+from sqlalchemy import CursorResult, delete, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.config import get_settings
+from src.exceptions import ValidationError
+from src.models.collection import Collection
+from src.models.photo import Photo
+from src.models.photo_marker import PhotoMarker
+from src.services.collection_manager import CollectionManager, SummaryDelta
+from src.services.flight_service import FlightService
+from src.services.generation import bump_generation
+from src.services.location_service import LocationService
+
+logger = logging.getLogger(__name__)
+
+
+def _missing_files(rows: Sequence) -> List[str]:
+    """Ids of the ``(id, file_path)`` rows whose file does not exist."""
+    return [row.id for row in rows if not os.path.exists(row.file_path)]
+
+
+def _fold(deltas: Dict[str, SummaryDelta], changed: Dict[str, SummaryDelta]) -> None:
+    """Accumulate per-collection deltas across chunks."""
+    for collection_id, delta in changed.items():
+        deltas.setdefault(collection_id, SummaryDelta()).fold(delta)
+
+
+class BulkService:
+    """Service for deleting, moving and pruning photos in bulk.
+
+    Every method commits; callers must not hold other pending changes on
+    the session.
+    """
+
+    def __init__(self, session: AsyncSession, chunk_size: Optional[int] = None):
+        self.session = session
+        self.chunk_size = chunk_size or get_settings().BULK_CHUNK_SIZE
+        self.collection_manager = CollectionManager(session)
+        self.flight_service = FlightService(session)
+
+    async def delete_collection(self, collection_id: str) -> int:
+        """Delete a collection with all its photos.
+
+        Args:
+            collection_id: UUID of the collection
+
+        Returns:
+            Number of photos deleted
+
+        Raises:
+            NotFoundError: If collection does not exist
+        """
+        await self.collection_manager.get_collection(collection_id)
+
+        deleted = await self._in_chunks(
+            lambda chunk: delete(Photo).where(Photo.id.in_(chunk)),
+            Photo.collection_id == collection_id,
+        )
+        await self.session.execute(
+            delete(Collection).where(Collection.id == collection_id).execution_options(synchronize_session=False)
+        )
+        await bump_generation(self.session, collection_id)
+        await self.session.commit()
+
+        if deleted:
+            await self._recluster()
+        logger.info(f"Deleted collection {collection_id} with {deleted} photos")
+        return deleted
+
+    async def move_photos(self, photo_ids: List[str], collection_id: str) -> int:
+        """Move photos into another collection.
+
+        Args:
+            photo_ids: Photos to move; ids that do not exist or are already
+                in the target are ignored
+            collection_id: Target collection
+
+        Returns:
+            Number of photos moved
+
+        Raises:
+            NotFoundError: If the target collection does not exist
+        """
+        await self.collection_manager.get_collection(collection_id)
+
+        moved = 0
+        removed: Dict[str, SummaryDelta] = {}
+        for start in range(0, len(photo_ids), self.chunk_size):
+            end = start + self.chunk_size
+            chunk = Photo.id.in_(photo_ids[start:end])
+            not_there = Photo.collection_id != collection_id
+            _fold(removed, await self.collection_manager.summarize_photos(chunk, not_there))
+            result = cast(
+                CursorResult,
+                await self.session.execute(
+                    update(Photo)
+                    .where(chunk, not_there)
+                    .values(collection_id=collection_id)
+                    .execution_options(synchronize_session=False)
+                ),
+            )
+            await self.session.commit()
+            moved += result.rowcount
+
+        if moved:
+            added = SummaryDelta()
+            for source_id, delta in sorted(removed.items()):
+                added.fold(delta)
+                await self._photos_removed(source_id, delta)
+            await self._photos_added(collection_id, added)
+        return moved
+
+    async def merge_collections(self, source_id: str, target_id: str) -> int:
+        """Move every photo of one collection into another and delete the source.
+
+        Args:
+            source_id: Collection to merge (deleted afterwards)
+            target_id: Collection that receives the photos
+
+        Returns:
+            Number of photos moved
+
+        Raises:
+            ValidationError: If source and target are the same collection
+            NotFoundError: If either collection does not exist
+        """
+        if source_id == target_id:
+            raise ValidationError("Cannot merge a collection into itself", error_code="INVALID_MERGE")
+        source = await self.collection_manager.get_collection(source_id)
+        await self.collection_manager.get_collection(target_id)
+        # Every photo of the source moves, so its stored summary is the delta
+        added = SummaryDelta.of_collection(source)
+
+        moved = await self._in_chunks(
+            lambda chunk: update(Photo).where(Photo.id.in_(chunk)).values(collection_id=target_id),
+            Photo.collection_id == source_id,
+        )
+        await self.session.execute(
+            delete(Collection).where(Collection.id == source_id).execution_options(synchronize_session=False)
+        )
+        await bump_generation(self.session, source_id)
+        await self.session.commit()
+
+        if moved:
+            await self._photos_added(target_id, added)
+        logger.info(f"Merged collection {source_id} into {target_id} ({moved} photos)")
+        return moved
+
+    async def prune_missing_photos(self, collection_id: Optional[str] = None) -> int:
+        """Delete photos whose files no longer exist on disk.
+
+        Photos are checked in ``id`` order, one chunk at a time; each
+        chunk's missing photos are deleted in a single statement.
+
+        Args:
+            collection_id: Only check this collection; all photos when None
+
+        Returns:
+            Number of photos deleted
+
+        Raises:
+            NotFoundError: If the collection does not exist
+        """
+        if collection_id is not None:
+            await self.collection_manager.get_collection(collection_id)
+
+        query = select(Photo.id, Photo.file_path).order_by(Photo.id).limit(self.chunk_size)
+        if collection_id is not None:
+            query = query.where(Photo.collection_id == collection_id)
+
+        pruned = 0
+        removed: Dict[str, SummaryDelta] = {}
+        last_id = None
+        while True:
+            page = query if last_id is None else query.where(Photo.id > last_id)
+            rows = (await self.session.execute(page)).all()
+            if not rows:
+                break
+            last_id = rows[-1].id
+            # Stat the files off the event loop, one chunk at a time
+            missing = await asyncio.to_thread(_missing_files, rows)
+            if missing:
+                gone = Photo.id.in_(missing)
+                _fold(removed, await self.collection_manager.summarize_photos(gone))
+                await self.session.execute(delete(Photo).where(gone).execution_options(synchronize_session=False))
+                await self.session.commit()
+                pruned += len(missing)
+
+        for affected_id, delta in sorted(removed.items()):
+            await self._photos_removed(affected_id, delta)
+        if pruned:
+            await self._recluster()
+        logger.info(f"Pruned {pruned} photos with missing files")
+        return pruned
+
+    async def _in_chunks(self, statement: Callable, *clauses) -> int:
+        """Apply a statement to the photos matching ``clauses``, a chunk at a time.
+
+        The statement must take the photos out of the selection (delete
+        them or change the filtered column), or this never terminates.
+
+        Args:
+            statement: Builds the DELETE/UPDATE for a chunk's id subquery
+            *clauses: Filter expressions selecting the photos
+
+        Returns:
+            Number of photos affected
+        """
+        total = 0
+        while True:
+            chunk = select(Photo.id).where(*clauses).limit(self.chunk_size)
+            result = cast(
+                CursorResult, await self.session.execute(statement(chunk).execution_options(synchronize_session=False))
+            )
+            await self.session.commit()
+            if not result.rowcount:
+                return total
+            total += result.rowcount
+
+    async def _photos_added(self, collection_id: str, delta: SummaryDelta) -> None:
+        """Update the track and summary of a collection that received photos."""
+        since = delta.extremes["first_captured_at"]
+        total = await self.flight_service.rebuild_cumulative_distances(collection_id, since)
+        await self.collection_manager.add_photos(collection_id, delta, total)
+        await bump_generation(self.session, collection_id)
+        await self.session.commit()
+
+    async def _photos_removed(self, collection_id: str, delta: SummaryDelta) -> None:
+        """Update the track and summary of a collection that lost photos."""
+        since = delta.extremes["first_captured_at"]
+        total = await self.flight_service.rebuild_cumulative_distances(collection_id, since)
+        await self.collection_manager.remove_photos(collection_id, delta, total)
+        await bump_generation(self.session, collection_id)
+        await self.session.commit()
+
+    async def _recluster(self) -> None:
+        """Regenerate the map markers after photos were deleted, if there are any."""
+        markers = await self.session.execute(select(PhotoMarker.id).limit(1))
+        if markers.first() is not None:
+            await LocationService(self.session).regenerate_markers()
@@ -0,0 +1,213 @@
+"""In-process cache for service reads.
+
+Markers, collections and flight statistics only change when photos are
+imported, moved or deleted, or markers are reclustered, yet every request
+used to recompute them. ``ServiceCache`` is a small LRU with a TTL whose
+entries are tagged with the data generation they were computed at (see
+``src.services.generation``): a lookup at a newer generation is a miss, so
+every write path that bumps the generation invalidates the entries that
+depend on it, in every worker process. The TTL only bounds how long an
+entry can be served if the data changes without a generation bump.
+
+Generations commit together with the data they describe, so a value
+loaded after reading generation ``g`` is never older than ``g``.
+
+Concurrent misses on the same key share one load instead of all querying
+the database. Caches are registered by name and report hit, miss,
+eviction and expiry counts through ``cache_stats``.
+"""
+import asyncio
+import functools
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple, Union
+
+from pydantic import BaseModel
+
+from src.config import get_settings
+from src.services.generation import GLOBAL_SCOPE, get_generation
+
+# Entries per cache unless the cache is registered with its own size
+DEFAULT_CACHE_SIZE = 1024
+
+
+class ServiceCache:
+    """Async LRU/TTL cache of values tagged with a data generation.
+
+    Values are shared between requests and must not be mutated by callers;
+    cache plain data (dicts, lists, tuples), never ORM objects, which are
+    bound to the session that loaded them.
+    """
+
+    def __init__(self, name: str, maxsize: int, ttl_seconds: float):
+        self.name = name
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[Hashable, Tuple[int, float, Any]]" = OrderedDict()
+        self._loading: Dict[Tuple[Hashable, int], asyncio.Future] = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    async def get_or_load(self, key: Hashable, generation: int, load: Callable[[], Awaitable[Any]]) -> Any:
+        """Return the cached value for ``key``, loading it on a miss.
+
+        Args:
+            key: Hashable cache key
+            generation: Current data generation of the value's scope
+            load: Computes the value; only called on a miss
+
+        Returns:
+            The cached or freshly loaded value
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            entry_generation, expires_at, value = entry
+            if entry_generation == generation and expires_at > time.monotonic():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return value
+            del self._entries[key]
+            if entry_generation != generation:
+                self.invalidations += 1
+            else:
+                self.expirations += 1
+        self.misses += 1
+
+        loading_key = (key, generation)
+        while (pending := self._loading.get(loading_key)) is not None:
+            try:
+                return await asyncio.shield(pending)
+            except asyncio.CancelledError:
+                # Re-raise our own cancellation; take over the load if the
+                # request that started it was cancelled instead
+                if not pending.cancelled():
+                    raise
+
+        future = asyncio.get_running_loop().create_future()
+        self._loading[loading_key] = future
+        try:
+            value = await load()
+        except BaseException as exc:
+            if isinstance(exc, asyncio.CancelledError):
+                future.cancel()
+            else:
+                future.set_exception(exc)
+                # Waiters receive the error; do not warn when there are none
+                future.exception()
+            raise
+        else:
+            future.set_result(value)
+            self._store(key, generation, value)
+            return value
+        finally:
+            del self._loading[loading_key]
+
+    def _store(self, key: Hashable, generation: int, value: Any) -> None:
+        self._entries[key] = (generation, time.monotonic() + self.ttl_seconds, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        """Drop every entry (counters are kept)."""
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and occupancy of this cache."""
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "invalidations": self.invalidations,
+        }
+
+
+_caches: Dict[str, ServiceCache] = {}
+
+
+def get_service_cache(name: str, maxsize: int = DEFAULT_CACHE_SIZE) -> Optional[ServiceCache]:
+    """Get the named cache, creating it on first use.
+
+    Args:
+        name: Cache name, reported by ``cache_stats``
+        maxsize: Maximum number of entries
+
+    Returns:
+        The cache, or None when ``SERVICE_CACHE_ENABLED`` is off
+    """
+    settings = get_settings()
+    if not settings.SERVICE_CACHE_ENABLED:
+        return None
+    cache = _caches.get(name)
+    if cache is None:
+        cache = _caches[name] = ServiceCache(name, maxsize, settings.SERVICE_CACHE_TTL_SECONDS)
+    return cache
+
+
+def cache_stats() -> Dict[str, Dict[str, Any]]:
+    """Metrics of every cache used so far, by name."""
+    return {name: cache.stats() for name, cache in sorted(_caches.items())}
+
+
+def clear_caches() -> None:
+    """Drop the entries of every cache."""
+    for cache in _caches.values():
+        cache.clear()
+
+
+def _freeze(value: Any) -> Hashable:
+    """Turn a call argument into a hashable key component."""
+    if isinstance(value, BaseModel):
+        value = value.model_dump()
+    if isinstance(value, dict):
+        return tuple(sorted((name, _freeze(item)) for name, item in value.items()))
+    if isinstance(value, (list, tuple, set)):
+        return tuple(_freeze(item) for item in value)
+    key: Hashable = value
+    return key
+
+
+def cached(
+    name: str,
+    scope: Union[str, Callable[..., str]] = GLOBAL_SCOPE,
+    maxsize: int = DEFAULT_CACHE_SIZE,
+) -> Callable:
+    """Cache an async service method per arguments and data generation.
+
+    The method's instance must have a ``session``, which is used to read
+    the current generation of ``scope``. Arguments must be hashable or
+    plain data (dicts, lists, Pydantic models). Exceptions are not cached.
+
+    Args:
+        name: Cache name
+        scope: Generation scope the result depends on, or a function
+            called with the method's arguments that returns it
+        maxsize: Maximum number of entries
+
+    Returns:
+        Decorator for the method
+    """
+
+    def decorator(method: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+        @functools.wraps(method)
+        async def wrapper(self, *args: Any, **kwargs: Any) -> Any:
+            cache = get_service_cache(name, maxsize)
+            if cache is None:
+                return await method(self, *args, **kwargs)
+
+            generation = await get_generation(self.session, scope(*args, **kwargs) if callable(scope) else scope)
+            key = (method.__qualname__, _freeze(args), _freeze(kwargs))
+            return await cache.get_or_load(key, generation, lambda: method(self, *args, **kwargs))
+
+        return wrapper
+
+    return decorator
@@ -1,15 +1,74 @@
 """Service for managing photo collections."""
 import logging
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Set, Tuple
 
-from sqlalchemy import select, desc
+from sqlalchemy import func, lambda_stmt, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.models.collection import Collection
+from src.models.photo import Photo, PhotoMetadata
 from src.exceptions import NotFoundError
+from src.schemas.collection import CollectionResponse
+from src.services.cache import cached
+from src.services.generation import bump_generation, collection_scope
+from src.utils.pagination import count_query, estimate_rows, keyset_page, keyset_query
 
 logger = logging.getLogger(__name__)
 
+# Keyset pagination sort key (newest first)
+COLLECTION_SORT_KEY = (Collection.created_at, Collection.id)
+
+
+# Summary columns kept as a running min/max, with the photo column each tracks
+SUMMARY_EXTREMES = {
+    "min_latitude": (Photo.latitude, min),
+    "max_latitude": (Photo.latitude, max),
+    "min_longitude": (Photo.longitude, min),
+    "max_longitude": (Photo.longitude, max),
+    "first_captured_at": (Photo.timestamp, min),
+    "last_captured_at": (Photo.timestamp, max),
+}
+_AGGREGATES: Dict[Any, Any] = {min: func.min, max: func.max}
+
+
+def _widen(current: Optional[Any], value: Any, pick=min) -> Any:
+    """Fold a value into a running min/max that may still be unset."""
+    if value is None:
+        return current
+    return value if current is None else pick(current, value)
+
+
+class SummaryDelta:
+    """Summary of a set of photos entering or leaving a collection.
+
+    Attributes:
+        photos: Number of photos
+        extremes: Value per ``SUMMARY_EXTREMES`` column, None when unknown
+        camera_models: Camera models of the photos
+    """
+
+    def __init__(self, photos: int = 0, extremes: Optional[Dict[str, Any]] = None,
+                 camera_models: Optional[Set[str]] = None):
+        self.photos = photos
+        self.extremes = extremes or dict.fromkeys(SUMMARY_EXTREMES)
+        self.camera_models = camera_models or set()
+
+    @classmethod
+    def of_collection(cls, collection: Collection) -> "SummaryDelta":
+        """The delta of every photo in a collection, from its stored summary."""
+        return cls(
+            collection.total_photos,
+            {name: getattr(collection, name) for name in SUMMARY_EXTREMES},
+            set(collection.camera_models),
+        )
+
+    def fold(self, other: "SummaryDelta") -> None:
+        """Add another delta's photos to this one."""
+        self.photos += other.photos
+        for name, (_, pick) in SUMMARY_EXTREMES.items():
+            self.extremes[name] = _widen(self.extremes[name], other.extremes[name], pick)
+        self.camera_models |= other.camera_models
+
 
 class CollectionManager:
     """Service for managing collections."""
@@ -29,6 +88,8 @@ class CollectionManager:
         """
         collection = Collection(name=name, description=description)
         self.session.add(collection)
+        # Invalidates the cached collection lists
+        await bump_generation(self.session)
         await self.session.commit()
         await self.session.refresh(collection)
         logger.info(f"Created collection: {collection.name} ({collection.id})")
@@ -46,43 +107,276 @@ class CollectionManager:
         Raises:
             NotFoundError: If collection does not exist
         """
-        query = select(Collection).where(Collection.id == collection_id)
+        # Cached statement; collection_id is a bound parameter
+        query = lambda_stmt(lambda: select(Collection).where(Collection.id == collection_id))
         result = await self.session.execute(query)
-        collection = result.scalar_one_or_none()
+        collection: Optional[Collection] = result.scalar_one_or_none()
 
         if not collection:
             raise NotFoundError(f"Collection not found: {collection_id}")
 
         return collection
 
+    @cached("collections", scope=collection_scope)
+    async def read_collection(self, collection_id: str) -> Dict[str, Any]:
+        """Get a collection shaped like ``CollectionResponse``.
+
+        Cached until the collection's data generation changes; use
+        ``get_collection`` for a Collection to modify.
+
+        Args:
+            collection_id: UUID of the collection
+
+        Returns:
+            Collection response dict
+
+        Raises:
+            NotFoundError: If collection does not exist
+        """
+        return CollectionResponse.model_validate(await self.get_collection(collection_id)).model_dump()
+
+    @cached("collections")
     async def list_collections(
-        self, skip: int = 0, limit: int = 100
-    ) -> List[Collection]:
-        """List collections with pagination.
+        self, skip: int = 0, limit: int = 100, cursor: Optional[str] = None
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """List collections, newest first.
+
+        Pages are keyset-paginated on ``(created_at, id)``; ``skip`` is
+        still honoured for small offset-based lists.
 
         Args:
             skip: Number of records to skip
             limit: Maximum number of records to return
+            cursor: Cursor from the previous page
 
         Returns:
-            List of Collection objects
+            The page of collections, shaped like ``CollectionResponse``,
+            and the next page's cursor
         """
-        query = (
-            select(Collection)
-            .order_by(desc(Collection.created_at))
-            .offset(skip)
-            .limit(limit)
-        )
+        query = keyset_query(select(Collection), COLLECTION_SORT_KEY, cursor, limit, descending=True)
+        if skip and not cursor:
+            query = query.offset(skip)
         result = await self.session.execute(query)
-        return list(result.scalars().all())
+        collections, next_cursor = keyset_page(result.scalars().all(), limit, lambda c: (c.created_at, c.id))
+        return [CollectionResponse.model_validate(c).model_dump() for c in collections], next_cursor
+
+    @cached("collections")
+    async def count_collections(self, approximate: bool = False) -> int:
+        """Count collections with ``SELECT COUNT(*)``.
+
+        Args:
+            approximate: Use planner statistics when available
+
+        Returns:
+            Number of collections
+        """
+        if approximate:
+            estimate = await estimate_rows(self.session, Collection.__tablename__)
+            if estimate is not None:
+                return estimate
+        result = await self.session.execute(count_query(Collection))
+        return result.scalar_one()
+
+    async def record_photo(
+        self, collection: Collection, photo: Photo, camera_model: Optional[str], distance_delta: float
+    ) -> None:
+        """Fold a newly imported photo into its collection's summary.
+
+        Runs in the importer's transaction, so the summary commits (or rolls
+        back) together with the photo. The importer takes ``lock_summary``
+        once per photo, before placing it on the track, and passes the
+        locked collection in, so concurrent imports into the collection are
+        serialized from the neighbour lookup on.
+
+        Args:
+            collection: The photo's collection, as returned by ``lock_summary``
+            photo: Flushed Photo, with its position set
+            camera_model: Camera model from the photo's metadata
+            distance_delta: Change in the flight's total distance, as
+                returned by ``FlightService.insert_into_flight``
+        """
+        collection.total_photos += 1
+        collection.total_distance_meters += distance_delta
+        collection.first_captured_at = _widen(collection.first_captured_at, photo.timestamp)
+        collection.last_captured_at = _widen(collection.last_captured_at, photo.timestamp, max)
+        if photo.latitude is not None:
+            collection.min_latitude = _widen(collection.min_latitude, photo.latitude)
+            collection.max_latitude = _widen(collection.max_latitude, photo.latitude, max)
+            collection.min_longitude = _widen(collection.min_longitude, photo.longitude)
+            collection.max_longitude = _widen(collection.max_longitude, photo.longitude, max)
+        if camera_model and camera_model not in collection.camera_models:
+            # Assign a new list: in-place changes to a JSON column are not tracked
+            collection.camera_models = sorted([*collection.camera_models, camera_model])
+
+    async def lock_summary(self, collection_id: str) -> Collection:
+        """Load a collection for a summary update, locking its row.
+
+        The row is locked on backends that support it; on SQLite the
+        write transaction serializes summary updates instead.
+
+        Args:
+            collection_id: UUID of the collection
+
+        Returns:
+            The Collection, reloaded from the database
+
+        Raises:
+            NotFoundError: If the collection does not exist
+        """
+        collection = await self.session.get(
+            Collection, collection_id, with_for_update=True, populate_existing=True
+        )
+        if not collection:
+            raise NotFoundError(f"Collection not found: {collection_id}")
+        return collection
+
+    async def summarize_photos(self, *clauses) -> Dict[str, SummaryDelta]:
+        """Summarize the photos matching ``clauses`` per collection.
+
+        Args:
+            *clauses: Filter expressions on ``Photo``
+
+        Returns:
+            Delta of the matching photos by collection id
+        """
+        aggregates = [_AGGREGATES[pick](column) for column, pick in SUMMARY_EXTREMES.values()]
+        totals = await self.session.execute(
+            select(Photo.collection_id, func.count(), *aggregates).where(*clauses).group_by(Photo.collection_id)
+        )
+        deltas = {
+            row[0]: SummaryDelta(row[1], dict(zip(SUMMARY_EXTREMES, row[2:])))
+            for row in totals
+        }
+        cameras = await self.session.execute(
+            select(Photo.collection_id, PhotoMetadata.camera_model).distinct()
+            .join(PhotoMetadata, PhotoMetadata.photo_id == Photo.id)
+            .where(*clauses, PhotoMetadata.camera_model.is_not(None))
+        )
+        for collection_id, camera_model in cameras:
+            deltas[collection_id].camera_models.add(camera_model)
+        return deltas
+
+    async def add_photos(self, collection_id: str, delta: SummaryDelta, total_distance: float) -> Collection:
+        """Fold photos moved into a collection into its summary.
 
-    async def update_photo_count(self, collection_id: str, count: int) -> None:
-        """Update the total photo count for a collection.
+        The caller owns the transaction.
 
         Args:
             collection_id: UUID of the collection
-            count: Number of photos to add to the count
+            delta: Summary of the added photos
+            total_distance: The flight's new total distance, in meters
+
+        Returns:
+            The updated Collection
+
+        Raises:
+            NotFoundError: If the collection does not exist
+        """
+        collection = await self.lock_summary(collection_id)
+        collection.total_photos += delta.photos
+        collection.total_distance_meters = total_distance
+        for name, (_, pick) in SUMMARY_EXTREMES.items():
+            setattr(collection, name, _widen(getattr(collection, name), delta.extremes[name], pick))
+        if not delta.camera_models <= set(collection.camera_models):
+            collection.camera_models = sorted(delta.camera_models | set(collection.camera_models))
+        await self.session.flush()
+        return collection
+
+    async def remove_photos(self, collection_id: str, delta: SummaryDelta, total_distance: float) -> Collection:
+        """Take photos deleted or moved out of a collection off its summary.
+
+        Only the extremes the removed photos held, and the cameras they
+        used, are looked up again; everything else is adjusted in place.
+        The caller owns the transaction.
+
+        Args:
+            collection_id: UUID of the collection
+            delta: Summary of the removed photos
+            total_distance: The flight's new total distance, in meters
+
+        Returns:
+            The updated Collection
+
+        Raises:
+            NotFoundError: If the collection does not exist
+        """
+        collection = await self.lock_summary(collection_id)
+        in_collection = Photo.collection_id == collection_id
+        collection.total_photos = max(collection.total_photos - delta.photos, 0)
+        collection.total_distance_meters = total_distance
+
+        stale = [
+            name for name, value in delta.extremes.items()
+            if value is not None and value == getattr(collection, name)
+        ]
+        if stale:
+            aggregates = [_AGGREGATES[SUMMARY_EXTREMES[name][1]](SUMMARY_EXTREMES[name][0]) for name in stale]
+            values = (await self.session.execute(select(*aggregates).where(in_collection))).one()
+            for name, value in zip(stale, values):
+                setattr(collection, name, value)
+
+        gone = []
+        for camera_model in sorted(delta.camera_models & set(collection.camera_models)):
+            still_used = await self.session.execute(
+                select(PhotoMetadata.id)
+                .join(Photo, PhotoMetadata.photo_id == Photo.id)
+                .where(in_collection, PhotoMetadata.camera_model == camera_model)
+                .limit(1)
+            )
+            if still_used.first() is None:
+                gone.append(camera_model)
+        if gone:
+            collection.camera_models = [name for name in collection.camera_models if name not in gone]
+        await self.session.flush()
+        return collection
+
+    async def refresh_summary(self, collection_id: str) -> Collection:
+        """Recompute a collection's summary from its photos.
+
+        Scans every photo of the collection; ``add_photos`` and
+        ``remove_photos`` adjust it incrementally. The caller owns the
+        transaction.
+
+        Args:
+            collection_id: UUID of the collection
+
+        Returns:
+            The updated Collection
+
+        Raises:
+            NotFoundError: If collection does not exist
         """
         collection = await self.get_collection(collection_id)
-        collection.total_photos += count
-        await self.session.commit()
+        in_collection = Photo.collection_id == collection_id
+
+        totals = (await self.session.execute(
+            select(
+                func.count(),
+                func.min(Photo.latitude), func.max(Photo.latitude),
+                func.min(Photo.longitude), func.max(Photo.longitude),
+                func.min(Photo.timestamp), func.max(Photo.timestamp),
+            ).where(in_collection)
+        )).one()
+        cameras = await self.session.execute(
+            select(PhotoMetadata.camera_model).distinct()
+            .join(Photo, PhotoMetadata.photo_id == Photo.id)
+            .where(in_collection, PhotoMetadata.camera_model.is_not(None))
+            .order_by(PhotoMetadata.camera_model)
+        )
+        # Cumulative distances start at 0 on the first photo of the track
+        distance = await self.session.execute(
+            select(func.max(PhotoMetadata.cumulative_distance))
+            .join(Photo, PhotoMetadata.photo_id == Photo.id)
+            .where(in_collection)
+        )
+
+        (
+            collection.total_photos,
+            collection.min_latitude, collection.max_latitude,
+            collection.min_longitude, collection.max_longitude,
+            collection.first_captured_at, collection.last_captured_at,
+        ) = totals
+        collection.camera_models = [camera for camera in cameras.scalars() if camera]
+        collection.total_distance_meters = distance.scalar_one() or 0.0
+        await self.session.flush()
+        return collection
@@ -0,0 +1,176 @@
+"""On-disk cache for generated export artifacts.
+
+Artifacts are keyed by a hash of the export format, its filters and the
+data generation, so any import invalidates every cached export without
+touching the cache itself. Files are written to a temporary name while the
+export streams to the client and only renamed into place once complete;
+the least recently served artifacts are evicted when the cache exceeds its
+size budget. Artifacts served within the last ``EVICTION_GRACE_SECONDS``
+are kept even over budget, so a hit is not removed before the response
+has opened it.
+
+Every writer's output is a deterministic function of its rows, so the key
+doubles as a strong ETag: a regenerated artifact has the same bytes.
+"""
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import time
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, Optional
+
+from src.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+PARTIAL_SUFFIX = ".part"
+
+# Artifacts served this recently are never evicted
+EVICTION_GRACE_SECONDS = 60
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Check an If-None-Match header against an entity tag.
+
+    Uses the weak comparison required for If-None-Match, so a ``W/``
+    prefix added by the compression middleware still matches.
+
+    Args:
+        if_none_match: Raw If-None-Match header value
+        etag: Current entity tag, quoted
+
+    Returns:
+        True if the client's copy is current
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == opaque for tag in if_none_match.split(","))
+
+
+class ExportCache:
+    """Size-bounded LRU cache of export files in a directory.
+
+    Recency is tracked with file modification times, which are refreshed
+    on every hit, so the cache survives restarts without an index.
+    """
+
+    def __init__(self, directory: Path, max_bytes: int, grace_seconds: float = EVICTION_GRACE_SECONDS):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.grace_seconds = grace_seconds
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def key(fmt: str, filters: Dict[str, Any], generation: int) -> str:
+        """Build the cache key for an export.
+
+        Args:
+            fmt: Export format (case-insensitive)
+            filters: JSON-serializable export filters
+            generation: Current data generation
+
+        Returns:
+            Hex digest identifying the artifact
+        """
+        payload = json.dumps(
+            {"format": fmt.lower(), "filters": filters, "generation": generation},
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def path(self, key: str) -> Path:
+        """Location of a cached artifact."""
+        return self.directory / key
+
+    def get(self, key: str) -> Optional[Path]:
+        """Look up an artifact and mark it as recently used.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Path of the artifact, or None on a miss
+        """
+        path = self.path(key)
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        return path
+
+    async def store(self, key: str, chunks: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+        """Pass export chunks through while writing them to the cache.
+
+        The artifact is committed only if the stream runs to completion; a
+        failed export or a disconnected client leaves nothing behind.
+
+        Args:
+            key: Cache key
+            chunks: Export byte stream
+
+        Yields:
+            The chunks of ``chunks`` unchanged
+        """
+        fd, partial = tempfile.mkstemp(dir=self.directory, suffix=PARTIAL_SUFFIX)
+        committed = False
+        try:
+            with os.fdopen(fd, "wb") as f:
+                async for chunk in chunks:
+                    f.write(chunk)
+                    yield chunk
+            os.replace(partial, self.path(key))
+            committed = True
+        finally:
+            if not committed:
+                Path(partial).unlink(missing_ok=True)
+
+        self.evict()
+
+    def evict(self) -> int:
+        """Remove least recently used artifacts until under the size budget.
+
+        Artifacts served within the last ``grace_seconds`` are kept.
+
+        Returns:
+            Number of artifacts removed
+        """
+        in_use_since = time.time() - self.grace_seconds
+        entries = []
+        total = 0
+        for entry in os.scandir(self.directory):
+            if not entry.is_file() or entry.name.endswith(PARTIAL_SUFFIX):
+                continue
+            stat = entry.stat()
+            entries.append((stat.st_mtime, stat.st_size, entry.path))
+            total += stat.st_size
+
+        removed = 0
+        for mtime, size, path in sorted(entries):
+            if total <= self.max_bytes or mtime > in_use_since:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+            removed += 1
+
+        if removed:
+            logger.info(f"Evicted {removed} export artifacts from cache")
+        return removed
+
+
+@lru_cache
+def get_export_cache() -> Optional[ExportCache]:
+    """Get the shared export cache, or None when caching is disabled."""
+    settings = get_settings()
+    if not settings.EXPORT_CACHE_ENABLED:
+        return None
+    return ExportCache(Path(settings.EXPORT_CACHE_DIR), settings.EXPORT_CACHE_MAX_BYTES)
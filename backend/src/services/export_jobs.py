@@ -0,0 +1,235 @@
+"""Background export jobs.
+
+Large exports are rendered to a file in the background instead of being
+streamed on the request: the client submits a job, polls its progress and
+downloads the finished artifact. Rows are still read from a server-side
+cursor on the event loop, while the format writers, which are CPU-bound,
+and the file writes run in a worker thread.
+
+Jobs are tracked in the memory of the process that accepted them, so the
+status and download routes only find a job on that process: run the API
+as a single worker (or with sticky routing) when export jobs are used.
+Finished jobs are pruned on a timer once their TTL has passed.
+"""
+import asyncio
+import logging
+import os
+import tempfile
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from enum import Enum
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple, Union
+from uuid import uuid4
+
+from sqlalchemy import Select
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, AsyncSession
+
+from src.config import get_settings
+from src.exceptions import ConflictError, NotFoundError
+from src.services.export_service import ExportService, write_output
+
+logger = logging.getLogger(__name__)
+
+
+class ExportJobStatus(str, Enum):
+    """Lifecycle states of an export job."""
+
+    PENDING = "pending"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+
+def _utcnow() -> datetime:
+    """Current time as an aware UTC datetime."""
+    return datetime.now(timezone.utc)
+
+
+@dataclass
+class ExportJob:
+    """State and progress of one background export."""
+
+    format: str
+    media_type: str
+    extension: str
+    id: str = field(default_factory=lambda: str(uuid4()))
+    status: ExportJobStatus = ExportJobStatus.PENDING
+    rows_written: int = 0
+    bytes_written: int = 0
+    error: Optional[str] = None
+    created_at: datetime = field(default_factory=_utcnow)
+    finished_at: Optional[datetime] = None
+    path: Optional[Path] = None
+    task: Optional[asyncio.Task] = field(default=None, repr=False)
+
+    @property
+    def finished(self) -> bool:
+        return self.status in (ExportJobStatus.COMPLETED, ExportJobStatus.FAILED, ExportJobStatus.CANCELLED)
+
+
+def _render(f, render: Callable[..., Any], *args) -> int:
+    """Call a writer method and write its output; runs in a worker thread."""
+    return write_output(f, render(*args))
+
+
+class ExportJobManager:
+    """Runs export jobs and tracks them in this process's memory.
+
+    At most ``max_concurrent`` jobs render at once; the rest wait as
+    pending. Finished jobs and their files are discarded ``ttl_seconds``
+    after completion, checked every ``prune_interval`` seconds once
+    ``start`` has been called.
+    """
+
+    def __init__(self, directory: Path, max_concurrent: int = 2, ttl_seconds: int = 3600, prune_interval: float = 60):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.ttl_seconds = ttl_seconds
+        self.prune_interval = prune_interval
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+        self._jobs: Dict[str, ExportJob] = {}
+        self._prune_task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        """Start pruning expired jobs periodically."""
+        if self._prune_task is None and self.prune_interval > 0:
+            self._prune_task = asyncio.create_task(self._prune_loop())
+
+    async def _prune_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.prune_interval)
+            try:
+                self.prune()
+            except Exception as e:
+                logger.warning(f"Pruning export jobs failed: {e}")
+
+    def submit(self, bind: Union[AsyncEngine, AsyncConnection], export_format: str, query: Select) -> ExportJob:
+        """Start rendering an export in the background.
+
+        Args:
+            bind: Engine the job opens its own session on
+            export_format: Format name
+            query: Select over ``EXPORT_COLUMNS``
+
+        Returns:
+            The new job
+
+        Raises:
+            ValidationError: If the format is not supported
+        """
+        self.prune()
+        writer = ExportService().create_writer(export_format)
+        job = ExportJob(format=export_format.lower(), media_type=writer.media_type, extension=writer.extension)
+        self._jobs[job.id] = job
+        job.task = asyncio.create_task(self._run(job, bind, writer, query))
+        return job
+
+    def get(self, job_id: str) -> ExportJob:
+        """Get a job by ID.
+
+        Raises:
+            NotFoundError: If the job does not exist or has expired
+        """
+        job = self._jobs.get(job_id)
+        if job is None:
+            raise NotFoundError(f"Export job {job_id} not found")
+        return job
+
+    def artifact(self, job_id: str) -> Tuple[ExportJob, Path]:
+        """Get a completed job whose artifact can be downloaded.
+
+        Returns:
+            The job and the path of its artifact
+
+        Raises:
+            NotFoundError: If the job does not exist
+            ConflictError: If the job has not completed successfully
+        """
+        job = self.get(job_id)
+        if job.status != ExportJobStatus.COMPLETED or job.path is None:
+            raise ConflictError(f"Export job {job_id} is {job.status.value}", error_code="EXPORT_NOT_READY")
+        return job, job.path
+
+    async def cancel(self, job_id: str) -> None:
+        """Cancel a job if still running and delete its artifact.
+
+        Raises:
+            NotFoundError: If the job does not exist
+        """
+        job = self._jobs.pop(job_id, None)
+        if job is None:
+            raise NotFoundError(f"Export job {job_id} not found")
+        if job.task is not None and not job.task.done():
+            job.task.cancel()
+            try:
+                await job.task
+            except asyncio.CancelledError:
+                pass
+        self._discard(job)
+
+    async def shutdown(self) -> None:
+        """Stop pruning, cancel every job and remove all artifacts."""
+        if self._prune_task is not None:
+            self._prune_task.cancel()
+            try:
+                await self._prune_task
+            except asyncio.CancelledError:
+                pass
+            self._prune_task = None
+        for job_id in list(self._jobs):
+            await self.cancel(job_id)
+
+    def prune(self) -> None:
+        """Drop finished jobs older than the TTL."""
+        now = _utcnow()
+        for job in list(self._jobs.values()):
+            if job.finished_at is not None and (now - job.finished_at).total_seconds() > self.ttl_seconds:
+                del self._jobs[job.id]
+                self._discard(job)
+
+    @staticmethod
+    def _discard(job: ExportJob) -> None:
+        if job.path is not None:
+            job.path.unlink(missing_ok=True)
+
+    async def _run(self, job: ExportJob, bind: Union[AsyncEngine, AsyncConnection], writer, query: Select) -> None:
+        async with self._semaphore:
+            job.status = ExportJobStatus.RUNNING
+            fd, path = tempfile.mkstemp(dir=self.directory, suffix=f".{job.extension}")
+            job.path = Path(path)
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    job.bytes_written += await asyncio.to_thread(_render, f, writer.header)
+                    async with AsyncSession(bind=bind) as session:
+                        async for batch in ExportService(session).stream_rows(query):
+                            job.bytes_written += await asyncio.to_thread(_render, f, writer.write, batch)
+                            job.rows_written += len(batch)
+                    job.bytes_written += await asyncio.to_thread(_render, f, writer.footer)
+                job.status = ExportJobStatus.COMPLETED
+                logger.info(f"Export job {job.id} wrote {job.rows_written} rows ({job.bytes_written} bytes)")
+            except asyncio.CancelledError:
+                job.status = ExportJobStatus.CANCELLED
+                raise
+            except Exception as e:
+                job.status = ExportJobStatus.FAILED
+                job.error = str(e)
+                self._discard(job)
+                job.path = None
+                logger.warning(f"Export job {job.id} failed: {e}")
+            finally:
+                job.finished_at = _utcnow()
+
+
+@lru_cache
+def get_export_job_manager() -> ExportJobManager:
+    """Get the process-wide export job manager."""
+    settings = get_settings()
+    return ExportJobManager(
+        Path(settings.EXPORT_JOBS_DIR),
+        max_concurrent=settings.EXPORT_JOBS_MAX_CONCURRENT,
+        ttl_seconds=settings.EXPORT_JOB_TTL_SECONDS,
+        prune_interval=settings.EXPORT_JOB_PRUNE_INTERVAL_SECONDS,
+    )
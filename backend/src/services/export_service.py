@@ -1,77 +1,718 @@
+"""Service for exporting photo locations to GIS formats.
+
+Exports are produced by format writers that turn batches of flat
+``ExportRow`` tuples into text (or, for binary formats, bytes) chunks, so a
+whole export never has to be
+held in memory. Rows are streamed from the database with a server-side
+cursor and handed to the writer one partition at a time.
+"""
 import csv
 import io
-from typing import List, Dict, Any
+import json
+import struct
+import tempfile
+import zipfile
+from array import array
+from datetime import datetime, timedelta
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    BinaryIO,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+    cast,
+)
 from xml.sax.saxutils import escape
 
-from src.models.photo import Photo
+import orjson
+from sqlalchemy import Select, select
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.exceptions import ValidationError
+from src.models.photo import Photo, PhotoMetadata
+from src.schemas.photo import Bounds
+from src.utils.filters import photo_filter_clauses
 
-class ExportService:
-    def export_to_geojson(self, photos: List[Photo]) -> Dict[str, Any]:
-        features = []
-        for photo in photos:
-            if photo.metadata_:
-                coordinates = [photo.metadata_.longitude, photo.metadata_.latitude]
-                if photo.metadata_.altitude is not None:
-                    coordinates.append(photo.metadata_.altitude)
-
-                feature = {
-                    "type": "Feature",
-                    "geometry": {
-                        "type": "Point",
-                        "coordinates": coordinates
-                    },
-                    "properties": {
-                        "id": photo.id,
-                        "filename": photo.filename,
-                        "timestamp": photo.timestamp.isoformat() if photo.timestamp else None
-                    }
-                }
-                features.append(feature)
+# Rows fetched per round trip and per writer call
+EXPORT_BATCH_SIZE = 1000
 
-        return {
-            "type": "FeatureCollection",
-            "features": features
+
+class ExportRow(NamedTuple):
+    """Flat photo/location row fed to export writers."""
+
+    id: str
+    filename: str
+    timestamp: Optional[datetime]
+    latitude: float
+    longitude: float
+    altitude: Optional[float]
+    camera_model: Optional[str] = None
+    collection_id: Optional[str] = None
+
+
+# Columns selected for export, in ExportRow order
+EXPORT_COLUMNS = (
+    Photo.id,
+    Photo.filename,
+    Photo.timestamp,
+    PhotoMetadata.latitude,
+    PhotoMetadata.longitude,
+    PhotoMetadata.altitude,
+    PhotoMetadata.camera_model,
+    Photo.collection_id,
+)
+
+
+# Formats whose rows are grouped by collection, not interleaved in time
+BY_COLLECTION_FORMATS = {"gpx"}
+
+
+def export_query(
+    photo_ids: Optional[Sequence[str]] = None,
+    date_start: Optional[datetime] = None,
+    date_end: Optional[datetime] = None,
+    bounds: Optional[Bounds] = None,
+    export_format: Optional[str] = None,
+) -> Select:
+    """Query selecting export rows for photos with GPS metadata.
+
+    Every filter is compiled into the WHERE clause.
+
+    Args:
+        photo_ids: Restrict to these photos
+        date_start: Earliest capture time
+        date_end: Latest capture time
+        bounds: Bounding box the photo must lie in
+        export_format: Format the rows are written in; formats in
+            ``BY_COLLECTION_FORMATS`` get their rows grouped by collection
+
+    Returns:
+        Select over ``EXPORT_COLUMNS`` ordered by capture time
+    """
+    order: Tuple[Any, ...] = (Photo.timestamp, Photo.id)
+    if export_format and export_format.lower() in BY_COLLECTION_FORMATS:
+        # Served by ix_photos_collection_track
+        order = (Photo.collection_id, *order)
+    query = (
+        select(*EXPORT_COLUMNS)
+        .join(PhotoMetadata, PhotoMetadata.photo_id == Photo.id)
+        .order_by(*order)
+    )
+    if photo_ids:
+        query = query.where(Photo.id.in_(photo_ids))
+    return query.where(*photo_filter_clauses(date_start, date_end, bounds))
+
+
+def rows_from_photos(photos: Iterable[Photo]) -> Iterator[ExportRow]:
+    """Convert loaded Photo objects to export rows, skipping photos without GPS."""
+    for photo in photos:
+        if photo.metadata_:
+            yield ExportRow(
+                photo.id,
+                photo.filename,
+                photo.timestamp,
+                photo.metadata_.latitude,
+                photo.metadata_.longitude,
+                photo.metadata_.altitude,
+                photo.metadata_.camera_model,
+                photo.collection_id,
+            )
+
+
+def _geojson_feature(row: ExportRow) -> Dict[str, Any]:
+    coordinates = [row.longitude, row.latitude]
+    if row.altitude is not None:
+        coordinates.append(row.altitude)
+
+    return {
+        "type": "Feature",
+        "geometry": {
+            "type": "Point",
+            "coordinates": coordinates
+        },
+        "properties": {
+            "id": row.id,
+            "filename": row.filename,
+            "timestamp": row.timestamp.isoformat() if row.timestamp else None
         }
+    }
 
-    def export_to_csv(self, photos: List[Photo]) -> str:
-        output = io.StringIO()
-        writer = csv.writer(output)
-        writer.writerow(["filename", "latitude", "longitude", "altitude", "timestamp"])
-
-        for photo in photos:
-            if photo.metadata_:
-                writer.writerow([
-                    photo.filename,
-                    photo.metadata_.latitude,
-                    photo.metadata_.longitude,
-                    photo.metadata_.altitude if photo.metadata_.altitude is not None else "",
-                    photo.timestamp.isoformat() if photo.timestamp else ""
-                ])
-
-        return output.getvalue()
 
-    def export_to_kml(self, photos: List[Photo]) -> str:
-        kml_header = """<?xml version="1.0" encoding="UTF-8"?>
+class GeoJSONWriter:
+    """Writes a GeoJSON FeatureCollection incrementally, features serialized with orjson."""
+
+    media_type = "application/geo+json"
+    extension = "geojson"
+
+    def __init__(self) -> None:
+        self._first = True
+
+    def header(self) -> bytes:
+        return b'{"type": "FeatureCollection", "features": ['
+
+    def write(self, rows: Sequence[ExportRow]) -> bytes:
+        parts = []
+        for row in rows:
+            if not self._first:
+                parts.append(b", ")
+            parts.append(orjson.dumps(_geojson_feature(row)))
+            self._first = False
+        return b"".join(parts)
+
+    def footer(self) -> bytes:
+        return b"]}"
+
+
+class CSVWriter:
+    """Writes CSV rows incrementally."""
+
+    media_type = "text/csv"
+    extension = "csv"
+
+    def __init__(self) -> None:
+        self._buffer = io.StringIO()
+        self._writer = csv.writer(self._buffer)
+
+    def _drain(self) -> str:
+        chunk = self._buffer.getvalue()
+        self._buffer.seek(0)
+        self._buffer.truncate()
+        return chunk
+
+    def header(self) -> str:
+        self._writer.writerow(["filename", "latitude", "longitude", "altitude", "timestamp"])
+        return self._drain()
+
+    def write(self, rows: Sequence[ExportRow]) -> str:
+        self._writer.writerows(
+            [
+                row.filename,
+                row.latitude,
+                row.longitude,
+                row.altitude if row.altitude is not None else "",
+                row.timestamp.isoformat() if row.timestamp else ""
+            ]
+            for row in rows
+        )
+        return self._drain()
+
+    def footer(self) -> str:
+        return ""
+
+
+class KMLWriter:
+    """Writes a KML document of point placemarks incrementally."""
+
+    media_type = "application/vnd.google-earth.kml+xml"
+    extension = "kml"
+
+    def header(self) -> str:
+        return """<?xml version="1.0" encoding="UTF-8"?>
 <kml xmlns="http://www.opengis.net/kml/2.2">
   <Document>
 """
-        kml_footer = """  </Document>
-</kml>"""
 
-        placemarks = ""
-        for photo in photos:
-            if photo.metadata_:
-                # Altitude is optional in KML coordinate tuples
-                coords = f"{photo.metadata_.longitude},{photo.metadata_.latitude}"
-                if photo.metadata_.altitude is not None:
-                    coords += f",{photo.metadata_.altitude}"
+    def write(self, rows: Sequence[ExportRow]) -> str:
+        parts = []
+        for row in rows:
+            # Altitude is optional in KML coordinate tuples
+            coords = f"{row.longitude},{row.latitude}"
+            if row.altitude is not None:
+                coords += f",{row.altitude}"
 
-                placemarks += f"""    <Placemark>
-      <name>{escape(photo.filename)}</name>
+            parts.append(f"""    <Placemark>
+      <name>{escape(row.filename)}</name>
       <Point>
         <coordinates>{coords}</coordinates>
       </Point>
     </Placemark>
+""")
+        return "".join(parts)
+
+    def footer(self) -> str:
+        return """  </Document>
+</kml>"""
+
+
+# Time between consecutive photos that starts a new GPX track segment
+GPX_SEGMENT_GAP = timedelta(minutes=5)
+
+
+def _gpx_time(timestamp: datetime) -> str:
+    # Capture times are the camera's local time (EXIF DateTimeOriginal or the
+    # file's mtime), so naive times are written without a zone designator
+    return timestamp.isoformat()
+
+
+class GPXWriter:
+    """Writes photo positions as a GPX 1.1 track.
+
+    Rows arrive grouped by collection and in capture-time order within each
+    (see ``BY_COLLECTION_FORMATS``); a new ``<trkseg>`` starts whenever the
+    collection (flight) changes or consecutive photos are more than
+    ``segment_gap`` apart, so each flight becomes its own segment. Only the
+    previous row is remembered, keeping memory constant.
+    """
+
+    media_type = "application/gpx+xml"
+    extension = "gpx"
+
+    def __init__(self, segment_gap: timedelta = GPX_SEGMENT_GAP):
+        self.segment_gap = segment_gap
+        self._previous: Optional[ExportRow] = None
+
+    def _starts_segment(self, row: ExportRow) -> bool:
+        previous = self._previous
+        if previous is None:
+            return True
+        if row.collection_id != previous.collection_id:
+            return True
+        if row.timestamp is None or previous.timestamp is None:
+            return False
+        return row.timestamp - previous.timestamp > self.segment_gap
+
+    def header(self) -> str:
+        return """<?xml version="1.0" encoding="UTF-8"?>
+<gpx version="1.1" creator="Drone Photo GPS Visualizer" xmlns="http://www.topografix.com/GPX/1/1">
+  <trk>
+    <name>Drone flights</name>
 """
-        return kml_header + placemarks + kml_footer
+
+    def write(self, rows: Sequence[ExportRow]) -> str:
+        parts = []
+        for row in rows:
+            if self._starts_segment(row):
+                if self._previous is not None:
+                    parts.append("    </trkseg>\n")
+                parts.append("    <trkseg>\n")
+            self._previous = row
+
+            parts.append(f'      <trkpt lat="{row.latitude}" lon="{row.longitude}">\n')
+            if row.altitude is not None:
+                parts.append(f"        <ele>{row.altitude}</ele>\n")
+            if row.timestamp is not None:
+                parts.append(f"        <time>{_gpx_time(row.timestamp)}</time>\n")
+            parts.append(f"        <name>{escape(row.filename)}</name>\n")
+            parts.append("      </trkpt>\n")
+        return "".join(parts)
+
+    def footer(self) -> str:
+        segment_end = "    </trkseg>\n" if self._previous is not None else ""
+        return f"""{segment_end}  </trk>
+</gpx>"""
+
+
+class _ChunkSink:
+    """Write-only, non-seekable file object collecting bytes until drained."""
+
+    def __init__(self) -> None:
+        self._chunks: List[bytes] = []
+        self._position = 0
+        self.closed = False
+
+    def write(self, data: bytes) -> int:
+        self._chunks.append(bytes(data))
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self.closed = True
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks = []
+        return data
+
+
+# Modification time stamped on the KMZ entry (the earliest a zip can hold)
+KMZ_ENTRY_DATE_TIME = (1980, 1, 1, 0, 0, 0)
+
+
+class KMZWriter:
+    """Writes KML straight into a deflate-compressed KMZ (zip) stream.
+
+    The sink is not seekable, so zipfile emits data descriptors and the
+    archive can be sent while it is being built. Its size is only known at
+    the end, so the entry is always written as zip64: otherwise a KML
+    document over 2 GiB would fail after the response has started. The
+    entry carries a fixed
+    timestamp, so the same rows always produce the same bytes and cached
+    artifacts can be served under a strong ETag.
+    """
+
+    media_type = "application/vnd.google-earth.kmz"
+    extension = "kmz"
+
+    def __init__(self) -> None:
+        self._kml = KMLWriter()
+        self._sink = _ChunkSink()
+        # zipfile only writes to and tells the position of a non-seekable file
+        self._zip = zipfile.ZipFile(cast(BinaryIO, self._sink), "w", compression=zipfile.ZIP_DEFLATED)
+        entry = zipfile.ZipInfo("doc.kml", date_time=KMZ_ENTRY_DATE_TIME)
+        entry.compress_type = zipfile.ZIP_DEFLATED
+        self._entry = self._zip.open(entry, "w", force_zip64=True)
+
+    def header(self) -> bytes:
+        self._entry.write(self._kml.header().encode("utf-8"))
+        return self._sink.drain()
+
+    def write(self, rows: Sequence[ExportRow]) -> bytes:
+        self._entry.write(self._kml.write(rows).encode("utf-8"))
+        return self._sink.drain()
+
+    def footer(self) -> bytes:
+        self._entry.write(self._kml.footer().encode("utf-8"))
+        self._entry.close()
+        self._zip.close()
+        return self._sink.drain()
+
+
+# Rows buffered per Parquet row group
+PARQUET_ROW_GROUP_SIZE = 50_000
+
+
+class GeoParquetWriter:
+    """Writes a GeoParquet 1.0 file in bounded row groups.
+
+    Batches are transposed into Arrow columns (no per-photo dicts) and
+    flushed as a zstd-compressed row group every ``PARQUET_ROW_GROUP_SIZE``
+    rows. Camera model is dictionary-encoded; geometry is WKB points in
+    OGC:CRS84 (longitude, latitude).
+    """
+
+    media_type = "application/vnd.apache.parquet"
+    extension = "parquet"
+
+    def __init__(self, row_group_size: int = PARQUET_ROW_GROUP_SIZE):
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise ValidationError(
+                "Parquet export is not available: pyarrow is not installed", error_code="FORMAT_UNAVAILABLE"
+            )
+        self._pa = pa
+        self._row_group_size = row_group_size
+        self._pending: List[ExportRow] = []
+        self._schema = pa.schema(
+            [
+                ("id", pa.string()),
+                ("filename", pa.string()),
+                ("timestamp", pa.timestamp("us")),
+                ("latitude", pa.float64()),
+                ("longitude", pa.float64()),
+                ("altitude", pa.float64()),
+                ("camera_model", pa.dictionary(pa.int32(), pa.string())),
+                ("geometry", pa.binary()),
+            ],
+            metadata={
+                "geo": json.dumps({
+                    "version": "1.0.0",
+                    "primary_column": "geometry",
+                    "columns": {"geometry": {"encoding": "WKB", "geometry_types": ["Point"]}},
+                })
+            },
+        )
+        self._sink = _ChunkSink()
+        self._writer = pq.ParquetWriter(
+            self._sink,
+            self._schema,
+            compression="zstd",
+            use_dictionary=["camera_model"],
+        )
+
+    def _flush_row_group(self) -> None:
+        if not self._pending:
+            return
+        pa = self._pa
+        ids, filenames, timestamps, lats, lons, alts, cameras, _ = zip(*self._pending)
+        geometry = [struct.pack("<BIdd", 1, 1, lon, lat) for lon, lat in zip(lons, lats)]
+        table = pa.Table.from_arrays(
+            [
+                pa.array(ids, pa.string()),
+                pa.array(filenames, pa.string()),
+                pa.array(timestamps, pa.timestamp("us")),
+                pa.array(lats, pa.float64()),
+                pa.array(lons, pa.float64()),
+                pa.array(alts, pa.float64()),
+                pa.array(cameras, pa.string()).dictionary_encode(),
+                pa.array(geometry, pa.binary()),
+            ],
+            schema=self._schema,
+        )
+        self._writer.write_table(table, row_group_size=self._row_group_size)
+        self._pending = []
+
+    def header(self) -> bytes:
+        return self._sink.drain()
+
+    def write(self, rows: Sequence[ExportRow]) -> bytes:
+        self._pending.extend(rows)
+        if len(self._pending) >= self._row_group_size:
+            self._flush_row_group()
+        return self._sink.drain()
+
+    def footer(self) -> bytes:
+        self._flush_row_group()
+        self._writer.close()
+        return self._sink.drain()
+
+
+class FlatGeobufWriter:
+    """Writes a FlatGeobuf point layer with a packed Hilbert R-tree index.
+
+    The index precedes the features in the file but can only be built once
+    every feature's position is known, so encoded features are spooled to a
+    temporary file as they stream in. Only coordinates and spool offsets
+    (about 28 bytes per feature) are kept in memory; the file is assembled
+    in Hilbert order when the stream ends.
+    """
+
+    media_type = "application/flatgeobuf"
+    extension = "fgb"
+
+    def __init__(self) -> None:
+        try:
+            from src.utils import flatgeobuf
+        except ImportError:
+            raise ValidationError(
+                "FlatGeobuf export is not available: flatbuffers is not installed", error_code="FORMAT_UNAVAILABLE"
+            )
+        self._fgb = flatgeobuf
+        # Property columns, in the index order used by write()
+        self._columns = [
+            ("id", flatgeobuf.COLUMN_TYPE_STRING),
+            ("filename", flatgeobuf.COLUMN_TYPE_STRING),
+            ("timestamp", flatgeobuf.COLUMN_TYPE_DATETIME),
+            ("altitude", flatgeobuf.COLUMN_TYPE_DOUBLE),
+            ("camera_model", flatgeobuf.COLUMN_TYPE_STRING),
+        ]
+        self._spool = tempfile.TemporaryFile()
+        self._xs = array("d")
+        self._ys = array("d")
+        self._sizes = array("L")
+        self._positions = array("Q")
+
+    def header(self) -> bytes:
+        return b""
+
+    def write(self, rows: Sequence[ExportRow]) -> bytes:
+        fgb = self._fgb
+        for row in rows:
+            properties = fgb.encode_properties(
+                [(0, row.id), (1, row.filename), (2, row.timestamp), (3, row.altitude), (4, row.camera_model)]
+            )
+            feature = fgb.encode_point_feature(row.longitude, row.latitude, properties)
+            self._positions.append(self._spool.tell())
+            self._spool.write(feature)
+            self._xs.append(row.longitude)
+            self._ys.append(row.latitude)
+            self._sizes.append(len(feature))
+        return b""
+
+    def footer(self) -> Iterator[bytes]:
+        return self._assemble()
+
+    def _assemble(self, chunk_size: int = 1 << 20) -> Iterator[bytes]:
+        fgb = self._fgb
+        count = len(self._xs)
+        columns = self._columns
+        try:
+            if not count:
+                yield fgb.MAGIC_BYTES + fgb.encode_header("photos", columns, 0, None, node_size=0)
+                return
+
+            xs, ys = self._xs, self._ys
+            extent = (min(xs), min(ys), max(xs), max(ys))
+            order = fgb.hilbert_order(xs, ys, extent)
+
+            boxes = []
+            offsets = []
+            offset = 0
+            for i in order:
+                boxes.append((xs[i], ys[i], xs[i], ys[i]))
+                offsets.append(offset)
+                offset += self._sizes[i]
+
+            yield fgb.MAGIC_BYTES + fgb.encode_header("photos", columns, count, extent)
+            yield fgb.packed_rtree(boxes, offsets)
+            del boxes, offsets
+
+            buffered = []
+            buffered_size = 0
+            for i in order:
+                self._spool.seek(self._positions[i])
+                buffered.append(self._spool.read(self._sizes[i]))
+                buffered_size += self._sizes[i]
+                if buffered_size >= chunk_size:
+                    yield b"".join(buffered)
+                    buffered = []
+                    buffered_size = 0
+            if buffered:
+                yield b"".join(buffered)
+        finally:
+            self._spool.close()
+
+
+WRITERS = {
+    "geojson": GeoJSONWriter,
+    "csv": CSVWriter,
+    "kml": KMLWriter,
+    "kmz": KMZWriter,
+    "gpx": GPXWriter,
+    "parquet": GeoParquetWriter,
+    "fgb": FlatGeobufWriter,
+}
+
+
+def _encode(chunk: Union[str, bytes]) -> bytes:
+    return chunk if isinstance(chunk, bytes) else chunk.encode("utf-8")
+
+
+def _chunks(output) -> Iterator:
+    """Normalize writer output: a single chunk or an iterable of chunks."""
+    if isinstance(output, (str, bytes)):
+        yield output
+    else:
+        yield from output
+
+
+def write_output(f: BinaryIO, output) -> int:
+    """Write writer output to a binary file.
+
+    Args:
+        f: Destination file
+        output: Return value of a writer's header/write/footer
+
+    Returns:
+        Number of bytes written
+    """
+    written = 0
+    for chunk in _chunks(output):
+        if chunk:
+            data = _encode(chunk)
+            f.write(data)
+            written += len(data)
+    return written
+
+
+class ExportService:
+    """Service for exporting photos.
+
+    The ``export_to_*`` methods work on already-loaded photos; ``stream_rows``
+    and ``stream_export`` produce an export straight from a database cursor.
+    """
+
+    def __init__(self, session: Optional[AsyncSession] = None):
+        self.session = session
+
+    @property
+    def db(self) -> AsyncSession:
+        """The session; only the in-memory exports work without one."""
+        if self.session is None:
+            raise RuntimeError("ExportService needs a session to stream rows")
+        return self.session
+
+    def export_to_geojson(self, photos: List[Photo]) -> Dict[str, Any]:
+        return {
+            "type": "FeatureCollection",
+            "features": [_geojson_feature(row) for row in rows_from_photos(photos)]
+        }
+
+    def export_to_csv(self, photos: List[Photo]) -> str:
+        return "".join(self.iter_export("csv", rows_from_photos(photos)))
+
+    def export_to_kml(self, photos: List[Photo]) -> str:
+        return "".join(self.iter_export("kml", rows_from_photos(photos)))
+
+    def create_writer(self, export_format: str):
+        """Create a writer for an export format.
+
+        Args:
+            export_format: Format name (case-insensitive)
+
+        Returns:
+            Fresh writer instance
+
+        Raises:
+            ValidationError: If the format is not supported
+        """
+        writer_cls = WRITERS.get(export_format.lower())
+        if writer_cls is None:
+            raise ValidationError(f"Unsupported export format: {export_format}")
+        return writer_cls()
+
+    def iter_export(
+        self, export_format: str, rows: Iterable[ExportRow], batch_size: int = EXPORT_BATCH_SIZE
+    ) -> Iterator:
+        """Render rows lazily, yielding one chunk per batch.
+
+        Args:
+            export_format: Format name
+            rows: Export rows in output order
+            batch_size: Rows rendered per chunk
+
+        Yields:
+            Chunks of the export document (str, or bytes for binary formats)
+        """
+        writer = self.create_writer(export_format)
+        yield from _chunks(writer.header())
+        batch: List[ExportRow] = []
+        for row in rows:
+            batch.append(row)
+            if len(batch) >= batch_size:
+                yield from _chunks(writer.write(batch))
+                batch = []
+        if batch:
+            yield from _chunks(writer.write(batch))
+        yield from _chunks(writer.footer())
+
+    async def stream_rows(self, query: Select) -> AsyncIterator[List[ExportRow]]:
+        """Stream export rows from the database in batches.
+
+        Uses a server-side cursor so only one batch is materialized at a time.
+
+        Args:
+            query: Select over ``EXPORT_COLUMNS``
+
+        Yields:
+            Lists of at most ``EXPORT_BATCH_SIZE`` rows
+        """
+        result = await self.db.stream(query.execution_options(yield_per=EXPORT_BATCH_SIZE))
+        async for partition in result.partitions():
+            yield [ExportRow(*row) for row in partition]
+
+    async def stream_export(self, writer, batches: AsyncIterable[Sequence[ExportRow]]) -> AsyncIterator[bytes]:
+        """Render batches of rows into encoded export chunks.
+
+        Args:
+            writer: Writer from ``create_writer``
+            batches: Async iterable of row batches
+
+        Yields:
+            Encoded chunks, the first one before any row is fetched
+        """
+        for chunk in _chunks(writer.header()):
+            if chunk:
+                yield _encode(chunk)
+        async for batch in batches:
+            for chunk in _chunks(writer.write(batch)):
+                if chunk:
+                    yield _encode(chunk)
+        for chunk in _chunks(writer.footer()):
+            if chunk:
+                yield _encode(chunk)
@@ -1,10 +1,61 @@
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
-from src.models.photo import Photo
+
+from sqlalchemy import ColumnElement, StatementLambdaElement, and_, func, lambda_stmt, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.models.photo import Photo, PhotoMetadata
+from src.services.cache import cached
+from src.services.generation import GLOBAL_SCOPE, collection_scope
+from src.utils.downsample import lttb
+from src.utils.filters import add_photo_filters
 from src.utils.gps import calculate_distance, Coordinate
 
+# Downsampled series kept per (collection, resolution)
+SERIES_CACHE_SIZE = 256
+
+# Mean Earth radius used by calculate_distance, in meters
+EARTH_RADIUS_METERS = 6371000
+
+
+def _filters_scope(collection_id: Optional[str] = None, **filters: Any) -> str:
+    """Generation scope of the photos selected by ``add_photo_filters`` arguments."""
+    return collection_scope(collection_id) if collection_id else GLOBAL_SCOPE
+
+
+def _leg_meters(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Great-circle distance between two points in meters."""
+    return calculate_distance(Coordinate(lat1, lon1), Coordinate(lat2, lon2)) * 1000
+
+
+def _leg_meters_sql(lat1: Any, lon1: Any, lat2: Any, lon2: Any) -> ColumnElement[float]:
+    """SQL expression of ``_leg_meters``; NULL when either point is NULL."""
+    dlat = func.radians(lat2 - lat1) / 2
+    dlon = func.radians(lon2 - lon1) / 2
+    a = func.power(func.sin(dlat), 2) + func.cos(func.radians(lat1)) * func.cos(func.radians(lat2)) * func.power(
+        func.sin(dlon), 2
+    )
+    return 2 * EARTH_RADIUS_METERS * func.asin(func.sqrt(a))
+
+
 class FlightService:
-    """Service for calculating flight statistics."""
+    """Service for calculating flight statistics.
+
+    A flight is the time-ordered sequence of photos within a collection.
+    Each photo's metadata carries its cumulative along-track distance, so the
+    distance flown between two timestamps is the difference of two lookups on
+    the ``(collection_id, timestamp)`` index.
+    """
+
+    def __init__(self, session: Optional[AsyncSession] = None):
+        self.session = session
+
+    @property
+    def db(self) -> AsyncSession:
+        """The session; only the in-memory calculations work without one."""
+        if self.session is None:
+            raise RuntimeError("FlightService needs a session for database queries")
+        return self.session
 
     def calculate_stats(self, photos: List[Photo]) -> Dict[str, Any]:
         """Calculate statistics for a list of photos.
@@ -19,7 +70,24 @@ class FlightService:
             - date_start: Timestamp of first photo
             - date_end: Timestamp of last photo
         """
-        if not photos:
+        # Sort photos by time
+        sorted_photos = sorted(photos, key=lambda p: p.timestamp)
+        return self.track_stats([
+            (p.timestamp, p.metadata_.latitude, p.metadata_.longitude) if p.metadata_ else (p.timestamp, None, None)
+            for p in sorted_photos
+        ])
+
+    def track_stats(self, track: List[Tuple[datetime, Optional[float], Optional[float]]]) -> Dict[str, Any]:
+        """Calculate statistics for a time-ordered track.
+
+        Args:
+            track: ``(timestamp, latitude, longitude)`` per photo in capture
+                order; the position is None for photos without metadata
+
+        Returns:
+            Same dictionary as ``calculate_stats``
+        """
+        if not track:
             return {
                 "total_distance_meters": 0,
                 "total_photos": 0,
@@ -27,25 +95,264 @@ class FlightService:
                 "date_end": None,
                 "total_duration_seconds": 0
             }
-            
-        # Sort photos by time
-        sorted_photos = sorted(photos, key=lambda p: p.timestamp)
-        
+
         total_distance_km = 0.0
-        
-        for i in range(len(sorted_photos) - 1):
-            p1 = sorted_photos[i]
-            p2 = sorted_photos[i+1]
-            
-            if p1.metadata_ and p2.metadata_:
-                c1 = Coordinate(p1.metadata_.latitude, p1.metadata_.longitude)
-                c2 = Coordinate(p2.metadata_.latitude, p2.metadata_.longitude)
-                total_distance_km += calculate_distance(c1, c2)
-                
+
+        for (_, lat1, lon1), (_, lat2, lon2) in zip(track, track[1:]):
+            if lat1 is not None and lon1 is not None and lat2 is not None and lon2 is not None:
+                total_distance_km += calculate_distance(Coordinate(lat1, lon1), Coordinate(lat2, lon2))
+
         return {
             "total_distance_meters": total_distance_km * 1000,
-            "total_photos": len(photos),
-            "date_start": sorted_photos[0].timestamp,
-            "date_end": sorted_photos[-1].timestamp,
-            "total_duration_seconds": (sorted_photos[-1].timestamp - sorted_photos[0].timestamp).total_seconds()
+            "total_photos": len(track),
+            "date_start": track[0][0],
+            "date_end": track[-1][0],
+            "total_duration_seconds": (track[-1][0] - track[0][0]).total_seconds()
         }
+
+    @staticmethod
+    def track_stmt(**filters: Any) -> StatementLambdaElement:
+        """Capture-order track of the photos matching ``add_photo_filters`` filters.
+
+        Selects only the position columns on ``photos``, which the
+        capture-order indexes cover, so no metadata join or table lookup
+        is needed.
+
+        Args:
+            **filters: Keyword arguments of ``add_photo_filters``
+
+        Returns:
+            Cached statement of ``(timestamp, latitude, longitude)`` rows
+        """
+        stmt = lambda_stmt(lambda: select(Photo.timestamp, Photo.latitude, Photo.longitude))
+        stmt = add_photo_filters(stmt, **filters)
+        stmt += lambda s: s.order_by(Photo.timestamp, Photo.id)
+        return stmt
+
+    @cached("flight_stats", scope=_filters_scope)
+    async def stats(self, **filters: Any) -> Dict[str, Any]:
+        """Calculate statistics for the photos matching the given filters.
+
+        Cached until the data generation of the filtered photos changes.
+
+        Args:
+            **filters: Keyword arguments of ``add_photo_filters`` (date
+                range, bounds, collection)
+
+        Returns:
+            Same dictionary as ``calculate_stats``
+        """
+        result = await self.db.execute(self.track_stmt(**filters))
+        return self.track_stats([tuple(row) for row in result.all()])
+
+    async def insert_into_flight(self, photo: Photo, metadata: PhotoMetadata) -> float:
+        """Place a new photo on its flight track and maintain cumulative distances.
+
+        The photo's cumulative distance is derived from its predecessor in
+        capture order. If the photo lands in the middle of the track, every
+        later photo is shifted by the length change in a single UPDATE.
+        The caller owns the transaction.
+
+        Args:
+            photo: Flushed Photo (needs id, collection_id and timestamp)
+            metadata: The photo's metadata; ``cumulative_distance`` is set in place
+
+        Returns:
+            Change in the flight's total distance, in meters
+        """
+        before = or_(
+            Photo.timestamp < photo.timestamp,
+            and_(Photo.timestamp == photo.timestamp, Photo.id < photo.id),
+        )
+        after = or_(
+            Photo.timestamp > photo.timestamp,
+            and_(Photo.timestamp == photo.timestamp, Photo.id > photo.id),
+        )
+        track = (
+            select(PhotoMetadata.latitude, PhotoMetadata.longitude, PhotoMetadata.cumulative_distance)
+            .join(Photo, PhotoMetadata.photo_id == Photo.id)
+            .where(Photo.collection_id == photo.collection_id)
+        )
+
+        prev_query = track.where(before).order_by(Photo.timestamp.desc(), Photo.id.desc()).limit(1)
+        prev = (await self.db.execute(prev_query)).first()
+        next_query = track.where(after).order_by(Photo.timestamp, Photo.id).limit(1)
+        nxt = (await self.db.execute(next_query)).first()
+
+        to_prev = _leg_meters(prev.latitude, prev.longitude, metadata.latitude, metadata.longitude) if prev else 0.0
+        metadata.cumulative_distance = (prev.cumulative_distance + to_prev) if prev else 0.0
+
+        if not nxt:
+            return to_prev
+
+        to_next = _leg_meters(metadata.latitude, metadata.longitude, nxt.latitude, nxt.longitude)
+        replaced = _leg_meters(prev.latitude, prev.longitude, nxt.latitude, nxt.longitude) if prev else 0.0
+        delta = to_prev + to_next - replaced
+
+        later_ids = select(Photo.id).where(Photo.collection_id == photo.collection_id, after)
+        await self.db.execute(
+            update(PhotoMetadata)
+            .where(PhotoMetadata.photo_id.in_(later_ids))
+            .values(cumulative_distance=PhotoMetadata.cumulative_distance + delta)
+            .execution_options(synchronize_session="fetch")
+        )
+        return delta
+
+    async def distance_between(
+        self, collection_id: str, start: Optional[datetime] = None, end: Optional[datetime] = None
+    ) -> float:
+        """Distance flown within a collection between two timestamps.
+
+        Args:
+            collection_id: Collection (flight) to measure
+            start: Window start (inclusive); open-ended when None
+            end: Window end (inclusive); open-ended when None
+
+        Returns:
+            Distance in meters, 0 when fewer than two photos fall in the window
+        """
+        track = (
+            select(PhotoMetadata.cumulative_distance)
+            .join(Photo, PhotoMetadata.photo_id == Photo.id)
+            .where(Photo.collection_id == collection_id)
+        )
+        first_query = track.order_by(Photo.timestamp, Photo.id).limit(1)
+        last_query = track.order_by(Photo.timestamp.desc(), Photo.id.desc()).limit(1)
+        if start:
+            first_query = first_query.where(Photo.timestamp >= start)
+            last_query = last_query.where(Photo.timestamp >= start)
+        if end:
+            first_query = first_query.where(Photo.timestamp <= end)
+            last_query = last_query.where(Photo.timestamp <= end)
+
+        first = (await self.db.execute(first_query)).scalar_one_or_none()
+        last = (await self.db.execute(last_query)).scalar_one_or_none()
+        if first is None or last is None:
+            return 0.0
+        return max(last - first, 0.0)
+
+    async def rebuild_cumulative_distances(self, collection_id: str, since: Optional[datetime] = None) -> float:
+        """Recompute cumulative distances of a collection in one UPDATE.
+
+        Used after photos are moved into or out of a collection. Legs and
+        running totals are computed by window functions in the database, so
+        no metadata is loaded; with ``since``, only the photos from the last
+        one captured before it onwards are rewritten. The caller owns the
+        transaction.
+
+        Args:
+            collection_id: Collection (flight) to rebuild
+            since: Earliest capture time whose distances may have changed;
+                the whole track when None
+
+        Returns:
+            Total distance of the flight in meters
+        """
+        track = (
+            select(Photo.timestamp, Photo.id, PhotoMetadata.cumulative_distance)
+            .join(Photo, PhotoMetadata.photo_id == Photo.id)
+            .where(Photo.collection_id == collection_id)
+        )
+        anchor = None
+        if since is not None:
+            anchor_query = track.where(Photo.timestamp < since).order_by(Photo.timestamp.desc(), Photo.id.desc())
+            anchor = (await self.db.execute(anchor_query.limit(1))).first()
+
+        order = (Photo.timestamp, Photo.id)
+        window = (
+            select(
+                PhotoMetadata.id,
+                Photo.timestamp,
+                Photo.id.label("photo_id"),
+                PhotoMetadata.latitude,
+                PhotoMetadata.longitude,
+                func.lag(PhotoMetadata.latitude).over(order_by=order).label("prev_latitude"),
+                func.lag(PhotoMetadata.longitude).over(order_by=order).label("prev_longitude"),
+            )
+            .join(Photo, PhotoMetadata.photo_id == Photo.id)
+            .where(Photo.collection_id == collection_id)
+        )
+        if anchor is not None:
+            window = window.where(
+                or_(
+                    Photo.timestamp > anchor.timestamp,
+                    and_(Photo.timestamp == anchor.timestamp, Photo.id >= anchor.id),
+                )
+            )
+        points = window.subquery()
+
+        # The anchor keeps its distance; the first row has no leg (NULL)
+        leg = _leg_meters_sql(points.c.prev_latitude, points.c.prev_longitude, points.c.latitude, points.c.longitude)
+        running = func.sum(leg).over(order_by=(points.c.timestamp, points.c.photo_id))
+        offset = anchor.cumulative_distance if anchor is not None else 0.0
+        distances = select(points.c.id, (func.coalesce(running, 0.0) + offset).label("distance")).subquery()
+        await self.db.execute(
+            update(PhotoMetadata)
+            .where(PhotoMetadata.id == distances.c.id)
+            .values(cumulative_distance=distances.c.distance)
+            .execution_options(synchronize_session=False)
+        )
+
+        last_query = track.order_by(Photo.timestamp.desc(), Photo.id.desc()).limit(1)
+        last = (await self.db.execute(last_query)).first()
+        return float(last.cumulative_distance) if last is not None else 0.0
+
+    @cached("flight_series", scope=lambda collection_id, points: collection_scope(collection_id),
+            maxsize=SERIES_CACHE_SIZE)
+    async def get_series(self, collection_id: str, points: int) -> Dict[str, Any]:
+        """Altitude and ground-speed time series for a flight.
+
+        Both series are computed in one pass over a column-only query, then
+        downsampled independently with LTTB so peaks survive. Results are
+        cached per collection and resolution until the collection's data
+        generation changes.
+
+        Args:
+            collection_id: Collection (flight) to chart
+            points: Maximum number of points per series
+
+        Returns:
+            Dictionary with ``altitude`` and ``speed`` series (parallel
+            ``timestamps``/``values`` lists; speed in m/s) and the raw
+            ``total_points`` count
+        """
+        query = (
+            select(Photo.timestamp, PhotoMetadata.altitude, PhotoMetadata.cumulative_distance)
+            .join(PhotoMetadata, PhotoMetadata.photo_id == Photo.id)
+            .where(Photo.collection_id == collection_id)
+            .order_by(Photo.timestamp, Photo.id)
+        )
+        rows = (await self.db.execute(query)).all()
+
+        alt_t: List[datetime] = []
+        alt_v: List[float] = []
+        speed_t: List[datetime] = []
+        speed_v: List[float] = []
+        prev = None
+        for row in rows:
+            if row.altitude is not None:
+                alt_t.append(row.timestamp)
+                alt_v.append(row.altitude)
+            if prev is not None:
+                elapsed = (row.timestamp - prev.timestamp).total_seconds()
+                if elapsed > 0:
+                    speed_t.append(row.timestamp)
+                    speed_v.append((row.cumulative_distance - prev.cumulative_distance) / elapsed)
+            prev = row
+
+        return {
+            "collection_id": collection_id,
+            "total_points": len(rows),
+            "altitude": _downsample(alt_t, alt_v, points),
+            "speed": _downsample(speed_t, speed_v, points),
+        }
+
+
+def _downsample(timestamps: List[datetime], values: List[float], points: int) -> Dict[str, list]:
+    """Apply LTTB to a timestamped series."""
+    xs = [t.timestamp() for t in timestamps]
+    kept = lttb(xs, values, points)
+    return {
+        "timestamps": [timestamps[i] for i in kept],
+        "values": [values[i] for i in kept],
+    }
@@ -0,0 +1,78 @@
+"""Data generation counters used to invalidate derived caches."""
+from datetime import datetime
+from typing import Any, Dict, Optional, cast
+
+from sqlalchemy import CursorResult, Executable, lambda_stmt, select, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.models.data_generation import DataGeneration
+
+GLOBAL_SCOPE = "global"
+
+
+def collection_scope(collection_id: str) -> str:
+    """Generation scope for a single collection."""
+    return f"collection:{collection_id}"
+
+
+async def get_generation(session: AsyncSession, scope: str = GLOBAL_SCOPE) -> int:
+    """Get the current generation of a scope.
+
+    Args:
+        session: Database session
+        scope: Scope name
+
+    Returns:
+        Current generation, 0 if the scope has never been bumped
+    """
+    # Read before every cached service call, so keep it a cached statement
+    stmt = lambda_stmt(lambda: select(DataGeneration.generation).where(DataGeneration.scope == scope))
+    generation = (await session.execute(stmt)).scalar_one_or_none()
+    return generation or 0
+
+
+def _upsert(dialect: str, scope: str) -> Executable:
+    """INSERT a scope's first generation, or increment it if the row exists."""
+    on_conflict: Dict[str, Any] = {
+        "index_elements": [DataGeneration.scope],
+        "set_": {"generation": DataGeneration.generation + 1, "updated_at": datetime.utcnow()},
+    }
+    if dialect == "postgresql":
+        return postgresql.insert(DataGeneration).values(scope=scope, generation=1).on_conflict_do_update(**on_conflict)
+    return sqlite.insert(DataGeneration).values(scope=scope, generation=1).on_conflict_do_update(**on_conflict)
+
+
+async def bump_generation(session: AsyncSession, collection_id: Optional[str] = None) -> None:
+    """Bump the global generation, and the collection's when given.
+
+    Runs inside the caller's transaction so the bump commits (or rolls
+    back) together with the data change it describes.
+
+    Args:
+        session: Database session
+        collection_id: Collection whose data changed
+    """
+    scopes = [GLOBAL_SCOPE]
+    if collection_id is not None:
+        scopes.append(collection_scope(collection_id))
+
+    dialect = session.bind.dialect.name
+    for scope in scopes:
+        if dialect in ("sqlite", "postgresql"):
+            # A single upsert, so concurrent first bumps of a scope cannot
+            # both insert and trip the unique constraint
+            await session.execute(_upsert(dialect, scope))
+            continue
+
+        result = cast(
+            CursorResult,
+            await session.execute(
+                update(DataGeneration)
+                .where(DataGeneration.scope == scope)
+                .values(generation=DataGeneration.generation + 1)
+            ),
+        )
+        if result.rowcount == 0:
+            session.add(DataGeneration(scope=scope, generation=1))
+    await session.flush()
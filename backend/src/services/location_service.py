@@ -1,5 +1,5 @@
 """Location service for managing GPS locations and markers."""
-from typing import List
+from typing import Any, Dict, List
 import logging
 
 from sqlalchemy import select, delete
@@ -9,6 +9,9 @@ from sqlalchemy.orm import selectinload
 from src.models.photo import PhotoMetadata
 from src.models.gps_location import GPSLocation
 from src.models.photo_marker import PhotoMarker
+from src.schemas.location import PhotoMarkerResponse
+from src.services.cache import cached
+from src.services.generation import bump_generation
 from src.utils.clustering import cluster_photos
 
 logger = logging.getLogger(__name__)
@@ -20,15 +23,18 @@ class LocationService:
     def __init__(self, session: AsyncSession):
         self.session = session
 
-    async def get_all_markers(self) -> List[PhotoMarker]:
+    @cached("markers")
+    async def get_all_markers(self) -> List[Dict[str, Any]]:
         """Get all photo markers with their locations.
-        
+
+        Cached until the next import or recluster.
+
         Returns:
-            List of PhotoMarker objects with loaded location relationship
+            List of markers shaped like ``PhotoMarkerResponse``
         """
         stmt = select(PhotoMarker).options(selectinload(PhotoMarker.location))
         result = await self.session.execute(stmt)
-        return list(result.scalars().all())
+        return [PhotoMarkerResponse.model_validate(marker).model_dump() for marker in result.scalars()]
 
     async def regenerate_markers(self) -> int:
         """Regenerate all markers from photo metadata.
@@ -40,12 +46,13 @@ class LocationService:
         await self.session.execute(delete(PhotoMarker))
         await self.session.execute(delete(GPSLocation))
         
-        # 2. Fetch all metadata
-        stmt = select(PhotoMetadata)
+        # 2. Fetch the positions (columns only, no ORM objects)
+        stmt = select(PhotoMetadata.photo_id, PhotoMetadata.latitude, PhotoMetadata.longitude)
         result = await self.session.execute(stmt)
-        metadata_list = list(result.scalars().all())
+        metadata_list = result.all()
         
         if not metadata_list:
+            await bump_generation(self.session)
             return 0
 
         # 3. Cluster photos
@@ -71,7 +78,9 @@ class LocationService:
             )
             self.session.add(marker)
             markers_count += 1
-            
+
+        # Invalidates the cached markers
+        await bump_generation(self.session)
         await self.session.commit()
         logger.info(f"Regenerated {markers_count} markers from {len(metadata_list)} photos")
         return markers_count
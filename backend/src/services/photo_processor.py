@@ -11,6 +11,8 @@ from sqlalchemy import select
 from src.models.photo import Photo, PhotoMetadata
 from src.services.gps_extractor import GPSExtractor
 from src.services.collection_manager import CollectionManager
+from src.services.flight_service import FlightService
+from src.services.generation import bump_generation
 from src.utils.file_utils import scan_directory, get_file_info, calculate_file_hash
 from src.exceptions import InvalidGPSData
 
@@ -24,6 +26,7 @@ class PhotoProcessor:
         self.session = session
         self.gps_extractor = GPSExtractor()
         self.collection_manager = CollectionManager(session)
+        self.flight_service = FlightService(session)
 
     def scan_folder(self, folder_path: Path) -> Generator[Path, None, None]:
         """Scan a folder for supported image files.
@@ -91,10 +94,6 @@ class PhotoProcessor:
                 stats["errors"].append(error_msg)
                 logger.warning(error_msg)
 
-        # Update collection count
-        if stats["successful"] > 0:
-            await self.collection_manager.update_photo_count(collection_id, stats["successful"])
-
         return stats
 
     async def _process_single_photo(self, file_path: Path, collection_id: str) -> Photo:
@@ -146,7 +145,10 @@ class PhotoProcessor:
             timestamp=timestamp,
             file_size=file_info["size"],
             format=file_info["extension"].lstrip("."),
-            collection_id=collection_id
+            collection_id=collection_id,
+            latitude=metadata_obj.latitude,
+            longitude=metadata_obj.longitude,
+            altitude=metadata_obj.altitude,
         )
 
         self.session.add(photo)
@@ -157,9 +159,18 @@ class PhotoProcessor:
             await self.session.rollback()
             raise Exception("Photo already exists in database")
 
-        # 5. Create Metadata record
+        # 5. Create Metadata record, place it on the flight track and fold
+        # the photo into the collection summary, all in this transaction.
+        # Lock the summary before reading the track, so concurrent imports
+        # into the collection see each other's neighbours
+        collection = await self.collection_manager.lock_summary(collection_id)
         metadata_obj.photo_id = photo.id
+        distance_delta = await self.flight_service.insert_into_flight(photo, metadata_obj)
         self.session.add(metadata_obj)
+        await self.collection_manager.record_photo(
+            collection, photo, metadata_obj.camera_model, distance_delta
+        )
+        await bump_generation(self.session, collection_id)
         
         await self.session.commit()
         
@@ -0,0 +1,289 @@
+"""Service for reading photos as plain rows.
+
+Hot list endpoints serialize thousands of photos per request. Loading them
+as ORM objects and re-validating each one through ``PhotoResponse`` costs
+far more than the query itself, so this service selects the response
+columns directly and shapes each row into a ``PhotoResponse``-compatible
+dict. The output is trusted: it is built from typed columns and returned
+without another round of Pydantic validation.
+
+Clients that need only a few fields (the map needs id, position and time)
+can pass a sparse fieldset, which narrows the select itself. Position-only
+fieldsets are read from the position columns copied onto ``photos``, which
+the capture-order indexes cover, so they need neither the metadata join
+nor a table lookup. Unbounded
+reads use ``stream_dicts``, which fetches from a server-side cursor one
+batch at a time instead of materializing the whole result.
+
+The list endpoints build their statements with ``rows_stmt`` (a
+``lambda_stmt``) rather than ``rows_query``: the select is then built and
+compiled once per projection and filter combination, and later requests
+only supply new parameter values.
+"""
+from typing import Any, AsyncIterator, Dict, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+from sqlalchemy import Select, StatementLambdaElement, lambda_stmt, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.exceptions import ValidationError
+from src.models.photo import Photo, PhotoMetadata
+from src.services.cache import get_service_cache
+from src.services.generation import GLOBAL_SCOPE, get_generation
+from src.utils.pagination import count_query, estimate_rows
+
+# Response fields, in PhotoResponse / PhotoMetadataBase order
+PHOTO_FIELDS = (
+    "id",
+    "created_at",
+    "updated_at",
+    "filename",
+    "file_path",
+    "timestamp",
+    "file_size",
+    "format",
+    "collection_id",
+)
+METADATA_FIELDS = (
+    "id",
+    "created_at",
+    "updated_at",
+    "latitude",
+    "longitude",
+    "altitude",
+    "camera_model",
+    "iso",
+    "shutter_speed",
+    "aperture",
+    "cumulative_distance",
+)
+# Metadata fields also stored on photos
+POSITION_FIELDS = ("latitude", "longitude", "altitude")
+
+# Keyset pagination sort key (capture order)
+PHOTO_SORT_KEY = (Photo.timestamp, Photo.id)
+
+# Rows fetched per round trip by stream_dicts
+STREAM_BATCH_SIZE = 1000
+
+# A rows_query select or a rows_stmt lambda statement
+RowsQuery = Union[Select, StatementLambdaElement]
+
+# COUNT(*) totals kept per (generation scope, statement cache key,
+# parameter values)
+TOTALS_CACHE_SIZE = 1024
+
+
+class Projection(NamedTuple):
+    """Photo and metadata fields selected for a response.
+
+    Rows are shaped like a serialized ``PhotoResponse`` restricted to the
+    selected fields: metadata fields stay nested under ``metadata``, which
+    is null for photos without metadata.
+    """
+
+    photo_fields: Tuple[str, ...]
+    metadata_fields: Tuple[str, ...] = ()
+
+    @property
+    def position_only(self) -> bool:
+        """Whether every metadata field can be read from ``photos``."""
+        return set(self.metadata_fields) <= set(POSITION_FIELDS)
+
+    @property
+    def columns(self) -> List[Any]:
+        columns = [getattr(Photo, name) for name in self.photo_fields]
+        if self.metadata_fields:
+            # Presence marker, selected even when not requested: the
+            # metadata id via the outer join, or the copied latitude
+            # (never null in metadata)
+            source = Photo if self.position_only else PhotoMetadata
+            columns.append((Photo.latitude if self.position_only else PhotoMetadata.id).label("metadata_present"))
+            columns.extend(getattr(source, name).label(f"metadata_{name}") for name in self.metadata_fields)
+        return columns
+
+    def to_dict(self, row: Sequence[Any]) -> Dict[str, Any]:
+        """Shape a row selected with ``columns``."""
+        width = len(self.photo_fields)
+        photo = dict(zip(self.photo_fields, row[:width]))
+        if self.metadata_fields:
+            marker, *values = row[width:]
+            photo["metadata"] = dict(zip(self.metadata_fields, values)) if marker is not None else None
+        return photo
+
+
+FULL_PROJECTION = Projection(PHOTO_FIELDS, METADATA_FIELDS)
+
+# Always returned: they identify the photo and form the pagination cursor
+REQUIRED_FIELDS = ("id", "timestamp")
+
+
+def parse_fields(fields: Optional[str]) -> Projection:
+    """Parse a ``fields=`` sparse fieldset.
+
+    Names are photo fields (``filename``), metadata fields (``latitude``)
+    or explicitly qualified metadata fields (``metadata.id``). ``id`` and
+    ``timestamp`` are always included.
+
+    Args:
+        fields: Comma-separated field names, or None for every field
+
+    Returns:
+        Projection selecting the requested fields
+
+    Raises:
+        ValidationError: If a field name is unknown
+
+    Example:
+        >>> parse_fields("latitude,longitude")
+        Projection(photo_fields=('id', 'timestamp'), metadata_fields=('latitude', 'longitude'))
+    """
+    if not fields:
+        return FULL_PROJECTION
+
+    photo = set(REQUIRED_FIELDS)
+    metadata = set()
+    for name in (name.strip() for name in fields.split(",")):
+        if not name:
+            continue
+        if name.startswith("metadata.") and name.removeprefix("metadata.") in METADATA_FIELDS:
+            metadata.add(name.removeprefix("metadata."))
+        elif name in PHOTO_FIELDS:
+            photo.add(name)
+        elif name in METADATA_FIELDS:
+            metadata.add(name)
+        else:
+            raise ValidationError(f"Unknown field: {name}", error_code="INVALID_FIELDS")
+
+    return Projection(
+        tuple(name for name in PHOTO_FIELDS if name in photo),
+        tuple(name for name in METADATA_FIELDS if name in metadata),
+    )
+
+
+class PhotoService:
+    """Service for photo reads that bypass ORM hydration."""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    @staticmethod
+    def rows_query(*clauses: Any, projection: Projection = FULL_PROJECTION) -> Select:
+        """Column-only select of a projection under the given filters.
+
+        ``photo_metadata`` is outer-joined only when the projection or a
+        filter needs it, so a photo-only fieldset reads one table.
+
+        Args:
+            *clauses: Filter expressions over ``Photo`` (and ``PhotoMetadata``)
+            projection: Fields to select
+
+        Returns:
+            Select whose rows ``projection.to_dict`` can shape
+        """
+        query = select(*projection.columns).select_from(Photo).where(*clauses)
+        if PhotoMetadata.__table__ in query.get_final_froms():
+            query = query.outerjoin(PhotoMetadata, PhotoMetadata.photo_id == Photo.id)
+        return query
+
+    @staticmethod
+    def rows_stmt(projection: Projection = FULL_PROJECTION) -> StatementLambdaElement:
+        """``rows_query`` without filters, as a cached lambda statement.
+
+        Add filters with ``add_photo_filters`` and paging with
+        ``keyset_stmt``. Filters on ``PhotoMetadata`` are not supported:
+        the join is decided by the projection alone.
+
+        Args:
+            projection: Fields to select
+
+        Returns:
+            Statement whose rows ``projection.to_dict`` can shape
+        """
+        return lambda_stmt(
+            lambda: PhotoService.rows_query(projection=projection),
+            # Projections are tuples of names, not SQL elements
+            track_on=[",".join(projection.photo_fields), ",".join(projection.metadata_fields)],
+        )
+
+    async def fetch_dicts(self, query: RowsQuery, projection: Projection = FULL_PROJECTION) -> List[Dict[str, Any]]:
+        """Run a ``rows_query`` based select and return response dicts.
+
+        Args:
+            query: Query built from ``rows_query`` or ``rows_stmt``
+            projection: Projection the query was built with
+
+        Returns:
+            One dict per photo, ready to serialize
+        """
+        result = await self.session.execute(query)
+        return [projection.to_dict(row) for row in result.all()]
+
+    async def stream_dicts(
+        self, query: RowsQuery, projection: Projection = FULL_PROJECTION
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Stream a ``rows_query`` based select as batches of response dicts.
+
+        Uses a server-side cursor so only one batch is held in memory.
+
+        Args:
+            query: Query built from ``rows_query`` or ``rows_stmt``
+            projection: Projection the query was built with
+
+        Yields:
+            Lists of at most ``STREAM_BATCH_SIZE`` dicts
+        """
+        result = await self.session.stream(query.execution_options(yield_per=STREAM_BATCH_SIZE))
+        async for partition in result.partitions():
+            yield [projection.to_dict(row) for row in partition]
+
+    async def count(self, *clauses: Any, scope: str = GLOBAL_SCOPE, approximate: bool = False) -> int:
+        """Count photos matching the given filters.
+
+        Exact totals are cached until the data generation of ``scope``
+        changes, so paging through a listing counts once, not per page.
+
+        Args:
+            *clauses: Filter expressions over ``Photo`` (and ``PhotoMetadata``)
+            scope: Generation scope covering the filtered photos, e.g. the
+                collection's scope when filtering by collection
+            approximate: Estimate unfiltered totals from planner statistics
+
+        Returns:
+            Number of matching photos
+        """
+        if approximate and not clauses:
+            estimate = await estimate_rows(self.session, Photo.__tablename__)
+            if estimate is not None:
+                return estimate
+
+        query = count_query(Photo, *clauses)
+        # Join metadata only when a filter needs it
+        if PhotoMetadata.__table__ in query.get_final_froms():
+            query = count_query(Photo.__table__.join(PhotoMetadata.__table__), *clauses)
+        return await self.count_statement(query, scope)
+
+    async def count_statement(self, query: Any, scope: str = GLOBAL_SCOPE) -> int:
+        """Run a ``COUNT(*)`` statement, cached like ``count``.
+
+        Args:
+            query: Count statement, e.g. ``count_stmt(Photo)`` with
+                ``add_photo_filters``
+            scope: Generation scope covering the counted photos
+
+        Returns:
+            The count
+        """
+
+        async def load() -> int:
+            count: int = (await self.session.execute(query)).scalar_one()
+            return count
+
+        cache = get_service_cache("photo_totals", TOTALS_CACHE_SIZE)
+        if cache is None:
+            return await load()
+
+        # The statement's cache key identifies its SQL without compiling it
+        cache_key = query._generate_cache_key()
+        key = (scope, cache_key.key, tuple(param.effective_value for param in cache_key.bindparams))
+        total: int = await cache.get_or_load(key, await get_generation(self.session, scope), load)
+        return total
@@ -1,9 +1,7 @@
 """Clustering utilities for photo locations."""
-from typing import List, Dict, Tuple
+from typing import Any, List, Dict, Sequence
 from math import radians, cos, sin, asin, sqrt
 
-from src.models.photo import PhotoMetadata
-
 
 def haversine_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
     """Calculate the great circle distance between two points in meters."""
@@ -18,11 +16,12 @@ def haversine_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> fl
     return R * c
 
 
-def cluster_photos(metadata_list: List[PhotoMetadata], radius_meters: float = 10.0) -> List[Dict]:
+def cluster_photos(metadata_list: Sequence[Any], radius_meters: float = 10.0) -> List[Dict]:
     """Cluster photos based on geographic proximity.
     
     Args:
-        metadata_list: List of PhotoMetadata objects
+        metadata_list: PhotoMetadata objects, or rows with their
+            ``photo_id``, ``latitude`` and ``longitude`` columns
         radius_meters: Distance in meters to group photos
         
     Returns:
@@ -0,0 +1,56 @@
+"""Time-series downsampling utilities."""
+from typing import List, Sequence
+
+
+def lttb(xs: Sequence[float], ys: Sequence[float], threshold: int) -> List[int]:
+    """Downsample a series with Largest-Triangle-Three-Buckets.
+
+    Keeps the first and last points and, for every bucket in between, the
+    point forming the largest triangle with the previously kept point and
+    the average of the next bucket. This preserves peaks and the overall
+    visual shape far better than picking every n-th point.
+
+    Args:
+        xs: X values (e.g. epoch seconds), ascending
+        ys: Y values, same length as xs
+        threshold: Number of points to keep
+
+    Returns:
+        Indices of the kept points, ascending
+
+    Example:
+        >>> lttb([0, 1, 2, 3, 4], [0, 5, 0, 0, 0], 3)
+        [0, 1, 4]
+    """
+    n = len(xs)
+    if threshold >= n or threshold < 3:
+        return list(range(n))
+
+    every = (n - 2) / (threshold - 2)
+    kept = [0]
+    a = 0
+
+    for i in range(threshold - 2):
+        avg_start = int((i + 1) * every) + 1
+        avg_end = min(int((i + 2) * every) + 1, n)
+        span = avg_end - avg_start
+        avg_x = sum(xs[avg_start:avg_end]) / span
+        avg_y = sum(ys[avg_start:avg_end]) / span
+
+        start = int(i * every) + 1
+        end = int((i + 1) * every) + 1
+        ax, ay = xs[a], ys[a]
+
+        best_area = -1.0
+        best = start
+        for j in range(start, end):
+            area = abs((ax - avg_x) * (ys[j] - ay) - (ax - xs[j]) * (avg_y - ay))
+            if area > best_area:
+                best_area = area
+                best = j
+
+        kept.append(best)
+        a = best
+
+    kept.append(n - 1)
+    return kept
@@ -1,7 +1,83 @@
+"""Photo filters.
+
+``photo_filter_clauses`` compiles filters into SQL predicates and should be
+used for anything read from the database; bounds use the dialect-aware
+spatial predicates of ``src.db.spatial``. ``add_photo_filters`` adds the
+same filters to a cached ``lambda_stmt`` for the hot endpoints. The
+``filter_by_*`` functions filter lists of photos that are already loaded in
+memory.
+"""
 from datetime import datetime
 from typing import List, Dict, Any, Optional
+
+from sqlalchemy import StatementLambdaElement
+
+from src.db.spatial import bounds_clause
 from src.models.photo import Photo
 
+
+def photo_filter_clauses(
+    date_start: Optional[datetime] = None,
+    date_end: Optional[datetime] = None,
+    bounds: Any = None,
+) -> list:
+    """Build SQL WHERE clauses for date range and bounds filters.
+
+    Bounds predicates use the photo position columns, so no join is needed.
+
+    Args:
+        date_start: Earliest capture time (inclusive)
+        date_end: Latest capture time (inclusive)
+        bounds: Object with north/south/east/west attributes
+
+    Returns:
+        List of SQLAlchemy boolean clauses (empty when no filter is set)
+    """
+    clauses = []
+    if date_start:
+        clauses.append(Photo.timestamp >= date_start)
+    if date_end:
+        clauses.append(Photo.timestamp <= date_end)
+    if bounds:
+        clauses.append(bounds_clause(bounds.south, bounds.west, bounds.north, bounds.east))
+    return clauses
+
+
+def add_photo_filters(
+    stmt: StatementLambdaElement,
+    date_start: Optional[datetime] = None,
+    date_end: Optional[datetime] = None,
+    bounds: Any = None,
+    collection_id: Optional[str] = None,
+) -> StatementLambdaElement:
+    """Add the ``photo_filter_clauses`` filters to a lambda statement.
+
+    Each filter is its own lambda, so the statement is cached per
+    combination of filters present and the values travel as bound
+    parameters: repeat requests skip building and compiling the SQL.
+
+    Args:
+        stmt: Statement over ``Photo`` built with ``lambda_stmt``
+        date_start: Earliest capture time (inclusive)
+        date_end: Latest capture time (inclusive)
+        bounds: Object with north/south/east/west attributes
+        collection_id: Only photos of this collection
+
+    Returns:
+        The filtered statement
+    """
+    if collection_id is not None:
+        stmt += lambda s: s.where(Photo.collection_id == collection_id)
+    if date_start:
+        stmt += lambda s: s.where(Photo.timestamp >= date_start)
+    if date_end:
+        stmt += lambda s: s.where(Photo.timestamp <= date_end)
+    if bounds:
+        south, west, north, east = bounds.south, bounds.west, bounds.north, bounds.east
+        stmt += lambda s: s.where(bounds_clause(south, west, north, east))
+    return stmt
+
+
 def filter_by_date_range(photos: List[Photo], start_date: Optional[datetime] = None, end_date: Optional[datetime] = None) -> List[Photo]:
     """Filter photos by date range."""
     if not start_date and not end_date:
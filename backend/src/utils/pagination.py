@@ -0,0 +1,227 @@
+"""Keyset (cursor) pagination helpers.
+
+Offset paging makes the database walk and discard every skipped row, so
+deep pages get linearly slower. Keyset paging instead remembers the sort
+key of the last row returned and resumes with ``WHERE key > last``, which a
+composite index on the sort key answers with a single seek at any depth.
+
+Cursors are opaque to clients: URL-safe base64 of the JSON-encoded sort
+key of the last row on the page. Totals are computed with ``COUNT(*)`` under
+the listing's filters, or estimated from planner statistics on request.
+"""
+import base64
+import binascii
+import json
+import math
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, TypeVar, Union
+
+from sqlalchemy import DateTime, Select, StatementLambdaElement, and_, func, lambda_stmt, or_, select, text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import QueryableAttribute
+from sqlalchemy.sql.elements import ColumnElement
+
+from src.exceptions import ValidationError
+
+T = TypeVar("T")
+
+# Sort key column: a Core column or a mapped attribute such as ``Photo.id``
+SortColumn = Union[ColumnElement[Any], QueryableAttribute[Any]]
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """Encode a sort key as an opaque cursor token.
+
+    Args:
+        values: Sort key values of the last row on a page
+
+    Returns:
+        URL-safe cursor token
+    """
+    payload = json.dumps([v.isoformat() if isinstance(v, datetime) else v for v in values], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, columns: Sequence[SortColumn]) -> List[Any]:
+    """Decode a cursor token back into typed sort key values.
+
+    Args:
+        cursor: Token from ``encode_cursor``
+        columns: Sort key columns, used to restore value types
+
+    Returns:
+        Sort key values, one per column
+
+    Raises:
+        ValidationError: If the token is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        if not isinstance(values, list) or len(values) != len(columns):
+            raise ValueError("cursor does not match the sort key")
+        return [
+            datetime.fromisoformat(value) if isinstance(column.type, DateTime) else value
+            for column, value in zip(columns, values)
+        ]
+    except (ValueError, TypeError, UnicodeError, binascii.Error):
+        raise ValidationError("Invalid pagination cursor", error_code="INVALID_CURSOR")
+
+
+def _after(columns: Sequence[SortColumn], values: Sequence[Any], descending: bool) -> ColumnElement:
+    # (a, b) > (x, y)  ==  a > x OR (a = x AND b > y); expanded rather than a
+    # row-value comparison so every backend can use the composite index
+    column, value = columns[0], values[0]
+    beyond: ColumnElement[bool] = column < value if descending else column > value
+    if len(columns) == 1:
+        return beyond
+    return or_(beyond, and_(column == value, _after(columns[1:], values[1:], descending)))
+
+
+def keyset_query(
+    query: Select,
+    columns: Sequence[SortColumn],
+    cursor: Optional[str],
+    limit: Optional[int],
+    descending: bool = False,
+) -> Select:
+    """Order a query by a sort key and resume it after a cursor.
+
+    One extra row is fetched so ``keyset_page`` can tell whether another
+    page follows. Without a limit the query runs to the end of the result,
+    e.g. for streaming.
+
+    Args:
+        query: Base query
+        columns: Unique sort key, e.g. ``(Photo.timestamp, Photo.id)``
+        cursor: Cursor from the previous page, or None for the first page
+        limit: Page size, or None for no limit
+        descending: Sort newest/largest first
+
+    Returns:
+        Paginated query
+
+    Raises:
+        ValidationError: If the cursor is malformed
+    """
+    if cursor:
+        query = query.where(_after(columns, decode_cursor(cursor, columns), descending))
+    order = [column.desc() if descending else column for column in columns]
+    query = query.order_by(*order)
+    return query if limit is None else query.limit(limit + 1)
+
+
+def keyset_stmt(
+    stmt: StatementLambdaElement,
+    columns: Sequence[SortColumn],
+    cursor: Optional[str],
+    limit: Optional[int],
+    descending: bool = False,
+) -> StatementLambdaElement:
+    """``keyset_query`` for a ``lambda_stmt``, on a two-column sort key.
+
+    Args:
+        stmt: Base statement built with ``lambda_stmt``
+        columns: Unique two-column sort key, e.g. ``(Photo.timestamp, Photo.id)``
+        cursor: Cursor from the previous page, or None for the first page
+        limit: Page size, or None for no limit
+        descending: Sort newest/largest first
+
+    Returns:
+        Paginated statement
+
+    Raises:
+        ValidationError: If the cursor is malformed
+    """
+    first, second = columns
+    if cursor:
+        after_first, after_second = decode_cursor(cursor, columns)
+        if descending:
+            stmt += lambda s: s.where(or_(first < after_first, and_(first == after_first, second < after_second)))
+        else:
+            stmt += lambda s: s.where(or_(first > after_first, and_(first == after_first, second > after_second)))
+    if descending:
+        stmt += lambda s: s.order_by(first.desc(), second.desc())
+    else:
+        stmt += lambda s: s.order_by(first, second)
+    if limit is not None:
+        fetch = limit + 1
+        stmt += lambda s: s.limit(fetch)
+    return stmt
+
+
+def keyset_page(rows: Sequence[T], limit: int, key: Callable[[T], Sequence[Any]]) -> Tuple[List[T], Optional[str]]:
+    """Trim the look-ahead row and build the cursor for the next page.
+
+    Args:
+        rows: Rows from a ``keyset_query``
+        limit: Page size the query was built with
+        key: Extracts the sort key values from a row
+
+    Returns:
+        The page's rows and the next page's cursor (None on the last page)
+    """
+    if len(rows) <= limit:
+        return list(rows), None
+    page = list(rows[:limit])
+    return page, encode_cursor(key(page[-1]))
+
+
+def page_fields(total: int, skip: int, limit: int, cursor: Optional[str]) -> Dict[str, Any]:
+    """Pagination fields of a ``PaginatedResponse``.
+
+    Args:
+        total: Total matching rows
+        skip: Offset of the page (offset paging)
+        limit: Page size
+        cursor: Cursor the page was requested with
+
+    Returns:
+        ``total``, ``page`` (None for cursor pages), ``page_size`` and ``total_pages``
+    """
+    return {
+        "total": total,
+        "page": None if cursor else skip // limit + 1,
+        "page_size": limit,
+        "total_pages": max(1, math.ceil(total / limit)),
+    }
+
+
+def count_query(table: Any, *clauses: ColumnElement) -> Select[Tuple[int]]:
+    """``SELECT COUNT(*)`` over a table or model under the given filters."""
+    return select(func.count()).select_from(table).where(*clauses)
+
+
+def count_stmt(table: Any) -> StatementLambdaElement:
+    """``count_query`` as a ``lambda_stmt``; add filters with ``+=``."""
+    return lambda_stmt(lambda: select(func.count()).select_from(table))
+
+
+async def estimate_rows(session: AsyncSession, table_name: str) -> Optional[int]:
+    """Estimate a table's row count from planner statistics.
+
+    Reads ``sqlite_stat1`` (populated by ``ANALYZE``/``PRAGMA optimize``) on
+    SQLite and ``pg_class.reltuples`` on PostgreSQL, which is O(1) where an
+    exact ``COUNT(*)`` has to scan an index.
+
+    Args:
+        session: Database session
+        table_name: Name of the table to estimate
+
+    Returns:
+        Estimated row count, or None when no statistics are available
+    """
+    dialect = session.bind.dialect.name
+    if dialect == "sqlite":
+        stmt = text("SELECT stat FROM sqlite_stat1 WHERE tbl = :table LIMIT 1")
+        try:
+            stat = (await session.execute(stmt, {"table": table_name})).scalar_one_or_none()
+        except OperationalError:
+            return None  # ANALYZE has never run, so sqlite_stat1 does not exist
+        return int(stat.split()[0]) if stat else None
+    if dialect == "postgresql":
+        stmt = text("SELECT reltuples FROM pg_class WHERE oid = to_regclass(:table)")
+        reltuples = (await session.execute(stmt, {"table": table_name})).scalar_one_or_none()
+        return int(reltuples) if reltuples is not None and reltuples >= 0 else None
+    return None
@@ -1,6 +1,9 @@
 """Pytest configuration and fixtures for backend tests."""
 import asyncio
+import atexit
 import os
+import shutil
+import tempfile
 from pathlib import Path
 from typing import AsyncGenerator, Generator
 
@@ -9,14 +12,25 @@ import pytest_asyncio
 from httpx import AsyncClient, ASGITransport
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 
+from src.app import app
+from src.config import get_settings
+from src.db.session import get_db_read_session, get_db_session
+from src.db.sqlite import install_pragmas
+from src.models.base import Base
+from src.services.cache import clear_caches
+
 # Add src to path for imports
 BACKEND_DIR = Path(__file__).parent.parent
 SRC_DIR = BACKEND_DIR / "src"
 os.sys.path.insert(0, str(SRC_DIR))
 
-from src.app import app
-from src.db.session import get_db_session
-from src.models.base import Base
+# Keep export artifacts out of the working tree. The export cache and job
+# manager read these settings when first used, after this module is loaded
+EXPORT_TMP_DIR = tempfile.mkdtemp(prefix="exports-")
+_settings = get_settings()
+_settings.EXPORT_CACHE_DIR = os.environ.get("EXPORT_CACHE_DIR", os.path.join(EXPORT_TMP_DIR, "cache"))
+_settings.EXPORT_JOBS_DIR = os.environ.get("EXPORT_JOBS_DIR", os.path.join(EXPORT_TMP_DIR, "jobs"))
+atexit.register(shutil.rmtree, EXPORT_TMP_DIR, ignore_errors=True)
 
 
 @pytest.fixture(scope="session")
@@ -35,6 +49,8 @@ async def test_db_engine():
         connect_args={"check_same_thread": False},
         echo=False,
     )
+    # Bulk operations rely on ON DELETE CASCADE, as in the app's SQLite profile
+    install_pragmas(engine, {"foreign_keys": "ON"})
     
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
@@ -66,7 +82,10 @@ async def client(db_session) -> AsyncGenerator[AsyncClient, None]:
     async def override_get_db_session():
         yield db_session
 
+    # Reads and writes share the test session, so reads see uncommitted test
+    # data; tests/integration/test_read_engine.py covers the read-only engine
     app.dependency_overrides[get_db_session] = override_get_db_session
+    app.dependency_overrides[get_db_read_session] = override_get_db_session
     
     async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
         yield ac
@@ -74,6 +93,17 @@ async def client(db_session) -> AsyncGenerator[AsyncClient, None]:
     app.dependency_overrides.clear()
 
 
+@pytest.fixture(autouse=True)
+def clear_service_caches():
+    """Start every test with empty service caches.
+
+    Tests insert rows directly, without bumping data generations, and roll
+    them back afterwards, so cached reads would outlive the data.
+    """
+    clear_caches()
+    yield
+
+
 @pytest.fixture
 def cleanup_uploads(tmp_path):
     """Provide temporary directory for test uploads."""
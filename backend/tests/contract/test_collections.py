@@ -50,3 +50,84 @@ async def test_get_collection_by_id(client: AsyncClient):
     data = response.json()
     assert data["data"]["id"] == collection_id
     assert data["data"]["name"] == "Specific Collection"
+    assert data["data"]["bounds"] is None
+    assert data["data"]["camera_models"] == []
+    assert data["data"]["total_distance_meters"] == 0
+
+
+@pytest.mark.asyncio
+async def test_list_collections_cursor_pagination(client: AsyncClient):
+    """Test that cursor pages cover every collection exactly once, newest first."""
+    for i in range(3):
+        await client.post("/api/v1/collections/", json={"name": f"Paged {i}"})
+
+    response = await client.get("/api/v1/collections/")
+    body = response.json()
+    everything = [c["id"] for c in body["data"]]
+    assert body["total"] == len(everything)
+
+    seen = []
+    cursor = None
+    while True:
+        params = {"limit": 2, **({"cursor": cursor} if cursor else {})}
+        body = (await client.get("/api/v1/collections/", params=params)).json()
+        seen.extend(c["id"] for c in body["data"])
+        cursor = body["next_cursor"]
+        if cursor is None:
+            break
+
+    assert seen == everything
+
+
+@pytest.mark.asyncio
+async def test_delete_collection(client: AsyncClient):
+    """Test deleting a collection."""
+    create_res = await client.post("/api/v1/collections/", json={"name": "Doomed Collection"})
+    collection_id = create_res.json()["data"]["id"]
+
+    response = await client.delete(f"/api/v1/collections/{collection_id}")
+
+    assert response.status_code == 200
+    assert response.json()["data"] == {"collection_id": collection_id, "deleted_photos": 0}
+    assert (await client.get(f"/api/v1/collections/{collection_id}")).status_code == 404
+    assert (await client.delete(f"/api/v1/collections/{collection_id}")).status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_merge_collection(client: AsyncClient):
+    """Test merging one collection into another."""
+    source_id = (await client.post("/api/v1/collections/", json={"name": "Merged Away"})).json()["data"]["id"]
+    target_id = (await client.post("/api/v1/collections/", json={"name": "Merged Into"})).json()["data"]["id"]
+
+    response = await client.post(f"/api/v1/collections/{target_id}/merge", json={"source_id": source_id})
+
+    assert response.status_code == 200
+    assert response.json()["data"]["moved_photos"] == 0
+    assert (await client.get(f"/api/v1/collections/{source_id}")).status_code == 404
+
+    response = await client.post(f"/api/v1/collections/{target_id}/merge", json={"source_id": target_id})
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_collection_reads_are_cached_and_invalidated(client: AsyncClient):
+    """Repeated reads hit the cache; creating or deleting a collection invalidates it."""
+    collection_id = (await client.post("/api/v1/collections/", json={"name": "Cached Read"})).json()["data"]["id"]
+    await client.get(f"/api/v1/collections/{collection_id}")
+    assert (await client.get(f"/api/v1/collections/{collection_id}")).status_code == 200
+
+    first = (await client.get("/api/v1/collections/")).json()
+    created = (await client.post("/api/v1/collections/", json={"name": "Cache Buster"})).json()["data"]
+    second = (await client.get("/api/v1/collections/")).json()
+    assert second["total"] == first["total"] + 1
+    assert second["data"][0]["id"] == created["id"]
+
+    await client.delete(f"/api/v1/collections/{collection_id}")
+    assert (await client.get(f"/api/v1/collections/{collection_id}")).status_code == 404
+
+    response = await client.get("/api/v1/health/cache")
+    assert response.status_code == 200
+    stats = response.json()["data"]["collections"]
+    assert stats["hits"] >= 1
+    assert stats["invalidations"] >= 1
+    assert {"misses", "evictions", "expirations", "size", "maxsize", "hit_ratio"} <= stats.keys()
@@ -15,3 +15,203 @@ async def test_export_photos(client: AsyncClient):
     # Should fail initially as endpoint doesn't exist
     assert response.status_code == 200
     assert response.headers["content-type"] == "application/geo+json"
+
+
+@pytest.mark.asyncio
+async def test_export_streams_filtered_rows(client: AsyncClient, db_session):
+    """Test that exports stream every matching photo."""
+    import json
+    from datetime import datetime
+    from src.models.collection import Collection
+    from src.models.photo import Photo, PhotoMetadata
+
+    collection = Collection(name="Export Stream")
+    db_session.add(collection)
+    await db_session.flush()
+    photo_ids = []
+    for i, day in enumerate([1, 2, 3]):
+        photo = Photo(
+            filename=f"exp{i}.jpg",
+            file_path=f"/tmp/export/exp{i}.jpg",
+            file_hash=f"export-{i}",
+            timestamp=datetime(2022, 5, day, 12, 0, 0),
+            file_size=1024,
+            format="jpg",
+            collection_id=collection.id
+        )
+        photo.metadata_ = PhotoMetadata(latitude=1.0 + i, longitude=2.0, altitude=None)
+        db_session.add(photo)
+        await db_session.flush()
+        photo_ids.append(photo.id)
+    await db_session.commit()
+
+    response = await client.post("/api/v1/exports", json={
+        "format": "geojson",
+        "photo_ids": photo_ids,
+        "date_start": "2022-05-02T00:00:00",
+    })
+
+    assert response.status_code == 200
+    document = json.loads(response.content)
+    assert [f["properties"]["filename"] for f in document["features"]] == ["exp1.jpg", "exp2.jpg"]
+
+    response = await client.post("/api/v1/exports", json={
+        "format": "geojson",
+        "photo_ids": photo_ids,
+        "bounds": {"north": 2.5, "south": 0.5, "east": 3.0, "west": 1.0},
+    })
+
+    assert response.status_code == 200
+    document = json.loads(response.content)
+    assert [f["properties"]["filename"] for f in document["features"]] == ["exp0.jpg", "exp1.jpg"]
+
+    response = await client.post("/api/v1/exports", json={"format": "csv", "photo_ids": photo_ids})
+
+    assert response.status_code == 200
+    assert response.headers["content-disposition"] == "attachment; filename=export.csv"
+    assert len(response.text.strip().splitlines()) == 4
+
+
+@pytest.mark.asyncio
+async def test_export_unsupported_format(client: AsyncClient):
+    """Test that unknown formats are rejected before streaming."""
+    response = await client.post("/api/v1/exports", json={"format": "shapefile"})
+
+    assert response.status_code == 400
+    assert response.json()["error_code"] == "VALIDATION_ERROR"
+
+
+@pytest.mark.asyncio
+async def test_export_parquet(client: AsyncClient):
+    """Test that Parquet exports stream a readable file."""
+    pytest.importorskip("pyarrow")
+    import io
+    import pyarrow.parquet as pq
+
+    response = await client.post("/api/v1/exports", json={"format": "parquet"})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/vnd.apache.parquet"
+    assert pq.ParquetFile(io.BytesIO(response.content)).schema_arrow.names[-1] == "geometry"
+
+
+@pytest.mark.asyncio
+async def test_export_cache_conditional_and_range_requests(client: AsyncClient, db_session):
+    """Test that repeated exports are served from cache with validators."""
+    from datetime import datetime
+    from src.models.collection import Collection
+    from src.models.photo import Photo, PhotoMetadata
+    from src.services.generation import bump_generation
+
+    collection = Collection(name="Export Cache")
+    db_session.add(collection)
+    await db_session.flush()
+    photo = Photo(
+        filename="cached.jpg",
+        file_path="/tmp/export/cached.jpg",
+        file_hash="export-cached",
+        timestamp=datetime(2022, 6, 1, 12, 0, 0),
+        file_size=1024,
+        format="jpg",
+        collection_id=collection.id
+    )
+    photo.metadata_ = PhotoMetadata(latitude=1.0, longitude=2.0, altitude=3.0)
+    db_session.add(photo)
+    await bump_generation(db_session, collection.id)
+    await db_session.commit()
+    payload = {"format": "csv", "photo_ids": [photo.id]}
+    identity = {"Accept-Encoding": "identity"}
+
+    first = await client.post("/api/v1/exports", json=payload, headers=identity)
+    etag = first.headers["etag"]
+
+    cached = await client.post("/api/v1/exports", json=payload, headers=identity)
+    assert cached.status_code == 200
+    assert cached.headers["etag"] == etag
+    assert cached.content == first.content
+
+    not_modified = await client.post("/api/v1/exports", json=payload, headers={**identity, "If-None-Match": etag})
+    assert not_modified.status_code == 304
+    assert not_modified.content == b""
+
+    partial = await client.post("/api/v1/exports", json=payload, headers={**identity, "Range": "bytes=0-9"})
+    assert partial.status_code == 206
+    assert partial.content == first.content[:10]
+
+    # New data invalidates the artifact
+    await bump_generation(db_session, collection.id)
+    await db_session.commit()
+    fresh = await client.post("/api/v1/exports", json=payload, headers={**identity, "If-None-Match": etag})
+    assert fresh.status_code == 200
+    assert fresh.headers["etag"] != etag
+
+
+@pytest.mark.asyncio
+async def test_export_job_lifecycle(client: AsyncClient, db_session):
+    """Test submitting, polling, downloading and deleting an export job."""
+    from datetime import datetime
+    from src.models.collection import Collection
+    from src.models.photo import Photo, PhotoMetadata
+    from src.services.export_jobs import get_export_job_manager
+
+    collection = Collection(name="Export Job")
+    db_session.add(collection)
+    await db_session.flush()
+    photo_ids = []
+    for i in range(3):
+        photo = Photo(
+            filename=f"job{i}.jpg",
+            file_path=f"/tmp/export/job{i}.jpg",
+            file_hash=f"export-job-{i}",
+            timestamp=datetime(2022, 7, 1, 12, i, 0),
+            file_size=1024,
+            format="jpg",
+            collection_id=collection.id
+        )
+        photo.metadata_ = PhotoMetadata(latitude=1.0, longitude=2.0 + i, altitude=None)
+        db_session.add(photo)
+        await db_session.flush()
+        photo_ids.append(photo.id)
+    await db_session.commit()
+
+    response = await client.post("/api/v1/exports/jobs", json={"format": "csv", "photo_ids": photo_ids})
+    assert response.status_code == 202
+    job_id = response.json()["data"]["id"]
+
+    await get_export_job_manager().get(job_id).task
+
+    response = await client.get(f"/api/v1/exports/jobs/{job_id}")
+    job = response.json()["data"]
+    assert job["status"] == "completed"
+    assert job["rows_written"] == 3
+    assert job["bytes_written"] > 0
+
+    response = await client.get(f"/api/v1/exports/jobs/{job_id}/download")
+    assert response.status_code == 200
+    assert response.headers["content-disposition"] == "attachment; filename=export.csv"
+    assert len(response.content) == job["bytes_written"]
+    assert [line.split(",")[0] for line in response.text.strip().splitlines()[1:]] == [
+        "job0.jpg", "job1.jpg", "job2.jpg"
+    ]
+
+    response = await client.delete(f"/api/v1/exports/jobs/{job_id}")
+    assert response.status_code == 204
+    response = await client.get(f"/api/v1/exports/jobs/{job_id}")
+    assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_export_job_not_ready(client: AsyncClient):
+    """Test that unknown formats fail fast and unfinished jobs cannot be downloaded."""
+    from src.services.export_jobs import ExportJob, get_export_job_manager
+
+    response = await client.post("/api/v1/exports/jobs", json={"format": "shapefile"})
+    assert response.status_code == 400
+
+    manager = get_export_job_manager()
+    job = ExportJob(format="csv", media_type="text/csv", extension="csv")
+    manager._jobs[job.id] = job
+
+    response = await client.get(f"/api/v1/exports/jobs/{job.id}/download")
+    assert response.status_code == 409
+    await manager.cancel(job.id)
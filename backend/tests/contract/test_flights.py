@@ -134,3 +134,70 @@ async def test_get_flight_stats_filtered(client: AsyncClient, db_session):
     stats = data["data"]
     
     assert stats["total_photos"] == 1
+
+
+@pytest.mark.asyncio
+async def test_get_flight_distance(client: AsyncClient):
+    """Test range distance for a collection."""
+    col_res = await client.post("/api/v1/collections/", json={"name": "Distance Test"})
+    collection_id = col_res.json()["data"]["id"]
+
+    response = await client.get(
+        f"/api/v1/flights/{collection_id}/distance",
+        params={"date_start": "2023-01-01T00:00:00", "date_end": "2023-01-31T23:59:59"}
+    )
+
+    assert response.status_code == 200
+    data = response.json()["data"]
+    assert data["collection_id"] == collection_id
+    assert data["distance_meters"] == 0
+
+
+@pytest.mark.asyncio
+async def test_get_flight_distance_unknown_collection(client: AsyncClient):
+    """Test range distance for a missing collection."""
+    response = await client.get("/api/v1/flights/missing/distance")
+
+    assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_get_flight_series(client: AsyncClient, db_session):
+    """Test downsampled altitude/speed series for a collection."""
+    from src.models.photo import Photo, PhotoMetadata
+    from src.models.collection import Collection
+    from src.services.flight_service import FlightService
+
+    collection = Collection(name="Series Test")
+    db_session.add(collection)
+    await db_session.flush()
+
+    service = FlightService(db_session)
+    for i in range(50):
+        photo = Photo(
+            filename=f"s{i}.jpg",
+            file_path=f"/tmp/series/s{i}.jpg",
+            file_hash=f"series-{i}",
+            timestamp=datetime(2023, 3, 1, 10, 0, i),
+            file_size=1024,
+            format="jpg",
+            collection_id=collection.id
+        )
+        db_session.add(photo)
+        await db_session.flush()
+        metadata = PhotoMetadata(latitude=30.0, longitude=30.0 + i * 0.0001, altitude=100.0 + i, photo_id=photo.id)
+        await service.insert_into_flight(photo, metadata)
+        db_session.add(metadata)
+    await db_session.commit()
+
+    response = await client.get(f"/api/v1/flights/{collection.id}/series", params={"points": 10})
+
+    assert response.status_code == 200
+    data = response.json()["data"]
+    assert data["total_points"] == 50
+    assert len(data["altitude"]["values"]) == 10
+    assert len(data["altitude"]["timestamps"]) == 10
+    assert data["altitude"]["values"][0] == 100.0
+    assert data["altitude"]["values"][-1] == 149.0
+    assert len(data["speed"]["values"]) == 10
+    assert all(v > 0 for v in data["speed"]["values"])
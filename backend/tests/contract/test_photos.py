@@ -56,3 +56,236 @@ async def test_filter_photos(client: AsyncClient):
     data = response.json()
     assert data["success"] is True
     assert isinstance(data["data"], list)
+
+
+@pytest.mark.asyncio
+async def test_list_photos_cursor_pagination(client: AsyncClient, db_session):
+    """Test walking photo pages with cursors, including timestamp ties."""
+    from datetime import datetime
+    from src.models.collection import Collection
+    from src.models.photo import Photo
+
+    collection = Collection(name="Cursor Paging")
+    db_session.add(collection)
+    await db_session.flush()
+    for i in range(5):
+        db_session.add(Photo(
+            filename=f"page{i}.jpg",
+            file_path=f"/tmp/paging/page{i}.jpg",
+            file_hash=f"paging-{i}",
+            timestamp=datetime(2023, 2, 1, 12, 0, i // 2),  # pairs share a timestamp
+            file_size=1024,
+            format="jpg",
+            collection_id=collection.id
+        ))
+    await db_session.commit()
+
+    seen = []
+    cursor = None
+    for _ in range(3):
+        params = {"collection_id": collection.id, "limit": 2}
+        if cursor:
+            params["cursor"] = cursor
+        response = await client.get("/api/v1/photos/", params=params)
+        assert response.status_code == 200
+        body = response.json()
+        seen.extend(photo["filename"] for photo in body["data"])
+        cursor = body["next_cursor"]
+        if cursor is None:
+            break
+
+    assert cursor is None
+    assert sorted(seen) == [f"page{i}.jpg" for i in range(5)]
+    assert len(seen) == 5
+    assert body["total"] == 5
+    assert body["page"] is None
+    assert body["page_size"] == 2
+    assert body["total_pages"] == 3
+
+    response = await client.get("/api/v1/photos/", params={"collection_id": collection.id, "limit": 2, "skip": 2})
+    body = response.json()
+    assert body["page"] == 2
+    assert [photo["filename"] for photo in body["data"]] == seen[2:4]
+
+    response = await client.get("/api/v1/photos/", params={"cursor": "garbage"})
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_photo_sparse_fieldsets(client: AsyncClient, db_session):
+    """Test that fields= narrows list and detail responses."""
+    from datetime import datetime
+    from src.models.collection import Collection
+    from src.models.photo import Photo, PhotoMetadata
+
+    collection = Collection(name="Sparse Fields")
+    db_session.add(collection)
+    await db_session.flush()
+    photo = Photo(
+        filename="fields.jpg",
+        file_path="/tmp/fields/fields.jpg",
+        file_hash="fields-0",
+        timestamp=datetime(2023, 5, 1, 12, 0, 0),
+        file_size=1024,
+        format="jpg",
+        collection_id=collection.id
+    )
+    photo.metadata_ = PhotoMetadata(latitude=44.5, longitude=-122.5, altitude=90.0)
+    db_session.add(photo)
+    await db_session.commit()
+
+    response = await client.get(
+        "/api/v1/photos/", params={"collection_id": collection.id, "fields": "latitude,longitude"}
+    )
+    assert response.status_code == 200
+    assert response.json()["data"] == [{
+        "id": photo.id,
+        "timestamp": "2023-05-01T12:00:00",
+        "metadata": {"latitude": 44.5, "longitude": -122.5},
+    }]
+
+    response = await client.get(f"/api/v1/photos/{photo.id}", params={"fields": "filename"})
+    assert response.json()["data"] == {"id": photo.id, "filename": "fields.jpg", "timestamp": "2023-05-01T12:00:00"}
+
+    response = await client.get(f"/api/v1/photos/{photo.id}")
+    assert response.json()["data"]["metadata"]["altitude"] == 90.0
+
+    response = await client.get("/api/v1/photos/", params={"fields": "nope"})
+    assert response.status_code == 400
+
+    response = await client.get("/api/v1/photos/missing-id")
+    assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_filter_photos_pages_and_streams(client: AsyncClient, db_session, monkeypatch):
+    """Test that /photos/filter caps page size, pages by cursor and streams NDJSON."""
+    import json
+    from datetime import datetime
+    from src.config import get_settings
+    from src.models.collection import Collection
+    from src.models.photo import Photo
+
+    collection = Collection(name="Filter Paging")
+    db_session.add(collection)
+    await db_session.flush()
+    for i in range(5):
+        db_session.add(Photo(
+            filename=f"filter{i}.jpg",
+            file_path=f"/tmp/filter/filter{i}.jpg",
+            file_hash=f"filter-{i}",
+            timestamp=datetime(2019, 6, 1, 8, 0, i),
+            file_size=1024,
+            format="jpg",
+            collection_id=collection.id
+        ))
+    await db_session.commit()
+    monkeypatch.setattr(get_settings(), "PHOTO_FILTER_MAX_PAGE_SIZE", 2)
+    payload = {"date_start": "2019-06-01T00:00:00", "date_end": "2019-06-01T23:59:59", "limit": 50}
+
+    seen = []
+    cursor = None
+    while True:
+        response = await client.post("/api/v1/photos/filter", json={**payload, "cursor": cursor})
+        assert response.status_code == 200
+        page = response.json()
+        assert page["page_size"] == 2
+        assert page["total"] == 5
+        assert len(page["data"]) <= 2
+        seen.extend(photo["filename"] for photo in page["data"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+    assert seen == [f"filter{i}.jpg" for i in range(5)]
+
+    response = await client.post(
+        "/api/v1/photos/filter",
+        params={"fields": "filename"},
+        json=payload,
+        headers={"Accept": "application/x-ndjson"},
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert [row["filename"] for row in rows] == seen
+    assert set(rows[0]) == {"id", "filename", "timestamp"}
+
+
+@pytest.mark.asyncio
+async def test_nearby_photos(client: AsyncClient, db_session):
+    """Test radius search ordered nearest first."""
+    from datetime import datetime
+    from src.models.collection import Collection
+    from src.models.photo import Photo, PhotoMetadata
+
+    collection = Collection(name="Nearby")
+    db_session.add(collection)
+    await db_session.flush()
+    # Due north of (-60, 100) at roughly 0 m, 111 m, 556 m and 11 km
+    for i, offset in enumerate([0.0, 0.001, 0.005, 0.1]):
+        photo = Photo(
+            filename=f"near{i}.jpg",
+            file_path=f"/tmp/nearby/near{i}.jpg",
+            file_hash=f"nearby-{i}",
+            timestamp=datetime(2023, 7, 1, 10, 0, i),
+            file_size=1024,
+            format="jpg",
+            collection_id=collection.id
+        )
+        photo.metadata_ = PhotoMetadata(latitude=-60.0 + offset, longitude=100.0)
+        db_session.add(photo)
+    await db_session.commit()
+
+    response = await client.get(
+        "/api/v1/photos/nearby", params={"latitude": -59.9999, "longitude": 100.0, "radius": 1000, "fields": "filename"}
+    )
+    assert response.status_code == 200
+    assert [photo["filename"] for photo in response.json()["data"]] == ["near0.jpg", "near1.jpg", "near2.jpg"]
+
+    response = await client.get("/api/v1/photos/nearby", params={"latitude": -60.0, "longitude": 100.0, "radius": 50})
+    assert [photo["filename"] for photo in response.json()["data"]] == ["near0.jpg"]
+
+
+@pytest.mark.asyncio
+async def test_move_and_prune_photos(client: AsyncClient, db_session, tmp_path):
+    """Test moving photos between collections and pruning missing files."""
+    from datetime import datetime
+    from src.models.collection import Collection
+    from src.models.photo import Photo
+
+    source, target = Collection(name="Move From"), Collection(name="Move To")
+    db_session.add_all([source, target])
+    await db_session.flush()
+    photos = []
+    for i in range(2):
+        path = tmp_path / f"moved{i}.jpg"
+        path.write_bytes(b"jpg")
+        photos.append(Photo(
+            filename=path.name,
+            file_path=str(path),
+            file_hash=f"moved-{i}",
+            timestamp=datetime(2023, 8, 1, 10, 0, i),
+            file_size=1024,
+            format="jpg",
+            collection_id=source.id
+        ))
+    db_session.add_all(photos)
+    await db_session.commit()
+
+    response = await client.post(
+        "/api/v1/photos/move", json={"photo_ids": [p.id for p in photos], "collection_id": target.id}
+    )
+    assert response.status_code == 200
+    assert response.json()["data"]["moved_photos"] == 2
+    collection = (await client.get(f"/api/v1/collections/{target.id}")).json()["data"]
+    assert collection["total_photos"] == 2
+
+    response = await client.post("/api/v1/photos/move", json={"photo_ids": [], "collection_id": target.id})
+    assert response.status_code == 422
+
+    (tmp_path / "moved0.jpg").unlink()
+    response = await client.post("/api/v1/photos/prune", json={"collection_id": target.id})
+    assert response.status_code == 200
+    assert response.json()["data"]["pruned_photos"] == 1
+    collection = (await client.get(f"/api/v1/collections/{target.id}")).json()["data"]
+    assert collection["total_photos"] == 1
@@ -0,0 +1,69 @@
+-- Schema built by Base.metadata.create_all before migrations were introduced
+-- (SQLite DDL of the baseline models). Used to test adopting such databases.
+CREATE TABLE collections (
+	name VARCHAR(255) NOT NULL,
+	description TEXT,
+	total_photos INTEGER NOT NULL,
+	id VARCHAR(36) NOT NULL,
+	created_at DATETIME NOT NULL,
+	updated_at DATETIME NOT NULL,
+	PRIMARY KEY (id)
+);
+CREATE INDEX ix_collections_name ON collections (name);
+CREATE TABLE gps_locations (
+	latitude FLOAT NOT NULL,
+	longitude FLOAT NOT NULL,
+	altitude FLOAT,
+	uncertainty_radius FLOAT,
+	id VARCHAR(36) NOT NULL,
+	created_at DATETIME NOT NULL,
+	updated_at DATETIME NOT NULL,
+	PRIMARY KEY (id)
+);
+CREATE INDEX ix_gps_locations_latitude ON gps_locations (latitude);
+CREATE INDEX ix_gps_locations_longitude ON gps_locations (longitude);
+CREATE TABLE photos (
+	filename VARCHAR(255) NOT NULL,
+	file_path VARCHAR(1024) NOT NULL,
+	file_hash VARCHAR(64) NOT NULL,
+	timestamp DATETIME NOT NULL,
+	file_size INTEGER NOT NULL,
+	format VARCHAR(10) NOT NULL,
+	collection_id VARCHAR(36) NOT NULL,
+	id VARCHAR(36) NOT NULL,
+	created_at DATETIME NOT NULL,
+	updated_at DATETIME NOT NULL,
+	PRIMARY KEY (id),
+	UNIQUE (file_path),
+	FOREIGN KEY(collection_id) REFERENCES collections (id) ON DELETE CASCADE
+);
+CREATE INDEX ix_photos_file_hash ON photos (file_hash);
+CREATE INDEX ix_photos_filename ON photos (filename);
+CREATE INDEX ix_photos_timestamp ON photos (timestamp);
+CREATE TABLE photo_markers (
+	location_id VARCHAR(36) NOT NULL,
+	photos_count INTEGER NOT NULL,
+	is_clustered BOOLEAN NOT NULL,
+	visible BOOLEAN NOT NULL,
+	id VARCHAR(36) NOT NULL,
+	created_at DATETIME NOT NULL,
+	updated_at DATETIME NOT NULL,
+	PRIMARY KEY (id),
+	FOREIGN KEY(location_id) REFERENCES gps_locations (id) ON DELETE CASCADE
+);
+CREATE TABLE photo_metadata (
+	latitude FLOAT NOT NULL,
+	longitude FLOAT NOT NULL,
+	altitude FLOAT,
+	camera_model VARCHAR(255),
+	iso INTEGER,
+	shutter_speed VARCHAR(50),
+	aperture VARCHAR(50),
+	photo_id VARCHAR(36) NOT NULL,
+	id VARCHAR(36) NOT NULL,
+	created_at DATETIME NOT NULL,
+	updated_at DATETIME NOT NULL,
+	PRIMARY KEY (id),
+	UNIQUE (photo_id),
+	FOREIGN KEY(photo_id) REFERENCES photos (id) ON DELETE CASCADE
+);
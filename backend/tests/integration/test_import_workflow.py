@@ -54,3 +54,7 @@ async def test_import_workflow(db_session, tmp_path):
     
     assert len(updated_col.photos) == 2
     assert updated_col.total_photos == 2
+    assert {(p.latitude, p.longitude, p.altitude) for p in updated_col.photos} == {(37.5, -122.5, 100.0)}
+    assert updated_col.bounds == {"north": 37.5, "south": 37.5, "east": -122.5, "west": -122.5}
+    assert updated_col.first_captured_at == min(p.timestamp for p in updated_col.photos)
+    assert updated_col.last_captured_at == max(p.timestamp for p in updated_col.photos)
@@ -0,0 +1,179 @@
+"""Integration tests for Alembic migrations."""
+from pathlib import Path
+
+import pytest
+from alembic import command
+from alembic.autogenerate import compare_metadata
+from alembic.runtime.migration import MigrationContext
+from sqlalchemy import create_engine, inspect, text
+
+import src.models  # noqa: F401
+from src.db.migrations import alembic_config, include_object, upgrade_database
+from src.models.base import Base
+
+# What create_all built before migrations existed
+BASELINE_SCHEMA = Path(__file__).with_name("baseline_schema.sql")
+
+
+def _legacy_database(engine) -> None:
+    """Create the pre-migration schema, without an alembic_version table."""
+    with engine.connect() as conn:
+        conn.connection.executescript(BASELINE_SCHEMA.read_text())
+
+
+def test_migrations_match_models(tmp_path):
+    """Upgrading to head yields exactly the schema the models declare."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'migrated.db'}")
+    with engine.begin() as conn:
+        upgrade_database(conn)
+        context = MigrationContext.configure(conn, opts={"include_object": include_object})
+        diff = compare_metadata(context, Base.metadata)
+    engine.dispose()
+
+    assert diff == []
+
+
+def test_pre_migration_database_is_stamped(tmp_path):
+    """A database built by create_all before migrations is adopted, not recreated."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'legacy.db'}")
+    _legacy_database(engine)
+    with engine.begin() as conn:
+        conn.execute(
+            text(
+                "INSERT INTO collections (id, name, total_photos, created_at, updated_at) "
+                "VALUES ('c1', 'kept', 0, '2023-01-01', '2023-01-01')"
+            )
+        )
+
+    with engine.begin() as conn:
+        upgrade_database(conn)
+        assert conn.execute(text("SELECT name FROM collections")).scalar_one() == "kept"
+        assert MigrationContext.configure(conn).get_current_revision() is not None
+        context = MigrationContext.configure(conn, opts={"include_object": include_object})
+        assert compare_metadata(context, Base.metadata) == []
+    engine.dispose()
+
+
+def test_baseline_revision_matches_pre_migration_schema(tmp_path):
+    """Revision 0001 creates exactly what create_all built before migrations."""
+    migrated = create_engine(f"sqlite:///{tmp_path / 'baseline.db'}")
+    legacy = create_engine(f"sqlite:///{tmp_path / 'legacy.db'}")
+    with migrated.begin() as conn:
+        command.upgrade(alembic_config(conn), "0001")
+    _legacy_database(legacy)
+
+    def schema(engine):
+        with engine.connect() as conn:
+            inspector = inspect(conn)
+            return {
+                table: (
+                    sorted((c["name"], str(c["type"]), c["nullable"]) for c in inspector.get_columns(table)),
+                    sorted((i["name"], tuple(i["column_names"])) for i in inspector.get_indexes(table)),
+                )
+                for table in inspector.get_table_names()
+                if table != "alembic_version"
+            }
+
+    assert schema(migrated) == schema(legacy)
+    migrated.dispose()
+    legacy.dispose()
+
+
+def test_downgrade_to_base(tmp_path):
+    """Every migration can be reverted."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'downgrade.db'}")
+    with engine.begin() as conn:
+        upgrade_database(conn)
+        command.downgrade(alembic_config(conn), "base")
+        assert set(inspect(conn).get_table_names()) == {"alembic_version"}
+    engine.dispose()
+
+
+def test_collection_summary_is_backfilled(tmp_path):
+    """Existing collections get their summary computed from their photos."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'summary.db'}")
+    with engine.begin() as conn:
+        command.upgrade(alembic_config(conn), "0005")
+        conn.execute(
+            text(
+                "INSERT INTO collections (id, name, total_photos, created_at, updated_at) "
+                "VALUES ('c1', 'survey', 0, '2023-01-01', '2023-01-01')"
+            )
+        )
+        for i, (lat, lon, camera) in enumerate([(1.0, 2.0, "FC3170"), (1.5, 1.0, "FC3170"), (0.5, 3.0, None)]):
+            conn.execute(
+                text(
+                    "INSERT INTO photos (id, filename, file_path, file_hash, timestamp, file_size, format, "
+                    "collection_id, latitude, longitude, created_at, updated_at) "
+                    f"VALUES ('p{i}', 'p{i}.jpg', '/p{i}.jpg', 'h{i}', '2023-01-01 10:0{i}:00', 1, 'jpg', "
+                    f"'c1', {lat}, {lon}, '2023-01-01', '2023-01-01')"
+                )
+            )
+            conn.execute(
+                text(
+                    "INSERT INTO photo_metadata (id, photo_id, latitude, longitude, camera_model, "
+                    "cumulative_distance, created_at, updated_at) "
+                    f"VALUES ('m{i}', 'p{i}', {lat}, {lon}, :camera, {i * 100.0}, '2023-01-01', '2023-01-01')"
+                ),
+                {"camera": camera},
+            )
+
+        upgrade_database(conn)
+        summary = conn.execute(
+            text(
+                "SELECT total_photos, min_latitude, max_latitude, min_longitude, max_longitude, "
+                "first_captured_at, last_captured_at, camera_models, total_distance_meters FROM collections"
+            )
+        ).one()
+    engine.dispose()
+
+    assert tuple(summary) == (3, 0.5, 1.5, 1.0, 3.0, "2023-01-01 10:00:00", "2023-01-01 10:02:00", '["FC3170"]', 200.0)
+
+
+def test_cumulative_distances_are_backfilled(tmp_path):
+    """Photos imported before the column existed get their along-track distance."""
+    from src.services.flight_service import _leg_meters
+
+    engine = create_engine(f"sqlite:///{tmp_path / 'distances.db'}")
+    _legacy_database(engine)
+    tracks = {"c1": [(0.0, 0.0), (0.0, 0.01), (0.01, 0.01)], "c2": [(45.0, 7.0), (45.0, 7.001)]}
+    with engine.begin() as conn:
+        for collection_id, points in tracks.items():
+            conn.execute(
+                text(
+                    "INSERT INTO collections (id, name, total_photos, created_at, updated_at) "
+                    f"VALUES ('{collection_id}', '{collection_id}', 0, '2023-01-01', '2023-01-01')"
+                )
+            )
+            # Inserted newest first: the track follows capture time, not insertion order
+            for i, (lat, lon) in reversed(list(enumerate(points))):
+                photo_id = f"{collection_id}-p{i}"
+                conn.execute(
+                    text(
+                        "INSERT INTO photos (id, filename, file_path, file_hash, timestamp, file_size, format, "
+                        "collection_id, created_at, updated_at) "
+                        f"VALUES ('{photo_id}', '{photo_id}.jpg', '/{photo_id}.jpg', 'h', '2023-01-01 10:0{i}:00', "
+                        f"1, 'jpg', '{collection_id}', '2023-01-01', '2023-01-01')"
+                    )
+                )
+                conn.execute(
+                    text(
+                        "INSERT INTO photo_metadata (id, photo_id, latitude, longitude, created_at, updated_at) "
+                        f"VALUES ('m-{photo_id}', '{photo_id}', {lat}, {lon}, '2023-01-01', '2023-01-01')"
+                    )
+                )
+
+    with engine.begin() as conn:
+        upgrade_database(conn)
+        distances = dict(conn.execute(text("SELECT photo_id, cumulative_distance FROM photo_metadata")).all())
+        totals = dict(conn.execute(text("SELECT id, total_distance_meters FROM collections")).all())
+    engine.dispose()
+
+    for collection_id, points in tracks.items():
+        expected = 0.0
+        for i, point in enumerate(points):
+            if i:
+                expected += _leg_meters(*points[i - 1], *point)
+            assert distances[f"{collection_id}-p{i}"] == pytest.approx(expected)
+        assert totals[collection_id] == pytest.approx(expected)
+    assert totals["c1"] > 2000
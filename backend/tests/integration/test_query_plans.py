@@ -0,0 +1,103 @@
+"""Query plan checks for the hot API queries.
+
+Each query is built the way its endpoint or service builds it and run
+through ``EXPLAIN QUERY PLAN`` on the test schema. A plan that scans a
+whole table without an index, or sorts paged results in a temp B-tree,
+means an index is missing (see the Alembic index migrations).
+"""
+from datetime import datetime
+
+import pytest
+from sqlalchemy import select, text
+
+from src.db.spatial import radius_clause
+from src.models.collection import Collection
+from src.models.photo import Photo, PhotoMetadata
+from src.schemas.photo import Bounds
+from src.services.collection_manager import COLLECTION_SORT_KEY
+from src.services.export_service import export_query
+from src.services.flight_service import FlightService
+from src.services.photo_service import PHOTO_SORT_KEY, PhotoService, parse_fields
+from src.utils.filters import add_photo_filters
+from src.utils.pagination import count_stmt, encode_cursor, keyset_query, keyset_stmt
+
+BOUNDS = Bounds(north=45.0, south=44.0, east=-122.0, west=-123.0)
+CURSOR = encode_cursor([datetime(2023, 1, 1), "00000000-0000-0000-0000-000000000000"])
+DATE_RANGE = dict(date_start=datetime(2023, 1, 1), date_end=datetime(2023, 2, 1))
+COLLECTION = Photo.collection_id == "collection"
+POSITIONS = parse_fields("latitude,longitude")
+# Reads that must not touch the table or join photo_metadata
+COVERED_QUERIES = (
+    "map points in collection",
+    "map points by dates",
+    "flight stats by dates",
+    "flight stats in collection",
+)
+
+HOT_QUERIES = {
+    "list photos in collection": keyset_stmt(
+        add_photo_filters(PhotoService.rows_stmt(), collection_id="collection"), PHOTO_SORT_KEY, CURSOR, 100
+    ),
+    "list all photos": keyset_stmt(PhotoService.rows_stmt(), PHOTO_SORT_KEY, CURSOR, 100),
+    "count photos in collection": add_photo_filters(count_stmt(Photo), collection_id="collection"),
+    "filter by dates": keyset_stmt(
+        add_photo_filters(PhotoService.rows_stmt(), **DATE_RANGE), PHOTO_SORT_KEY, None, 100
+    ),
+    "count by bounds": add_photo_filters(count_stmt(Photo), bounds=BOUNDS),
+    "export by dates": export_query(date_start=datetime(2023, 1, 1), date_end=datetime(2023, 2, 1)),
+    "export gpx tracks": export_query(export_format="gpx"),
+    "photos near a point": select(Photo.id).where(radius_clause(44.5, -122.5, 500.0)),
+    "list collections": keyset_query(select(Collection), COLLECTION_SORT_KEY, None, 100, descending=True),
+    "flight series": (
+        select(Photo.timestamp, PhotoMetadata.altitude, PhotoMetadata.cumulative_distance)
+        .join(PhotoMetadata, PhotoMetadata.photo_id == Photo.id)
+        .where(COLLECTION)
+        .order_by(*PHOTO_SORT_KEY)
+    ),
+    "map points in collection": keyset_stmt(
+        add_photo_filters(PhotoService.rows_stmt(POSITIONS), collection_id="collection"), PHOTO_SORT_KEY, CURSOR, 1000
+    ),
+    "map points by dates": keyset_stmt(
+        add_photo_filters(PhotoService.rows_stmt(POSITIONS), **DATE_RANGE), PHOTO_SORT_KEY, None, 1000
+    ),
+    "flight stats by dates": FlightService.track_stmt(**DATE_RANGE),
+    "flight stats in collection": FlightService.track_stmt(collection_id="collection"),
+    "import dedupe": select(Photo.id).where(Photo.file_hash == "0" * 64),
+}
+
+
+def plan_problems(plan: list) -> list:
+    """Plan steps that indicate a missing index."""
+    problems = []
+    for detail in plan:
+        words = detail.split()
+        if words[0] == "SCAN" and "INDEX" not in words:
+            problems.append(detail)  # full table scan
+        elif "TEMP B-TREE" in detail:
+            problems.append(detail)  # sort not served by an index
+    return problems
+
+
+async def explain(engine, query) -> list:
+    """``EXPLAIN QUERY PLAN`` details for a query."""
+    async with engine.connect() as conn:
+        sql = str(query.compile(engine, compile_kwargs={"literal_binds": True}))
+        return [row[3] for row in await conn.execute(text(f"EXPLAIN QUERY PLAN {sql}"))]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("name", list(HOT_QUERIES))
+async def test_hot_query_uses_indexes(test_db_engine, name):
+    """Hot queries are answered from indexes."""
+    plan = await explain(test_db_engine, HOT_QUERIES[name])
+
+    assert plan_problems(plan) == [], f"{name}: {plan}"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("name", COVERED_QUERIES)
+async def test_position_reads_are_index_only(test_db_engine, name):
+    """Map and track reads are answered from a covering index alone."""
+    plan = await explain(test_db_engine, HOT_QUERIES[name])
+
+    assert len(plan) == 1 and "COVERING INDEX" in plan[0], f"{name}: {plan}"
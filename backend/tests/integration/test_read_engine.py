@@ -0,0 +1,117 @@
+"""Integration tests for the read-only engine behind GET endpoints.
+
+The ``client`` fixture routes reads through the test's writable session;
+these tests serve them from a ``mode=ro`` pool on a file-backed WAL
+database instead, as the app does on SQLite.
+"""
+import asyncio
+from datetime import datetime
+
+import pytest
+import pytest_asyncio
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import text
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from src.app import app
+from src.config import Settings
+from src.db.session import get_db_read_session, get_db_session
+from src.db.sqlite import install_pragmas, read_only_url, sqlite_pragmas
+from src.models.base import Base
+from src.models.collection import Collection
+from src.models.photo import Photo, PhotoMetadata
+
+# A read that waits on the open write transaction would take the busy timeout
+READ_TIMEOUT_SECONDS = 2
+
+
+def _photo(collection_id: str, name: str) -> Photo:
+    photo = Photo(
+        filename=name,
+        file_path=f"/tmp/read-engine/{name}",
+        file_hash=f"read-engine-{name}",
+        timestamp=datetime(2023, 9, 1, 12, 0, 0),
+        file_size=1024,
+        format="jpg",
+        collection_id=collection_id,
+    )
+    photo.metadata_ = PhotoMetadata(latitude=46.0, longitude=23.0)
+    return photo
+
+
+@pytest_asyncio.fixture
+async def engines(tmp_path):
+    """Write engine (one connection) and read-only engine on a WAL database file."""
+    url = make_url(f"sqlite+aiosqlite:///{tmp_path / 'drone.db'}")
+    writer = create_async_engine(url, pool_size=1, max_overflow=0)
+    reader = create_async_engine(read_only_url(url))
+    install_pragmas(writer, sqlite_pragmas(Settings()))
+    install_pragmas(reader, sqlite_pragmas(Settings(), read_only=True))
+    async with writer.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    yield writer, reader
+    await reader.dispose()
+    await writer.dispose()
+
+
+@pytest_asyncio.fixture
+async def read_client(engines):
+    """HTTP client whose reads and writes use the app's two-engine layout."""
+    writer, reader = engines
+    write_sessions = async_sessionmaker(writer, class_=AsyncSession, expire_on_commit=False)
+    read_sessions = async_sessionmaker(reader, class_=AsyncSession, expire_on_commit=False)
+
+    async def override_get_db_session():
+        async with write_sessions() as session:
+            yield session
+
+    async def override_get_db_read_session():
+        async with read_sessions() as session:
+            yield session
+
+    app.dependency_overrides[get_db_session] = override_get_db_session
+    app.dependency_overrides[get_db_read_session] = override_get_db_read_session
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+        yield ac
+    app.dependency_overrides.clear()
+
+
+@pytest.mark.asyncio
+async def test_reads_do_not_wait_for_an_open_import(engines, read_client):
+    """GET endpoints answer from the last commit while a write transaction is open."""
+    writer, _ = engines
+    async with writer.connect() as conn:
+        assert (await conn.execute(text("PRAGMA journal_mode"))).scalar_one() == "wal"
+
+    async with AsyncSession(writer, expire_on_commit=False) as session:
+        collection = Collection(name="Committed")
+        session.add(collection)
+        await session.flush()
+        session.add(_photo(collection.id, "committed.jpg"))
+        await session.commit()
+
+    async with AsyncSession(writer, expire_on_commit=False) as importer:
+        # Holds the write lock (and the writer's only connection) until rollback
+        importer.add(_photo(collection.id, "importing.jpg"))
+        await importer.flush()
+
+        photos = await asyncio.wait_for(read_client.get("/api/v1/photos/"), READ_TIMEOUT_SECONDS)
+        collections = await asyncio.wait_for(read_client.get("/api/v1/collections/"), READ_TIMEOUT_SECONDS)
+        await importer.rollback()
+
+    assert photos.status_code == 200
+    assert [photo["filename"] for photo in photos.json()["data"]] == ["committed.jpg"]
+    assert collections.status_code == 200
+    assert [c["name"] for c in collections.json()["data"]] == ["Committed"]
+
+
+@pytest.mark.asyncio
+async def test_read_engine_rejects_writes(engines):
+    """Sessions on the read engine cannot write to the database."""
+    _, reader = engines
+    async with AsyncSession(reader) as session:
+        session.add(Collection(name="Not written"))
+        with pytest.raises(OperationalError, match="readonly"):
+            await session.commit()
@@ -0,0 +1,149 @@
+"""Unit tests for bulk collection and photo operations."""
+from datetime import datetime
+
+import pytest
+from sqlalchemy import func, select
+
+from src.exceptions import NotFoundError, ValidationError
+from src.models.collection import Collection
+from src.models.photo import Photo, PhotoMetadata
+from src.models.photo_marker import PhotoMarker
+from src.services.bulk_service import BulkService
+from src.services.collection_manager import CollectionManager
+from src.services.flight_service import FlightService
+from src.services.generation import collection_scope, get_generation
+from src.services.location_service import LocationService
+
+
+async def _collection(db_session, name, photos, tmp_path=None, start=0):
+    """A collection with a straight track of photos 0.01 degrees apart."""
+    collection = Collection(name=name)
+    db_session.add(collection)
+    await db_session.flush()
+    for i in range(start, start + photos):
+        path = tmp_path / f"{name}-{i}.jpg" if tmp_path else None
+        if path:
+            path.write_bytes(b"jpg")
+        photo = Photo(
+            filename=f"{name}-{i}.jpg",
+            file_path=str(path) if path else f"/tmp/bulk/{collection.id}/{i}.jpg",
+            file_hash=f"bulk-{collection.id}-{i}",
+            timestamp=datetime(2023, 6, 1, 10, i),
+            file_size=1024,
+            format="jpg",
+            collection_id=collection.id,
+        )
+        photo.metadata_ = PhotoMetadata(latitude=0.0, longitude=i / 100, camera_model=name)
+        db_session.add(photo)
+    await db_session.flush()
+    # Summarize the track the way the importer would have built it up
+    await FlightService(db_session).rebuild_cumulative_distances(collection.id)
+    await CollectionManager(db_session).refresh_summary(collection.id)
+    await db_session.commit()
+    return collection
+
+
+async def _count(db_session, model, *clauses):
+    return (await db_session.execute(select(func.count()).select_from(model).where(*clauses))).scalar_one()
+
+
+@pytest.mark.asyncio
+async def test_delete_collection_cascades_in_chunks(db_session):
+    """Photos and their metadata go with the collection, a chunk at a time."""
+    collection = await _collection(db_session, "Bulk Delete", 5)
+    photo_ids = select(Photo.id).where(Photo.collection_id == collection.id).scalar_subquery()
+    metadata_before = await _count(db_session, PhotoMetadata)
+
+    deleted = await BulkService(db_session, chunk_size=2).delete_collection(collection.id)
+
+    assert deleted == 5
+    assert await _count(db_session, Collection, Collection.id == collection.id) == 0
+    assert await _count(db_session, Photo, Photo.collection_id == collection.id) == 0
+    assert await _count(db_session, PhotoMetadata) == metadata_before - 5
+    assert await _count(db_session, PhotoMetadata, PhotoMetadata.photo_id.in_(photo_ids)) == 0
+    assert await get_generation(db_session, collection_scope(collection.id)) > 0
+
+    with pytest.raises(NotFoundError):
+        await BulkService(db_session).delete_collection(collection.id)
+
+
+@pytest.mark.asyncio
+async def test_move_photos_refreshes_both_collections(db_session):
+    """Moved photos leave the source's summary and join the target's track."""
+    source = await _collection(db_session, "Move Source", 4)
+    target = await _collection(db_session, "Move Target", 1)
+    moving = (
+        (
+            await db_session.execute(
+                select(Photo.id).where(Photo.collection_id == source.id).order_by(Photo.timestamp).offset(2)
+            )
+        )
+        .scalars()
+        .all()
+    )
+
+    moved = await BulkService(db_session, chunk_size=1).move_photos([*moving, "missing-id"], target.id)
+    source = await db_session.get(Collection, source.id, populate_existing=True)
+    target = await db_session.get(Collection, target.id, populate_existing=True)
+
+    assert moved == 2
+    assert source.total_photos == 2
+    assert source.bounds["east"] == pytest.approx(0.01)
+    assert source.total_distance_meters == pytest.approx(1112, rel=0.01)
+    assert source.last_captured_at == datetime(2023, 6, 1, 10, 1)
+    assert source.camera_models == ["Move Source"]
+    assert target.total_photos == 3
+    assert target.camera_models == ["Move Source", "Move Target"]
+    # Target track: 0.00 (own photo) -> 0.02 -> 0.03
+    assert target.total_distance_meters == pytest.approx(3336, rel=0.01)
+
+
+@pytest.mark.asyncio
+async def test_merge_collections(db_session):
+    """Merging moves every photo and deletes the source."""
+    source = await _collection(db_session, "Merge Source", 3)
+    target = await _collection(db_session, "Merge Target", 2, start=3)
+
+    moved = await BulkService(db_session, chunk_size=2).merge_collections(source.id, target.id)
+    target = await db_session.get(Collection, target.id, populate_existing=True)
+
+    assert moved == 3
+    assert await _count(db_session, Collection, Collection.id == source.id) == 0
+    assert target.total_photos == 5
+    assert target.first_captured_at == datetime(2023, 6, 1, 10, 0)
+    assert target.total_distance_meters == pytest.approx(4448, rel=0.01)
+
+    with pytest.raises(ValidationError):
+        await BulkService(db_session).merge_collections(target.id, target.id)
+
+
+@pytest.mark.asyncio
+async def test_prune_missing_photos(db_session, tmp_path):
+    """Only photos whose files are gone are deleted."""
+    collection = await _collection(db_session, "Prune", 4, tmp_path)
+    (tmp_path / "Prune-1.jpg").unlink()
+    (tmp_path / "Prune-3.jpg").unlink()
+    await LocationService(db_session).regenerate_markers()
+
+    pruned = await BulkService(db_session, chunk_size=3).prune_missing_photos(collection.id)
+    collection = await db_session.get(Collection, collection.id, populate_existing=True)
+
+    assert pruned == 2
+    remaining = (
+        (
+            await db_session.execute(
+                select(Photo.filename).where(Photo.collection_id == collection.id).order_by(Photo.filename)
+            )
+        )
+        .scalars()
+        .all()
+    )
+    assert remaining == ["Prune-0.jpg", "Prune-2.jpg"]
+    assert collection.total_photos == 2
+    assert collection.total_distance_meters == pytest.approx(2224, rel=0.01)
+    # The easternmost photo was pruned, so that edge is looked up again
+    assert collection.bounds["east"] == pytest.approx(0.02)
+    assert collection.last_captured_at == datetime(2023, 6, 1, 10, 2)
+    # Markers were reclustered without the pruned photos
+    clustered = (await db_session.execute(select(func.sum(PhotoMarker.photos_count)))).scalar_one()
+    assert clustered == await _count(db_session, PhotoMetadata)
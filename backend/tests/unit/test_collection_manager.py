@@ -0,0 +1,120 @@
+"""Unit tests for the collection summary."""
+from datetime import datetime
+
+import pytest
+from sqlalchemy import delete
+
+from src.models.collection import Collection
+from src.models.photo import Photo, PhotoMetadata
+from src.schemas.collection import CollectionResponse
+from src.services.collection_manager import CollectionManager
+from src.services.flight_service import FlightService
+
+
+async def _import(db_session, collection, name, timestamp, lat, lon, camera_model=None):
+    """Store a photo the way the importer does, summary included."""
+    photo = Photo(
+        filename=f"{name}.jpg",
+        file_path=f"/tmp/summary/{collection.id}/{name}.jpg",
+        file_hash=f"summary-{collection.id}-{name}",
+        timestamp=timestamp,
+        file_size=1024,
+        format="jpg",
+        collection_id=collection.id,
+        latitude=lat,
+        longitude=lon,
+    )
+    db_session.add(photo)
+    await db_session.flush()
+    manager = CollectionManager(db_session)
+    locked = await manager.lock_summary(collection.id)
+    metadata = PhotoMetadata(latitude=lat, longitude=lon, camera_model=camera_model, photo_id=photo.id)
+    delta = await FlightService(db_session).insert_into_flight(photo, metadata)
+    db_session.add(metadata)
+    await manager.record_photo(locked, photo, camera_model, delta)
+    await db_session.flush()
+
+
+@pytest.mark.asyncio
+async def test_record_photo_maintains_summary(db_session):
+    """Each imported photo widens the bounds and span and extends the distance."""
+    collection = Collection(name="Summary")
+    db_session.add(collection)
+    await db_session.flush()
+
+    assert collection.bounds is None
+
+    await _import(db_session, collection, "p2", datetime(2023, 5, 1, 10, 1), 0.0, 0.01, "FC3170")
+    await _import(db_session, collection, "p1", datetime(2023, 5, 1, 10, 0), 0.0, 0.0, "L1D-20c")
+    await _import(db_session, collection, "p3", datetime(2023, 5, 1, 10, 2), 0.01, 0.01, "FC3170")
+
+    assert collection.total_photos == 3
+    assert collection.bounds == {"north": 0.01, "south": 0.0, "east": 0.01, "west": 0.0}
+    # Bounds serialize as a plain value, without entity fields
+    assert CollectionResponse.model_validate(collection).model_dump()["bounds"] == collection.bounds
+    assert collection.first_captured_at == datetime(2023, 5, 1, 10, 0)
+    assert collection.last_captured_at == datetime(2023, 5, 1, 10, 2)
+    assert collection.camera_models == ["FC3170", "L1D-20c"]
+    assert collection.total_distance_meters == pytest.approx(2224, rel=0.01)
+
+
+@pytest.mark.asyncio
+async def test_refresh_summary_matches_incremental(db_session):
+    """Recomputing from the photos gives the incrementally maintained summary."""
+    collection = Collection(name="Refreshed Summary")
+    db_session.add(collection)
+    await db_session.flush()
+    await _import(db_session, collection, "p1", datetime(2023, 5, 2, 10, 0), 1.0, 2.0, "FC3170")
+    await _import(db_session, collection, "p2", datetime(2023, 5, 2, 10, 1), 1.01, 2.02)
+
+    columns = [
+        "total_photos",
+        "min_latitude",
+        "max_latitude",
+        "min_longitude",
+        "max_longitude",
+        "first_captured_at",
+        "last_captured_at",
+        "camera_models",
+        "total_distance_meters",
+    ]
+    incremental = {name: getattr(collection, name) for name in columns}
+    refreshed = await CollectionManager(db_session).refresh_summary(collection.id)
+
+    assert {name: getattr(refreshed, name) for name in columns} == pytest.approx(incremental)
+
+
+@pytest.mark.asyncio
+async def test_remove_photos_matches_refresh(db_session):
+    """Taking photos off the summary gives the same result as recomputing it."""
+    collection = Collection(name="Shrunk Summary")
+    db_session.add(collection)
+    await db_session.flush()
+    await _import(db_session, collection, "p1", datetime(2023, 5, 3, 10, 0), 1.0, 2.0, "FC3170")
+    await _import(db_session, collection, "p2", datetime(2023, 5, 3, 10, 1), 1.01, 2.01, "FC3170")
+    await _import(db_session, collection, "p3", datetime(2023, 5, 3, 10, 2), 1.02, 2.0, "L1D-20c")
+    manager = CollectionManager(db_session)
+
+    leaving = Photo.collection_id == collection.id, Photo.timestamp >= datetime(2023, 5, 3, 10, 2)
+    delta = (await manager.summarize_photos(*leaving))[collection.id]
+    await db_session.execute(delete(Photo).where(*leaving))
+    since = delta.extremes["first_captured_at"]
+    total = await FlightService(db_session).rebuild_cumulative_distances(collection.id, since)
+    removed = await manager.remove_photos(collection.id, delta, total)
+
+    columns = [
+        "total_photos",
+        "min_latitude",
+        "max_latitude",
+        "min_longitude",
+        "max_longitude",
+        "first_captured_at",
+        "last_captured_at",
+        "camera_models",
+        "total_distance_meters",
+    ]
+    incremental = {name: getattr(removed, name) for name in columns}
+    assert incremental["camera_models"] == ["FC3170"]
+    assert incremental["max_latitude"] == 1.01
+    refreshed = await manager.refresh_summary(collection.id)
+    assert {name: getattr(refreshed, name) for name in columns} == pytest.approx(incremental)
@@ -0,0 +1,140 @@
+"""Unit tests for the compression middleware."""
+import gzip
+import zlib
+
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse, Response, StreamingResponse
+from httpx import AsyncClient, ASGITransport
+
+from src.middleware.compression import (
+    CompressionMiddleware,
+    GzipEncoder,
+    available_encodings,
+    negotiate_encoding,
+)
+
+BODY = "drone photo " * 500
+
+
+def _app(encodings=("gzip",)) -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware, minimum_size=100, encodings=encodings)
+
+    @app.get("/large")
+    async def large():
+        return PlainTextResponse(BODY)
+
+    @app.get("/small")
+    async def small():
+        return PlainTextResponse("tiny")
+
+    @app.get("/stream")
+    async def stream():
+        async def chunks():
+            for _ in range(10):
+                yield BODY.encode()
+
+        return StreamingResponse(chunks(), media_type="text/csv")
+
+    @app.get("/kmz")
+    async def kmz():
+        return Response(b"PK" * 1000, media_type="application/vnd.google-earth.kmz")
+
+    return app
+
+
+def test_negotiate_encoding():
+    """Client q-values win; server preference breaks ties."""
+    supported = ["br", "zstd", "gzip"]
+
+    assert negotiate_encoding("gzip, deflate, br", supported) == "br"
+    assert negotiate_encoding("gzip;q=1.0, br;q=0.5", supported) == "gzip"
+    assert negotiate_encoding("br;q=0, gzip", supported) == "gzip"
+    assert negotiate_encoding("*", supported) == "br"
+    assert negotiate_encoding("identity", supported) is None
+    assert negotiate_encoding("", supported) is None
+
+
+def test_available_encodings_skips_unknown():
+    """Unknown encodings are dropped."""
+    assert available_encodings(["deflate", "gzip"]) == ["gzip"]
+
+
+def test_gzip_encoder_flushes_each_chunk():
+    """Every compressed chunk is decodable on its own arrival."""
+    encoder = GzipEncoder()
+    decoder = zlib.decompressobj(16 + zlib.MAX_WBITS)
+
+    assert decoder.decompress(encoder.compress(b"first chunk")) == b"first chunk"
+    assert decoder.decompress(encoder.finish(b" last")) == b" last"
+
+
+@pytest.mark.asyncio
+async def test_compresses_large_responses():
+    """Large responses are gzip-encoded and marked as varying."""
+    async with AsyncClient(transport=ASGITransport(app=_app()), base_url="http://test") as client:
+        response = await client.get("/large", headers={"Accept-Encoding": "gzip"})
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert int(response.headers["content-length"]) < len(BODY)
+    assert response.text == BODY
+
+
+@pytest.mark.asyncio
+async def test_skips_small_and_excluded_responses():
+    """Small bodies and already-compressed formats pass through."""
+    async with AsyncClient(transport=ASGITransport(app=_app()), base_url="http://test") as client:
+        small = await client.get("/small", headers={"Accept-Encoding": "gzip"})
+        kmz = await client.get("/kmz", headers={"Accept-Encoding": "gzip"})
+        identity = await client.get("/large", headers={"Accept-Encoding": "identity"})
+
+    assert "content-encoding" not in small.headers
+    assert "content-encoding" not in kmz.headers
+    assert "content-encoding" not in identity.headers
+
+
+@pytest.mark.asyncio
+async def test_compresses_streaming_responses_incrementally():
+    """Each streamed chunk is flushed through the encoder."""
+    async with AsyncClient(transport=ASGITransport(app=_app()), base_url="http://test") as client:
+        async with client.stream("GET", "/stream", headers={"Accept-Encoding": "gzip"}) as response:
+            raw = [chunk async for chunk in response.aiter_raw()]
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert "content-length" not in response.headers
+    assert gzip.decompress(b"".join(raw)).decode() == BODY * 10
+
+
+@pytest.mark.asyncio
+async def test_zstd_encoding():
+    """zstd is used when preferred and installed."""
+    zstandard = pytest.importorskip("zstandard")
+
+    async with AsyncClient(transport=ASGITransport(app=_app(("zstd", "gzip"))), base_url="http://test") as client:
+        async with client.stream("GET", "/stream", headers={"Accept-Encoding": "zstd, gzip"}) as response:
+            raw = b"".join([chunk async for chunk in response.aiter_raw()])
+
+    assert response.headers["content-encoding"] == "zstd"
+    assert zstandard.ZstdDecompressor().decompressobj().decompress(raw).decode() == BODY * 10
+
+
+@pytest.mark.asyncio
+async def test_compression_weakens_etags():
+    """Compressed responses carry a weak validator and do not advertise byte ranges."""
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware, minimum_size=100, encodings=("gzip",))
+
+    @app.get("/tagged")
+    async def tagged():
+        return PlainTextResponse(BODY, headers={"ETag": '"v1"', "Accept-Ranges": "bytes"})
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        compressed = await client.get("/tagged", headers={"Accept-Encoding": "gzip"})
+        identity = await client.get("/tagged", headers={"Accept-Encoding": "identity"})
+
+    assert compressed.headers["etag"] == 'W/"v1"'
+    assert "accept-ranges" not in compressed.headers
+    assert identity.headers["etag"] == '"v1"'
+    assert identity.headers["accept-ranges"] == "bytes"
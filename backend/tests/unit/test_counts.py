@@ -0,0 +1,80 @@
+"""Unit tests for COUNT(*)-backed totals."""
+from datetime import datetime
+
+import pytest
+from sqlalchemy import text
+
+from src.models.collection import Collection
+from src.models.photo import Photo, PhotoMetadata
+from src.services.base import BaseService
+from src.services.generation import bump_generation, collection_scope
+from src.services.photo_service import PhotoService
+
+
+async def _add_photos(db_session, collection, count, start=0):
+    for i in range(start, start + count):
+        photo = Photo(
+            filename=f"count{i}.jpg",
+            file_path=f"/tmp/count/{collection.id}/count{i}.jpg",
+            file_hash=f"count-{collection.id}-{i}",
+            timestamp=datetime(2023, 4, 1, 8, 0, i),
+            file_size=1024,
+            format="jpg",
+            collection_id=collection.id,
+        )
+        photo.metadata_ = PhotoMetadata(latitude=float(i), longitude=0.0)
+        db_session.add(photo)
+    await db_session.flush()
+
+
+@pytest.mark.asyncio
+async def test_base_service_count_uses_filters(db_session):
+    """BaseService.count counts in SQL under the given filters."""
+    collection = Collection(name="Counted")
+    db_session.add(collection)
+    await db_session.flush()
+    await _add_photos(db_session, collection, 3)
+
+    service = BaseService(Photo, db_session)
+
+    assert await service.count(Photo.collection_id == collection.id) == 3
+    assert await service.count(Photo.collection_id == collection.id, Photo.filename == "count1.jpg") == 1
+
+
+@pytest.mark.asyncio
+async def test_photo_count_cached_per_generation(db_session):
+    """Totals are cached until the collection's generation changes."""
+    collection = Collection(name="Cached Totals")
+    db_session.add(collection)
+    await db_session.flush()
+    await _add_photos(db_session, collection, 2)
+    service = PhotoService(db_session)
+    scope = collection_scope(collection.id)
+    clause = Photo.collection_id == collection.id
+
+    assert await service.count(clause, scope=scope) == 2
+    assert await service.count(clause, PhotoMetadata.latitude >= 1.0, scope=scope) == 1
+
+    await _add_photos(db_session, collection, 1, start=2)
+    assert await service.count(clause, scope=scope) == 2  # stale until the generation moves
+
+    await bump_generation(db_session, collection.id)
+    assert await service.count(clause, scope=scope) == 3
+
+
+@pytest.mark.asyncio
+async def test_approximate_count_uses_statistics(db_session):
+    """Approximate counts read sqlite_stat1 and fall back to COUNT(*)."""
+    collection = Collection(name="Approximate")
+    db_session.add(collection)
+    await db_session.flush()
+    await _add_photos(db_session, collection, 2)
+    service = BaseService(Photo, db_session)
+    exact = await service.count()
+
+    await db_session.execute(text("ANALYZE"))
+    assert await service.count(approximate=True) == exact
+
+    await _add_photos(db_session, collection, 1, start=2)
+    assert await service.count(approximate=True) == exact  # statistics lag behind
+    assert await service.count() == exact + 1
@@ -2,7 +2,7 @@
 import pytest
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.db.session import AsyncSessionLocal, get_db_session
+from src.db.session import AsyncSessionLocal, get_db_read_session, get_db_session
 
 
 @pytest.mark.asyncio
@@ -21,3 +21,47 @@ async def test_async_session_local_factory():
         assert isinstance(session, AsyncSession)
         # Session is active during context manager
         assert session.is_active
+
+
+@pytest.mark.asyncio
+async def test_get_db_read_session():
+    """Test that get_db_read_session provides a session on the read engine."""
+    from src.db.session import read_engine
+
+    async for session in get_db_read_session():
+        assert isinstance(session, AsyncSession)
+        assert session.bind is read_engine
+        break
+
+
+@pytest.mark.asyncio
+async def test_read_only_engine_rejects_writes(tmp_path):
+    """Read-only SQLite connections see committed data and cannot write."""
+    from sqlalchemy import text
+    from sqlalchemy.engine import make_url
+    from sqlalchemy.exc import OperationalError
+    from sqlalchemy.ext.asyncio import create_async_engine
+
+    from src.config import Settings
+    from src.db.sqlite import install_pragmas, read_only_url, sqlite_pragmas
+
+    url = make_url(f"sqlite+aiosqlite:///{tmp_path / 'rw.db'}")
+    writer = create_async_engine(url, pool_size=1, max_overflow=0)
+    reader = create_async_engine(read_only_url(url))
+    install_pragmas(writer, sqlite_pragmas(Settings()))
+    install_pragmas(reader, sqlite_pragmas(Settings(), read_only=True))
+    try:
+        async with writer.begin() as conn:
+            await conn.execute(text("CREATE TABLE t (id INTEGER PRIMARY KEY)"))
+            await conn.execute(text("INSERT INTO t VALUES (1)"))
+
+        async with writer.connect() as write_conn, reader.connect() as read_conn:
+            # An open write transaction does not block readers
+            await write_conn.execute(text("INSERT INTO t VALUES (2)"))
+            assert (await read_conn.execute(text("SELECT COUNT(*) FROM t"))).scalar_one() == 1
+            with pytest.raises(OperationalError, match="readonly"):
+                await read_conn.execute(text("INSERT INTO t VALUES (3)"))
+            await write_conn.commit()
+    finally:
+        await reader.dispose()
+        await writer.dispose()
@@ -0,0 +1,33 @@
+"""Unit tests for downsampling utilities."""
+import math
+
+from src.utils.downsample import lttb
+
+
+def test_lttb_returns_all_points_below_threshold():
+    """Short series are returned unchanged."""
+    assert lttb([0, 1, 2], [1, 2, 3], 10) == [0, 1, 2]
+
+
+def test_lttb_keeps_endpoints_and_size():
+    """Downsampled series keeps first/last points and the requested size."""
+    xs = list(range(1000))
+    ys = [math.sin(x / 50) for x in xs]
+
+    kept = lttb(xs, ys, 100)
+
+    assert len(kept) == 100
+    assert kept[0] == 0
+    assert kept[-1] == 999
+    assert kept == sorted(kept)
+
+
+def test_lttb_preserves_peaks():
+    """A single spike survives downsampling."""
+    xs = list(range(500))
+    ys = [0.0] * 500
+    ys[321] = 100.0
+
+    kept = lttb(xs, ys, 20)
+
+    assert 321 in kept
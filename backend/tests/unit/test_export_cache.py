@@ -0,0 +1,89 @@
+"""Unit tests for the export artifact cache."""
+import os
+
+import pytest
+
+from src.services.export_cache import ExportCache, etag_matches
+
+
+async def _chunks(*parts, fail=False):
+    for part in parts:
+        yield part
+    if fail:
+        raise RuntimeError("export failed")
+
+
+def test_key_depends_on_format_filters_and_generation():
+    """Any change in format, filters or generation yields a new key."""
+    base = ExportCache.key("geojson", {"photo_ids": ["a"]}, 1)
+
+    assert ExportCache.key("geojson", {"photo_ids": ["a"]}, 1) == base
+    assert ExportCache.key("GeoJSON", {"photo_ids": ["a"]}, 1) == base
+    assert ExportCache.key("csv", {"photo_ids": ["a"]}, 1) != base
+    assert ExportCache.key("geojson", {"photo_ids": ["b"]}, 1) != base
+    assert ExportCache.key("geojson", {"photo_ids": ["a"]}, 2) != base
+
+
+def test_etag_matches():
+    """If-None-Match uses weak comparison and supports lists and '*'."""
+    assert etag_matches('"abc"', '"abc"')
+    assert etag_matches('W/"abc"', '"abc"')
+    assert etag_matches('"x", W/"abc"', '"abc"')
+    assert etag_matches("*", '"abc"')
+    assert not etag_matches('"x"', '"abc"')
+    assert not etag_matches(None, '"abc"')
+
+
+@pytest.mark.asyncio
+async def test_store_commits_complete_streams(tmp_path):
+    """A fully consumed stream is passed through and cached."""
+    cache = ExportCache(tmp_path, max_bytes=1024)
+
+    received = [chunk async for chunk in cache.store("k1", _chunks(b"ab", b"cd"))]
+
+    assert received == [b"ab", b"cd"]
+    assert cache.get("k1").read_bytes() == b"abcd"
+    assert cache.get("missing") is None
+
+
+@pytest.mark.asyncio
+async def test_store_discards_failed_streams(tmp_path):
+    """A stream that fails midway leaves nothing in the cache."""
+    cache = ExportCache(tmp_path, max_bytes=1024)
+
+    with pytest.raises(RuntimeError):
+        async for _ in cache.store("k1", _chunks(b"ab", fail=True)):
+            pass
+
+    assert cache.get("k1") is None
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_evict_removes_least_recently_used(tmp_path):
+    """Eviction drops the oldest artifacts until under the budget."""
+    cache = ExportCache(tmp_path, max_bytes=250, grace_seconds=0)
+    for age, key in enumerate(["new", "mid", "old"]):
+        path = cache.path(key)
+        path.write_bytes(b"x" * 100)
+        os.utime(path, (1000 - age, 1000 - age))
+
+    # A hit refreshes recency, so "old" now outlives "mid"
+    assert cache.get("old") is not None
+
+    assert cache.evict() == 1
+    assert cache.get("mid") is None
+    assert cache.get("old") is not None
+    assert cache.get("new") is not None
+
+
+def test_evict_keeps_recently_served_artifacts(tmp_path):
+    """An artifact just served is not removed while its response may still open it."""
+    cache = ExportCache(tmp_path, max_bytes=150)
+    for key in ["a", "b"]:
+        cache.path(key).write_bytes(b"x" * 100)
+    os.utime(cache.path("a"), (1000, 1000))
+
+    assert cache.get("b") is not None
+    assert cache.evict() == 1
+    assert cache.get("a") is None
+    assert cache.get("b") is not None
@@ -0,0 +1,60 @@
+"""Unit tests for background export jobs."""
+import asyncio
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from unittest.mock import Mock
+
+import pytest
+
+from src.services.export_jobs import ExportJob, ExportJobManager, ExportJobStatus
+
+
+def _slow_header(started: threading.Event) -> bytes:
+    started.set()
+    time.sleep(0.1)
+    return b""
+
+
+@pytest.mark.asyncio
+async def test_cancelled_job_is_terminal(tmp_path):
+    """A job cancelled while rendering ends up cancelled, not running."""
+    manager = ExportJobManager(tmp_path)
+    started = threading.Event()
+    writer = Mock(media_type="text/csv", extension="csv")
+    writer.header = lambda: _slow_header(started)
+    job = ExportJob(format="csv", media_type="text/csv", extension="csv")
+    job.task = asyncio.create_task(manager._run(job, Mock(), writer, Mock()))
+
+    await asyncio.to_thread(started.wait)
+    job.task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await job.task
+
+    assert job.status == ExportJobStatus.CANCELLED
+    assert job.finished
+    assert job.finished_at.tzinfo is timezone.utc
+
+
+@pytest.mark.asyncio
+async def test_expired_jobs_are_pruned_on_a_timer(tmp_path):
+    """Finished jobs past their TTL are dropped without waiting for a new submit."""
+    manager = ExportJobManager(tmp_path, ttl_seconds=60, prune_interval=0.01)
+    artifact = tmp_path / "done.csv"
+    artifact.write_bytes(b"a,b\n")
+    job = ExportJob(
+        format="csv",
+        media_type="text/csv",
+        extension="csv",
+        status=ExportJobStatus.COMPLETED,
+        finished_at=datetime.now(timezone.utc) - timedelta(hours=2),
+        path=artifact,
+    )
+    manager._jobs[job.id] = job
+
+    manager.start()
+    await asyncio.sleep(0.05)
+    await manager.shutdown()
+
+    assert job.id not in manager._jobs
+    assert not artifact.exists()
@@ -1,4 +1,7 @@
 """Unit tests for export service."""
+import json
+import struct
+
 import pytest
 from unittest.mock import MagicMock
 from datetime import datetime
@@ -86,3 +89,124 @@ def test_export_handles_missing_altitude(sample_photos):
     kml = service.export_to_kml(sample_photos)
     assert "-122.0,45.0</coordinates>" in kml
     assert "None" not in kml
+
+
+def test_iter_export_streams_in_batches(sample_photos):
+    """Streamed exports yield header, one chunk per batch and footer."""
+    from src.services.export_service import rows_from_photos
+
+    service = ExportService()
+    chunks = list(service.iter_export("geojson", rows_from_photos(sample_photos), batch_size=1))
+
+    assert len(chunks) == 4  # header + 2 batches + footer
+    document = json.loads(b"".join(chunks))
+    assert document == service.export_to_geojson(sample_photos)
+
+
+def test_create_writer_rejects_unknown_format():
+    """Unsupported formats raise a validation error."""
+    from src.exceptions import ValidationError
+
+    service = ExportService()
+    with pytest.raises(ValidationError):
+        service.create_writer("shapefile")
+
+
+def test_export_to_kmz(sample_photos):
+    """KMZ is a deflated zip holding the same document as the KML export."""
+    import io
+    import zipfile
+    from src.services.export_service import ExportRow
+
+    service = ExportService()
+    rows = [
+        ExportRow(str(i), f"photo{i}.jpg", datetime(2023, 1, 15, 10, 0, 0), 45.0 + i / 1000, -122.0, 100.0)
+        for i in range(500)
+    ]
+
+    kml = "".join(service.iter_export("kml", rows, batch_size=100))
+    kmz = b"".join(service.iter_export("kmz", rows, batch_size=100))
+
+    with zipfile.ZipFile(io.BytesIO(kmz)) as archive:
+        assert archive.namelist() == ["doc.kml"]
+        assert archive.getinfo("doc.kml").compress_type == zipfile.ZIP_DEFLATED
+        # Fixed entry time: the same rows always give the same bytes
+        assert archive.getinfo("doc.kml").date_time == (1980, 1, 1, 0, 0, 0)
+        assert archive.read("doc.kml").decode("utf-8") == kml
+    # Written as zip64 (version needed 4.5) so any size can be streamed
+    assert kmz[4:6] == (45).to_bytes(2, "little")
+    assert len(kmz) * 3 < len(kml.encode("utf-8"))
+
+
+def test_export_to_geoparquet():
+    """GeoParquet export writes typed columns, WKB points and geo metadata."""
+    pa = pytest.importorskip("pyarrow")
+    import io
+    import pyarrow.parquet as pq
+    from src.services.export_service import ExportRow, GeoParquetWriter
+
+    rows = [
+        ExportRow(str(i), f"photo{i}.jpg", datetime(2023, 1, 15, 10, 0, i % 60), 45.0, -122.0 + i, None, "FC3170")
+        for i in range(25)
+    ]
+    writer = GeoParquetWriter(row_group_size=10)
+    data = writer.header() + b"".join(writer.write(rows[i:i + 5]) for i in range(0, 25, 5)) + writer.footer()
+
+    parquet = pq.ParquetFile(io.BytesIO(data))
+    assert parquet.metadata.num_rows == 25
+    assert parquet.metadata.num_row_groups == 3
+    assert json.loads(parquet.schema_arrow.metadata[b"geo"])["primary_column"] == "geometry"
+    assert pa.types.is_dictionary(parquet.schema_arrow.field("camera_model").type)
+
+    table = parquet.read()
+    assert table.column("filename")[3].as_py() == "photo3.jpg"
+    assert table.column("altitude").null_count == 25
+    assert table.column("geometry")[1].as_py() == struct.pack("<BIdd", 1, 1, -121.0, 45.0)
+
+
+def test_export_to_gpx_splits_segments():
+    """GPX export starts a track segment per flight and after time gaps."""
+    import xml.etree.ElementTree as ET
+    from src.services.export_service import ExportRow
+
+    def row(i, minute, collection_id, altitude=120.0):
+        return ExportRow(
+            str(i), f"p{i}.jpg", datetime(2023, 1, 15, 10, minute, 0), 45.0 + i, -122.0, altitude, None, collection_id
+        )
+
+    rows = [
+        row(0, 0, "a"), row(1, 1, "a"), row(2, 2, "a", altitude=None),
+        row(3, 30, "a"),  # long pause: new segment
+        row(4, 31, "b"),  # different flight: new segment
+    ]
+    gpx = "".join(ExportService().iter_export("gpx", rows, batch_size=2))
+
+    ns = {"gpx": "http://www.topografix.com/GPX/1/1"}
+    root = ET.fromstring(gpx)
+    segments = root.findall("gpx:trk/gpx:trkseg", ns)
+    assert [len(seg.findall("gpx:trkpt", ns)) for seg in segments] == [3, 1, 1]
+
+    first = segments[0].find("gpx:trkpt", ns)
+    assert first.attrib == {"lat": "45.0", "lon": "-122.0"}
+    assert first.find("gpx:ele", ns).text == "120.0"
+    assert first.find("gpx:time", ns).text == "2023-01-15T10:00:00"
+    assert segments[0].findall("gpx:trkpt", ns)[2].find("gpx:ele", ns) is None
+
+
+def test_export_to_gpx_empty():
+    """An empty GPX export is a valid track without segments."""
+    import xml.etree.ElementTree as ET
+
+    gpx = "".join(ExportService().iter_export("gpx", []))
+
+    root = ET.fromstring(gpx)
+    assert root.find("{http://www.topografix.com/GPX/1/1}trk") is not None
+    assert "trkseg" not in gpx
+
+
+def test_gpx_export_query_groups_flights():
+    """GPX rows are grouped by collection so overlapping flights do not interleave."""
+    from src.services.export_service import export_query
+
+    assert "ORDER BY photos.timestamp, photos.id" in str(export_query(export_format="csv"))
+    assert "ORDER BY photos.collection_id, photos.timestamp, photos.id" in str(export_query(export_format="GPX"))
@@ -57,3 +57,46 @@ def test_filter_by_bounds(sample_photos):
     assert sample_photos[0] in filtered
     assert sample_photos[2] in filtered
     assert sample_photos[1] not in filtered
+
+
+def test_photo_filter_clauses_compile_to_sql():
+    """Date and bounds filters become SQL predicates."""
+    from sqlalchemy import select
+    from src.schemas.photo import Bounds
+    from src.utils.filters import photo_filter_clauses
+
+    assert photo_filter_clauses() == []
+
+    clauses = photo_filter_clauses(
+        datetime(2023, 1, 1), datetime(2023, 2, 1), Bounds(north=45.0, south=44.0, east=-122.0, west=-123.0)
+    )
+    sql = str(select(Photo.id).join(Photo.metadata_).where(*clauses))
+
+    assert len(clauses) == 3
+    assert "photos.timestamp >=" in sql
+    assert "photos.latitude <=" in sql
+    assert "photos.longitude >=" in sql
+
+
+def test_add_photo_filters_share_cache_key():
+    """Filter values are bound parameters, so different values share one cached statement."""
+    from sqlalchemy import lambda_stmt, select
+    from src.schemas.photo import Bounds
+    from src.utils.filters import add_photo_filters
+
+    def build(day, north):
+        return add_photo_filters(
+            lambda_stmt(lambda: select(Photo.id)),
+            date_start=datetime(2023, 1, day),
+            bounds=Bounds(north=north, south=44.0, east=-122.0, west=-123.0),
+            collection_id="c1",
+        )
+
+    stmt, other = build(1, 45.0), build(2, 46.0)
+    sql = str(stmt.compile())
+
+    assert "photos.collection_id =" in sql
+    assert "photos.timestamp >=" in sql
+    assert "photos.latitude <=" in sql
+    assert stmt._generate_cache_key().key == other._generate_cache_key().key
+    assert datetime(2023, 1, 2) in [p.effective_value for p in other._generate_cache_key().bindparams]
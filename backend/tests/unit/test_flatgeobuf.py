@@ -0,0 +1,92 @@
+"""Unit tests for FlatGeobuf encoding."""
+import random
+import struct
+import tempfile
+from datetime import datetime
+
+import pytest
+
+from src.services.export_service import ExportRow, ExportService
+
+
+@pytest.fixture
+def fgb():
+    """The FlatGeobuf module; skipped without the optional flatbuffers package."""
+    pytest.importorskip("flatbuffers")
+    from src.utils import flatgeobuf
+
+    return flatgeobuf
+
+
+def _export(count: int) -> bytes:
+    rows = [
+        ExportRow(str(i), f"photo{i}.jpg", datetime(2023, 1, 15, 10, 0, 0), 45.0 + i / 100, -122.0 + i / 100, None)
+        for i in range(count)
+    ]
+    return b"".join(ExportService().iter_export("fgb", rows, batch_size=7))
+
+
+def _search(fgb, index: bytes, num_items: int, bbox):
+    """Reference bbox search over a packed R-tree, returning leaf offsets."""
+    bounds = fgb.level_bounds(num_items)
+    leaf_start = bounds[0][0]
+    found = []
+    queue = [(0, len(bounds) - 1)]
+    while queue:
+        node_index, level = queue.pop()
+        level_end = bounds[level][1]
+        end = min(node_index + 16, level_end)
+        for pos in range(node_index, end):
+            min_x, min_y, max_x, max_y, offset = struct.unpack_from("<ddddQ", index, pos * fgb.NODE_ITEM_SIZE)
+            if max_x < bbox[0] or min_x > bbox[2] or max_y < bbox[1] or min_y > bbox[3]:
+                continue
+            if pos >= leaf_start:
+                found.append(offset)
+            else:
+                queue.append((offset, level - 1))
+    return sorted(found)
+
+
+def test_level_bounds(fgb):
+    """Levels are listed leaves first; the root is node 0."""
+    assert fgb.level_bounds(1) == [(1, 2), (0, 1)]
+    assert fgb.level_bounds(17) == [(3, 20), (1, 3), (0, 1)]
+
+
+def test_hilbert_corners(fgb):
+    """Hilbert index spans the grid from one corner to another."""
+    assert fgb.hilbert(0, 0) == 0
+    assert fgb.hilbert(0xFFFF, 0) == 0xFFFFFFFF
+
+
+def test_packed_rtree_search_matches_brute_force(fgb):
+    """Searching the index finds exactly the leaves inside a bbox."""
+    random.seed(7)
+    boxes = []
+    for _ in range(300):
+        x, y = random.uniform(0, 10), random.uniform(0, 10)
+        boxes.append((x, y, x, y))
+    index = fgb.packed_rtree(boxes, list(range(300)))
+
+    assert len(index) == fgb.level_bounds(300)[0][1] * fgb.NODE_ITEM_SIZE
+    bbox = (2.0, 3.0, 4.5, 6.0)
+    expected = [i for i, b in enumerate(boxes) if bbox[0] <= b[0] <= bbox[2] and bbox[1] <= b[1] <= bbox[3]]
+    assert _search(fgb, index, 300, bbox) == expected
+
+
+def test_export_to_flatgeobuf(fgb):
+    """FlatGeobuf export starts with the magic bytes."""
+    assert _export(40).startswith(fgb.MAGIC_BYTES)
+
+
+def test_flatgeobuf_reads_back_with_gdal(fgb):
+    """GDAL (through pyogrio) reads every feature and filters on the spatial index."""
+    pyogrio = pytest.importorskip("pyogrio")
+    with tempfile.NamedTemporaryFile(suffix=".fgb") as f:
+        f.write(_export(40))
+        f.flush()
+        info = pyogrio.read_info(f.name)
+        assert info["features"] == 40
+        assert info["capabilities"]["fast_spatial_filter"]
+        _, _, _, fields = pyogrio.raw.read(f.name, bbox=(-121.955, 45.045, -121.845, 45.155))
+        assert set(fields[1]) == {f"photo{i}.jpg" for i in range(5, 16)}
@@ -65,3 +65,115 @@ def test_calculate_stats_multiple_photos(flight_service):
     # Allow some margin for calculation differences
     assert stats["total_distance_meters"] > 200000
     assert stats["total_distance_meters"] < 250000
+
+
+async def _add_photo(session, service, collection_id, name, timestamp, lat, lon):
+    photo = Photo(
+        filename=f"{name}.jpg",
+        file_path=f"/tmp/{collection_id}/{name}.jpg",
+        file_hash=f"{collection_id}-{name}",
+        timestamp=timestamp,
+        file_size=1024,
+        format="jpg",
+        collection_id=collection_id,
+        latitude=lat,
+        longitude=lon,
+    )
+    session.add(photo)
+    await session.flush()
+    metadata = PhotoMetadata(latitude=lat, longitude=lon, photo_id=photo.id)
+    await service.insert_into_flight(photo, metadata)
+    session.add(metadata)
+    await session.flush()
+    return metadata
+
+
+@pytest.mark.asyncio
+async def test_insert_into_flight_out_of_order(db_session):
+    """Cumulative distances stay correct when photos arrive out of capture order."""
+    from src.models.collection import Collection
+
+    collection = Collection(name="Cumulative")
+    db_session.add(collection)
+    await db_session.flush()
+    service = FlightService(db_session)
+
+    m3 = await _add_photo(db_session, service, collection.id, "p3", datetime(2023, 1, 1, 10, 2), 0.0, 0.02)
+    m1 = await _add_photo(db_session, service, collection.id, "p1", datetime(2023, 1, 1, 10, 0), 0.0, 0.0)
+    m2 = await _add_photo(db_session, service, collection.id, "p2", datetime(2023, 1, 1, 10, 1), 0.0, 0.01)
+
+    await db_session.refresh(m3)
+    assert m1.cumulative_distance == 0
+    assert m2.cumulative_distance == pytest.approx(1112, rel=0.01)
+    assert m3.cumulative_distance == pytest.approx(2224, rel=0.01)
+
+    total = await service.distance_between(collection.id)
+    assert total == pytest.approx(m3.cumulative_distance)
+
+    window = await service.distance_between(
+        collection.id, datetime(2023, 1, 1, 10, 1), datetime(2023, 1, 1, 10, 5)
+    )
+    assert window == pytest.approx(1112, rel=0.01)
+
+    empty = await service.distance_between(collection.id, datetime(2024, 1, 1))
+    assert empty == 0
+
+
+@pytest.mark.asyncio
+async def test_rebuild_cumulative_distances(db_session):
+    """Rebuilding recomputes the track from scratch."""
+    from src.models.collection import Collection
+
+    collection = Collection(name="Rebuild")
+    db_session.add(collection)
+    await db_session.flush()
+    service = FlightService(db_session)
+
+    m1 = await _add_photo(db_session, service, collection.id, "p1", datetime(2023, 1, 1, 10, 0), 0.0, 0.0)
+    m2 = await _add_photo(db_session, service, collection.id, "p2", datetime(2023, 1, 1, 10, 1), 0.0, 0.01)
+    m3 = await _add_photo(db_session, service, collection.id, "p3", datetime(2023, 1, 1, 10, 2), 0.0, 0.02)
+    m1.cumulative_distance = 0
+    m2.cumulative_distance = 0
+    m3.cumulative_distance = 0
+
+    total = await service.rebuild_cumulative_distances(collection.id)
+    for metadata in (m1, m2, m3):
+        await db_session.refresh(metadata)
+
+    assert total == pytest.approx(2224, rel=0.01)
+    assert m1.cumulative_distance == 0
+    assert m2.cumulative_distance == pytest.approx(total / 2)
+    assert m3.cumulative_distance == pytest.approx(total)
+
+    # Only the photos from the one before ``since`` onwards are rewritten
+    m1.cumulative_distance = 500
+    m3.cumulative_distance = 0
+    total = await service.rebuild_cumulative_distances(collection.id, since=datetime(2023, 1, 1, 10, 2))
+    for metadata in (m1, m2, m3):
+        await db_session.refresh(metadata)
+
+    assert m1.cumulative_distance == 500
+    assert m3.cumulative_distance == pytest.approx(2224, rel=0.01)
+    assert total == m3.cumulative_distance
+
+
+@pytest.mark.asyncio
+async def test_stats_reads_photo_positions(db_session):
+    """Filtered stats match calculate_stats over the same photos."""
+    from src.models.collection import Collection
+
+    collection = Collection(name="Track Stats")
+    db_session.add(collection)
+    await db_session.flush()
+    service = FlightService(db_session)
+
+    await _add_photo(db_session, service, collection.id, "p1", datetime(2023, 1, 1, 10, 0), 0.0, 0.0)
+    await _add_photo(db_session, service, collection.id, "p3", datetime(2023, 1, 1, 10, 2), 0.0, 0.02)
+    await _add_photo(db_session, service, collection.id, "p2", datetime(2023, 1, 1, 10, 1), 0.0, 0.01)
+
+    stats = await service.stats(collection_id=collection.id)
+
+    assert stats["total_photos"] == 3
+    assert stats["date_start"] == datetime(2023, 1, 1, 10, 0)
+    assert stats["total_duration_seconds"] == 120
+    assert stats["total_distance_meters"] == pytest.approx(2224, rel=0.01)
@@ -0,0 +1,82 @@
+"""Unit tests for keyset pagination helpers."""
+from datetime import datetime
+
+import pytest
+
+from src.exceptions import ValidationError
+from src.models.photo import Photo
+from src.utils.pagination import decode_cursor, encode_cursor, keyset_page, keyset_query, keyset_stmt
+
+SORT_KEY = (Photo.timestamp, Photo.id)
+
+
+def test_cursor_round_trip():
+    """Cursors restore typed sort key values."""
+    values = [datetime(2023, 1, 15, 10, 0, 0, 123456), "abc"]
+
+    cursor = encode_cursor(values)
+
+    assert "=" not in cursor
+    assert decode_cursor(cursor, SORT_KEY) == values
+
+
+@pytest.mark.parametrize("cursor", ["not-base64!", encode_cursor(["only-one"]), encode_cursor([1, "x"]), "e30"])
+def test_invalid_cursor(cursor):
+    """Malformed or mismatched cursors are rejected."""
+    with pytest.raises(ValidationError) as exc:
+        decode_cursor(cursor, SORT_KEY)
+    assert exc.value.error_code == "INVALID_CURSOR"
+
+
+def test_keyset_query_compiles_seek_predicate():
+    """The resume predicate expands the row comparison over the sort key."""
+    from sqlalchemy import select
+
+    cursor = encode_cursor([datetime(2023, 1, 1), "abc"])
+    sql = str(keyset_query(select(Photo.id), SORT_KEY, cursor, 10).compile())
+
+    assert "photos.timestamp > :timestamp_1 OR photos.timestamp = :timestamp_2 AND photos.id > :id_1" in sql
+    assert "ORDER BY photos.timestamp, photos.id" in sql
+
+
+def test_keyset_page():
+    """The look-ahead row is trimmed and yields the next cursor."""
+    rows = [(1, "a"), (2, "b"), (3, "c")]
+
+    page, cursor = keyset_page(rows, 2, lambda row: row)
+    assert page == [(1, "a"), (2, "b")]
+    assert decode_cursor(cursor, (Photo.file_size, Photo.id)) == [2, "b"]
+
+    assert keyset_page(rows, 3, lambda row: row) == (rows, None)
+
+
+def test_keyset_query_without_limit():
+    """An unbounded keyset query is ordered and resumed but not limited."""
+    from sqlalchemy import select
+
+    cursor = encode_cursor([datetime(2023, 1, 1), "abc"])
+    sql = str(keyset_query(select(Photo.id), SORT_KEY, cursor, None).compile())
+
+    assert "photos.id > :id_1" in sql
+    assert sql.endswith("ORDER BY photos.timestamp, photos.id")
+
+
+def test_keyset_stmt_matches_keyset_query():
+    """The lambda form renders the same SQL and caches one shape for every cursor."""
+    from sqlalchemy import lambda_stmt, select
+
+    first = encode_cursor([datetime(2023, 1, 1), "abc"])
+    second = encode_cursor([datetime(2024, 6, 1), "xyz"])
+
+    def build(cursor):
+        return keyset_stmt(lambda_stmt(lambda: select(Photo.id)), SORT_KEY, cursor, 10)
+
+    stmt, other = build(first), build(second)
+
+    def literal(query):
+        return str(query.compile(compile_kwargs={"literal_binds": True}))
+
+    assert literal(stmt) == literal(keyset_query(select(Photo.id), SORT_KEY, first, 10))
+    other_key = other._generate_cache_key()
+    assert stmt._generate_cache_key().key == other_key.key
+    assert {p.effective_value for p in other_key.bindparams} == {datetime(2024, 6, 1), "xyz", 11}
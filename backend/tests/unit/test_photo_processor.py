@@ -1,9 +1,11 @@
 """Unit tests for photo processor service."""
 import pytest
+import pytest_asyncio
 from pathlib import Path
 from unittest.mock import Mock, patch, AsyncMock
 
 from src.services.photo_processor import PhotoProcessor
+from src.models.collection import Collection
 from src.models.photo import Photo, PhotoMetadata
 
 
@@ -12,6 +14,15 @@ def photo_processor(db_session):
     return PhotoProcessor(db_session)
 
 
+@pytest_asyncio.fixture
+async def collection_id(db_session):
+    """A collection to import into (photos reference it by foreign key)."""
+    collection = Collection(name="Processor")
+    db_session.add(collection)
+    await db_session.flush()
+    return collection.id
+
+
 @pytest.mark.asyncio
 async def test_scan_folder(photo_processor, tmp_path):
     """Test scanning a folder for images."""
@@ -28,10 +39,17 @@ async def test_scan_folder(photo_processor, tmp_path):
 
 
 @pytest.mark.asyncio
-async def test_process_photos(photo_processor, tmp_path):
+async def test_process_photos(photo_processor, collection_id, tmp_path):
     """Test processing photos and saving to DB."""
     # Mock CollectionManager
     photo_processor.collection_manager = AsyncMock()
+
+    async def insert_into_flight(photo, metadata):
+        # The summary row is locked before the photo's neighbours are read
+        photo_processor.collection_manager.lock_summary.assert_awaited_once_with(collection_id)
+        return 0.0
+
+    photo_processor.flight_service.insert_into_flight = insert_into_flight
     
     # Mock GPS extractor
     with patch("src.services.gps_extractor.GPSExtractor.extract") as mock_extract:
@@ -45,18 +63,23 @@ async def test_process_photos(photo_processor, tmp_path):
         photo_path.write_text("some content")
         
         result = await photo_processor.process_photos(
-            [photo_path], collection_id="test-col-id"
+            [photo_path], collection_id=collection_id
         )
         
         assert result["successful"] == 1
         assert result["failed"] == 0
+
+        # The summary is folded into the row locked above, with no second lock
+        manager = photo_processor.collection_manager
+        manager.lock_summary.assert_awaited_once_with(collection_id)
+        assert manager.record_photo.await_args.args[0] is manager.lock_summary.return_value
         
         # Verify DB insertion (mocked session)
         # In a real unit test with DB, we'd query the DB
 
 
 @pytest.mark.asyncio
-async def test_process_photos_preserves_files(photo_processor, tmp_path):
+async def test_process_photos_preserves_files(photo_processor, collection_id, tmp_path):
     """Test that processing photos does not modify the original files."""
     # Mock CollectionManager
     photo_processor.collection_manager = AsyncMock()
@@ -79,7 +102,7 @@ async def test_process_photos_preserves_files(photo_processor, tmp_path):
         
         # Process the photo
         await photo_processor.process_photos(
-            [photo_path], collection_id="test-col-id"
+            [photo_path], collection_id=collection_id
         )
         
         # Verify content is unchanged
@@ -94,7 +117,7 @@ async def test_process_photos_preserves_files(photo_processor, tmp_path):
 
 
 @pytest.mark.asyncio
-async def test_process_photos_duplicate(photo_processor, tmp_path):
+async def test_process_photos_duplicate(photo_processor, collection_id, tmp_path):
     """Test duplicate photo detection."""
     # Mock CollectionManager
     photo_processor.collection_manager = AsyncMock()
@@ -112,7 +135,7 @@ async def test_process_photos_duplicate(photo_processor, tmp_path):
         
         # Process first time
         result1 = await photo_processor.process_photos(
-            [photo_path], collection_id="test-col-id"
+            [photo_path], collection_id=collection_id
         )
         assert result1["successful"] == 1
         
@@ -121,7 +144,7 @@ async def test_process_photos_duplicate(photo_processor, tmp_path):
         photo_path2.write_bytes(b"duplicate content")
         
         result2 = await photo_processor.process_photos(
-            [photo_path2], collection_id="test-col-id"
+            [photo_path2], collection_id=collection_id
         )
         
         assert result2["successful"] == 0
@@ -0,0 +1,155 @@
+"""Unit tests for the trusted photo read path."""
+from datetime import datetime
+
+import orjson
+import pytest
+from sqlalchemy import select
+from sqlalchemy.orm import selectinload
+
+from src.models.collection import Collection
+from src.models.photo import Photo, PhotoMetadata
+from src.schemas.photo import PhotoResponse
+from src.services.photo_service import PhotoService
+
+
+@pytest.mark.asyncio
+async def test_fetch_dicts_matches_pydantic_serialization(db_session):
+    """Trusted dicts serialize exactly like validated PhotoResponse models."""
+    collection = Collection(name="Trusted Path")
+    db_session.add(collection)
+    await db_session.flush()
+    for i, with_metadata in enumerate([True, False]):
+        photo = Photo(
+            filename=f"trusted{i}.jpg",
+            file_path=f"/tmp/trusted/trusted{i}.jpg",
+            file_hash=f"trusted-{i}",
+            timestamp=datetime(2023, 3, 1, 9, i, 0, 250000),
+            file_size=2048,
+            format="jpg",
+            collection_id=collection.id,
+        )
+        if with_metadata:
+            photo.metadata_ = PhotoMetadata(
+                latitude=10.5, longitude=20.25, altitude=None, camera_model="FC3170", iso=100
+            )
+        db_session.add(photo)
+    await db_session.flush()
+
+    service = PhotoService(db_session)
+    query = service.rows_query().where(Photo.collection_id == collection.id).order_by(Photo.filename)
+    trusted = orjson.loads(orjson.dumps(await service.fetch_dicts(query)))
+
+    result = await db_session.execute(
+        select(Photo)
+        .options(selectinload(Photo.metadata_))
+        .where(Photo.collection_id == collection.id)
+        .order_by(Photo.filename)
+    )
+    validated = [
+        PhotoResponse.model_validate(photo).model_dump(mode="json", by_alias=True) for photo in result.scalars()
+    ]
+
+    assert trusted == validated
+    assert trusted[0]["metadata"]["camera_model"] == "FC3170"
+    assert trusted[1]["metadata"] is None
+
+
+def test_parse_fields():
+    """Sparse fieldsets keep canonical order and always include id/timestamp."""
+    from src.services.photo_service import FULL_PROJECTION, Projection, parse_fields
+
+    assert parse_fields(None) == FULL_PROJECTION
+    assert parse_fields("longitude, latitude,filename") == Projection(
+        ("id", "filename", "timestamp"), ("latitude", "longitude")
+    )
+    assert parse_fields("metadata.id") == Projection(("id", "timestamp"), ("id",))
+
+
+def test_parse_fields_rejects_unknown_names():
+    """Unknown field names are a validation error."""
+    from src.exceptions import ValidationError
+    from src.services.photo_service import parse_fields
+
+    with pytest.raises(ValidationError) as exc:
+        parse_fields("latitude,file_hash")
+    assert exc.value.error_code == "INVALID_FIELDS"
+
+
+def test_rows_query_joins_metadata_only_when_needed():
+    """Photo-only projections read a single table unless a filter needs metadata."""
+    from src.services.photo_service import parse_fields
+
+    photo_only = str(PhotoService.rows_query(projection=parse_fields("filename")))
+    filtered = str(PhotoService.rows_query(PhotoMetadata.latitude > 1.0, projection=parse_fields("filename")))
+
+    assert "photo_metadata" not in photo_only
+    assert "LEFT OUTER JOIN photo_metadata" in filtered
+
+
+@pytest.mark.asyncio
+async def test_sparse_projection_shapes_rows(db_session):
+    """Sparse rows hold only the requested fields, metadata nested."""
+    from src.services.photo_service import parse_fields
+
+    collection = Collection(name="Sparse")
+    db_session.add(collection)
+    await db_session.flush()
+    photo = Photo(
+        filename="sparse.jpg",
+        file_path="/tmp/sparse/sparse.jpg",
+        file_hash="sparse-0",
+        timestamp=datetime(2023, 3, 2, 9, 0, 0),
+        file_size=2048,
+        format="jpg",
+        collection_id=collection.id,
+    )
+    photo.metadata_ = PhotoMetadata(latitude=1.5, longitude=2.5)
+    bare = Photo(
+        filename="bare.jpg",
+        file_path="/tmp/sparse/bare.jpg",
+        file_hash="sparse-1",
+        timestamp=datetime(2023, 3, 2, 9, 0, 1),
+        file_size=2048,
+        format="jpg",
+        collection_id=collection.id,
+    )
+    db_session.add_all([photo, bare])
+    await db_session.flush()
+
+    service = PhotoService(db_session)
+    projection = parse_fields("latitude,longitude")
+    query = service.rows_query(Photo.collection_id == collection.id, projection=projection).order_by(Photo.timestamp)
+    rows = await service.fetch_dicts(query, projection)
+
+    assert rows == [
+        {"id": photo.id, "timestamp": photo.timestamp, "metadata": {"latitude": 1.5, "longitude": 2.5}},
+        {"id": bare.id, "timestamp": bare.timestamp, "metadata": None},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_metadata_position_is_copied_to_photo(db_session):
+    """Photo position follows its metadata on insert and update."""
+    collection = Collection(name="Position Sync")
+    db_session.add(collection)
+    await db_session.flush()
+    photo = Photo(
+        filename="sync.jpg",
+        file_path="/tmp/sync/sync.jpg",
+        file_hash="sync-0",
+        timestamp=datetime(2023, 3, 3, 9, 0, 0),
+        file_size=2048,
+        format="jpg",
+        collection_id=collection.id,
+    )
+    photo.metadata_ = PhotoMetadata(latitude=1.5, longitude=2.5, altitude=30.0)
+    db_session.add(photo)
+    await db_session.flush()
+
+    assert (photo.latitude, photo.longitude, photo.altitude) == (1.5, 2.5, 30.0)
+
+    photo.metadata_.latitude = 3.5
+    await db_session.flush()
+    await db_session.refresh(photo)
+
+    assert photo.latitude == 3.5
@@ -0,0 +1,153 @@
+"""Unit tests for the in-process service cache."""
+import asyncio
+from datetime import datetime
+from unittest.mock import patch
+
+import pytest
+
+from src.models.collection import Collection
+from src.models.photo import Photo, PhotoMetadata
+from src.services.bulk_service import BulkService
+from src.services.cache import ServiceCache, cache_stats
+from src.services.collection_manager import CollectionManager
+from src.services.generation import bump_generation, collection_scope, get_generation
+from src.services.location_service import LocationService
+
+
+def _loader(value, calls):
+    async def load():
+        calls.append(value)
+        await asyncio.sleep(0)
+        return value
+
+    return load
+
+
+@pytest.mark.asyncio
+async def test_hits_until_generation_changes():
+    """Entries are served until their data generation moves on."""
+    cache = ServiceCache("test", maxsize=8, ttl_seconds=60)
+    calls = []
+
+    assert await cache.get_or_load("key", 1, _loader("a", calls)) == "a"
+    assert await cache.get_or_load("key", 1, _loader("b", calls)) == "a"
+    assert await cache.get_or_load("key", 2, _loader("c", calls)) == "c"
+
+    assert calls == ["a", "c"]
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["invalidations"]) == (1, 2, 1)
+
+
+@pytest.mark.asyncio
+async def test_ttl_and_lru_eviction():
+    """Expired entries are reloaded and the least recently used one is evicted."""
+    cache = ServiceCache("test", maxsize=2, ttl_seconds=10)
+    calls = []
+
+    with patch("src.services.cache.time.monotonic", return_value=100.0):
+        await cache.get_or_load("a", 1, _loader("a", calls))
+        await cache.get_or_load("b", 1, _loader("b", calls))
+        await cache.get_or_load("a", 1, _loader("a", calls))
+        await cache.get_or_load("c", 1, _loader("c", calls))
+    assert calls == ["a", "b", "c"]
+
+    with patch("src.services.cache.time.monotonic", return_value=111.0):
+        await cache.get_or_load("a", 1, _loader("a", calls))
+    assert calls == ["a", "b", "c", "a"]
+
+    stats = cache.stats()
+    assert (stats["size"], stats["evictions"], stats["expirations"]) == (2, 1, 1)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_share_one_load():
+    """Lookups racing on a missing key wait for the first load."""
+    cache = ServiceCache("test", maxsize=8, ttl_seconds=60)
+    calls = []
+
+    results = await asyncio.gather(*(cache.get_or_load("key", 1, _loader(i, calls)) for i in range(5)))
+
+    assert results == [0] * 5
+    assert calls == [0]
+
+
+@pytest.mark.asyncio
+async def test_errors_are_not_cached():
+    """A failed load raises for every waiter and is retried next time."""
+    cache = ServiceCache("test", maxsize=8, ttl_seconds=60)
+
+    async def fail():
+        await asyncio.sleep(0)
+        raise LookupError("gone")
+
+    results = await asyncio.gather(
+        cache.get_or_load("key", 1, fail), cache.get_or_load("key", 1, fail), return_exceptions=True
+    )
+    assert all(isinstance(result, LookupError) for result in results)
+    assert await cache.get_or_load("key", 1, _loader("ok", [])) == "ok"
+
+
+@pytest.mark.asyncio
+async def test_cached_service_method_invalidated_by_bump(db_session):
+    """Collection reads are cached until the collection's generation is bumped."""
+    collection = Collection(name="Cached Collection")
+    db_session.add(collection)
+    await db_session.commit()
+    manager = CollectionManager(db_session)
+
+    first = await manager.read_collection(collection.id)
+    collection.name = "Renamed Collection"
+    await db_session.commit()
+    assert (await manager.read_collection(collection.id))["name"] == first["name"] == "Cached Collection"
+
+    await bump_generation(db_session, collection.id)
+    await db_session.commit()
+    assert (await manager.read_collection(collection.id))["name"] == "Renamed Collection"
+
+    stats = cache_stats()["collections"]
+    assert stats["hits"] >= 1
+    assert stats["invalidations"] >= 1
+
+
+@pytest.mark.asyncio
+async def test_bump_upserts_new_scopes(db_session):
+    """The first bump of a scope inserts its row; later bumps increment it."""
+    scope = collection_scope("never-bumped")
+    global_before = await get_generation(db_session)
+
+    await bump_generation(db_session, "never-bumped")
+    await bump_generation(db_session, "never-bumped")
+    await db_session.commit()
+
+    assert await get_generation(db_session, scope) == 2
+    assert await get_generation(db_session) == global_before + 2
+
+
+@pytest.mark.asyncio
+async def test_cached_markers_follow_bulk_deletes(db_session):
+    """Deleting photos reclusters the markers, so the cache never serves the old ones."""
+    collection = Collection(name="Cached Markers")
+    db_session.add(collection)
+    await db_session.flush()
+    for i in range(3):
+        photo = Photo(
+            filename=f"marker-{i}.jpg",
+            file_path=f"/tmp/markers/{collection.id}/{i}.jpg",
+            file_hash=f"markers-{collection.id}-{i}",
+            timestamp=datetime(2023, 7, 1, 10, i),
+            file_size=1024,
+            format="jpg",
+            collection_id=collection.id,
+        )
+        photo.metadata_ = PhotoMetadata(latitude=-45.0, longitude=-170.0 + i)
+        db_session.add(photo)
+    await db_session.commit()
+    service = LocationService(db_session)
+    await service.regenerate_markers()
+
+    def at_collection(markers):
+        return [m for m in markers if m["location"]["latitude"] == -45.0]
+
+    assert len(at_collection(await service.get_all_markers())) == 3
+    await BulkService(db_session).delete_collection(collection.id)
+    assert at_collection(await service.get_all_markers()) == []
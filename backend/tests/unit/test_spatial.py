@@ -0,0 +1,66 @@
+"""Unit tests for dialect-aware spatial predicates."""
+from sqlalchemy import create_engine, create_mock_engine, select
+from sqlalchemy.dialects import postgresql
+
+from src.db.spatial import LOCATION_BOUNDS_INDEX, LOCATION_INDEX, bounds_clause, nearest_order, radius_clause
+from src.models.base import Base
+from src.models.photo import Photo
+
+POSTGRES = postgresql.dialect()
+
+
+def compile_sql(query, dialect) -> str:
+    return str(query.compile(dialect=dialect, compile_kwargs={"literal_binds": True}))
+
+
+def test_postgres_uses_postgis_operators():
+    """On PostgreSQL the predicates go through the GiST-indexed geography column."""
+    query = (
+        select(Photo.id)
+        .where(bounds_clause(44.0, -123.0, 45.0, -122.0), radius_clause(44.5, -122.5, 250.0))
+        .order_by(nearest_order(44.5, -122.5))
+    )
+    sql = compile_sql(query, POSTGRES)
+
+    # Bounds are planar lat/lon boxes, so the envelope is geometry, not geography
+    assert "photos.location::geometry && ST_MakeEnvelope(-123.0, 44.0, -122.0, 45.0, 4326) AND" in sql
+    assert "ST_DWithin(photos.location, ST_SetSRID(ST_MakePoint(-122.5, 44.5), 4326)::geography, 250.0)" in sql
+    assert "ORDER BY (photos.location <-> ST_SetSRID(ST_MakePoint(-122.5, 44.5), 4326)::geography)" in sql
+
+
+def test_sqlite_uses_plain_comparisons():
+    """Elsewhere the predicates are plain comparisons over latitude/longitude."""
+    query = select(Photo.id).where(bounds_clause(44.0, -123.0, 45.0, -122.0))
+    sql = compile_sql(query, create_engine("sqlite://").dialect)
+
+    assert "location" not in sql
+    assert "photos.latitude >= 44.0 AND photos.latitude <= 45.0" in sql
+    assert not sql.rstrip().endswith("= 1")
+
+
+def test_predicates_are_cache_safe():
+    """Different values reuse one cache key but bind their own parameters."""
+    first, second = radius_clause(10.0, 20.0, 100.0), radius_clause(-30.0, 40.0, 5.0)
+
+    assert first._generate_cache_key().key == second._generate_cache_key().key
+    assert [p.value for p in second._generate_cache_key().bindparams][:3] == [-30.0, 40.0, 5.0]
+
+
+def test_create_all_adds_postgis_column_on_postgres_only():
+    """The geography column and its GiST index follow the photos table on PostgreSQL."""
+    for url, expected in (("postgresql://", True), ("sqlite://", False)):
+        statements = []
+
+        def record(sql, *args, **kw):
+            statements.append(str(sql.compile(dialect=engine.dialect)))
+
+        engine = create_mock_engine(url, record)
+        Base.metadata.create_all(engine, checkfirst=False)
+        ddl = "\n".join(statements)
+
+        assert ("geography(Point, 4326)" in ddl) is expected
+        assert (f"CREATE INDEX IF NOT EXISTS {LOCATION_INDEX} ON photos USING GIST" in ddl) is expected
+        assert (f"{LOCATION_BOUNDS_INDEX} ON photos USING GIST ((location::geometry))" in ddl) is expected
+        if expected:
+            photos = next(i for i, sql in enumerate(statements) if "CREATE TABLE photos" in sql)
+            assert statements.index("CREATE EXTENSION IF NOT EXISTS postgis") > photos
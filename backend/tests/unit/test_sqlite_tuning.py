@@ -0,0 +1,71 @@
+"""Unit tests for SQLite connection tuning."""
+import asyncio
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from src.config import Settings
+from src.db.sqlite import (
+    MATH_FUNCTIONS,
+    install_math_functions,
+    install_pragmas,
+    maintenance_loop,
+    run_maintenance,
+    sqlite_pragmas,
+)
+
+
+@pytest_asyncio.fixture
+async def tuned_engine(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'tuned.db'}")
+    install_pragmas(engine, sqlite_pragmas(Settings(SQLITE_CACHE_SIZE=-4096, SQLITE_BUSY_TIMEOUT_MS=1234)))
+    yield engine
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_pragmas_applied_on_connect(tuned_engine):
+    """Every new connection gets the configured profile."""
+    async with tuned_engine.connect() as conn:
+
+        async def pragma(name):
+            return (await conn.execute(text(f"PRAGMA {name}"))).scalar_one()
+
+        assert await pragma("journal_mode") == "wal"
+        assert await pragma("synchronous") == 1  # NORMAL
+        assert await pragma("cache_size") == -4096
+        assert await pragma("temp_store") == 2  # MEMORY
+        assert await pragma("busy_timeout") == 1234
+        assert await pragma("foreign_keys") == 1
+
+
+@pytest.mark.asyncio
+async def test_maintenance(tuned_engine):
+    """Maintenance runs against a live database and the loop stops on cancel."""
+    async with tuned_engine.begin() as conn:
+        await conn.execute(text("CREATE TABLE t (id INTEGER PRIMARY KEY)"))
+        await conn.execute(text("INSERT INTO t VALUES (1), (2)"))
+
+    await run_maintenance(tuned_engine)
+
+    task = asyncio.create_task(maintenance_loop(tuned_engine, 0.01))
+    await asyncio.sleep(0.05)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+
+def test_missing_math_functions_are_registered():
+    """SQLite builds without math functions get Python versions."""
+    import sqlite3
+    from unittest.mock import MagicMock
+
+    connection = MagicMock()
+    connection.cursor.return_value.execute.side_effect = sqlite3.OperationalError("no such function")
+    install_math_functions(connection)
+
+    registered = {call.args[0]: call.args[2] for call in connection.create_function.call_args_list}
+    assert registered.keys() == MATH_FUNCTIONS.keys()
+    assert registered["power"](2, 10) == 1024
@@ -1,6 +1,6 @@
 import { useState, useCallback } from 'react';
 import { Photo } from '../types';
-import { post } from '../services/api';
+import { post, PaginatedResponse } from '../services/api';
 
 export interface Bounds {
   north: number;
@@ -63,11 +63,20 @@ export const useFilters = () => {
         bounds: filters.bounds,
       };
       
-      const response = await post<Photo[]>('/photos/filter', payload);
-      if (response.success && response.data) {
-        setFilteredPhotos(response.data);
-        setHasFiltered(true);
-      }
+      // Results are paginated; follow the cursor until every match is loaded
+      const photos: Photo[] = [];
+      let cursor: string | null = null;
+      do {
+        const response = (await post<Photo[]>('/photos/filter', { ...payload, cursor })) as PaginatedResponse<Photo>;
+        if (!response.success || !response.data) {
+          return;
+        }
+        photos.push(...response.data);
+        cursor = response.next_cursor ?? null;
+      } while (cursor);
+
+      setFilteredPhotos(photos);
+      setHasFiltered(true);
     } catch (error) {
       console.error('Failed to filter photos:', error);
     } finally {
@@ -12,6 +12,18 @@ export interface APIResponse<T = unknown> {
   message?: string;
 }
 
+/**
+ * Paginated list response; pass ``next_cursor`` back as ``cursor`` for the
+ * next page (null on the last page)
+ */
+export interface PaginatedResponse<T = unknown> extends APIResponse<T[]> {
+  total: number;
+  page: number | null;
+  page_size: number;
+  total_pages: number;
+  next_cursor: string | null;
+}
+
 /**
  * Create axios instance with base configuration
  */
@@ -38,7 +38,8 @@ describe('Filter Workflow', () => {
       success: true, 
       data: [
         { id: '1', filename: 'photo1.jpg', metadata_: { latitude: 45, longitude: -122 } }
-      ] 
+      ],
+      next_cursor: null,
     });
 
     render(
@@ -65,4 +66,33 @@ describe('Filter Workflow', () => {
       }));
     });
   });
+
+  it('loads every page of filtered photos', async () => {
+    (api.get as any).mockResolvedValue({ data: [] });
+    const pages: Record<string, object> = {
+      first: { success: true, data: [{ id: '1', filename: 'photo1.jpg' }], next_cursor: 'page-2' },
+      'page-2': { success: true, data: [{ id: '2', filename: 'photo2.jpg' }], next_cursor: null },
+    };
+    (api.post as any).mockReset();
+    (api.post as any).mockImplementation(async (url: string, payload: { cursor?: string | null }) =>
+      url === '/photos/filter' ? pages[payload.cursor ?? 'first'] : { success: true, data: {} }
+    );
+
+    render(
+      <QueryClientProvider client={queryClient}>
+        <Dashboard />
+      </QueryClientProvider>
+    );
+
+    fireEvent.click(screen.getByText('Apply Filters'));
+
+    await waitFor(() => {
+      expect(api.post).toHaveBeenCalledWith('/photos/filter', expect.objectContaining({ cursor: 'page-2' }));
+    });
+    const filterCalls = (api.post as any).mock.calls.filter(([url]: [string]) => url === '/photos/filter');
+    expect(filterCalls.map(([, payload]: [string, { cursor: string | null }]) => payload.cursor)).toEqual([
+      null,
+      'page-2',
+    ]);
+  });
 });